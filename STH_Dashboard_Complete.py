@@ -9,6 +9,10 @@ import pandas as pd
 import plotly.express as px
 import numpy as np
 from pathlib import Path
+from sth_data import (load_district_table, generate_synthetic_districts, synthetic_shape,
+                      compact_district_frame)
+from sth_instrument import instrument, track_cache, plotly_chart, render_diagnostics_panel
+from sth_profile import profiled, stage
 
 # Page config
 st.set_page_config(
@@ -17,29 +21,37 @@ st.set_page_config(
     layout="wide"
 )
 
-# Load dummy data
+@stage('aggregate')
+def summarise_states(districts):
+    """Collapse the district table into the state-level frame this dashboard plots"""
+    aggregations = {
+        'Ascaris_Prevalence': ('Prevalence_Ascaris', 'mean'),
+        'Trichuris_Prevalence': ('Prevalence_Trichuris', 'mean'),
+        'Hookworm_Prevalence': ('Prevalence_Hookworm', 'mean'),
+        'Population': ('Total_Population', 'sum')
+    }
+    if 'Sanitation_Index' in districts:
+        aggregations['Sanitation_Index'] = ('Sanitation_Index', 'mean')
+    return districts.groupby('State', observed=True).agg(**aggregations).reset_index()
+
+# Load data (shared Parquet cache of the workbook, dummy data as fallback)
+@instrument
 @st.cache_data
+@track_cache
 def load_data():
-    np.random.seed(42)
-    states = ['Maharashtra', 'Uttar Pradesh', 'Bihar', 'West Bengal', 'Madhya Pradesh',
-             'Tamil Nadu', 'Rajasthan', 'Karnataka', 'Gujarat', 'Odisha']
-
-    data = []
-    for state in states:
-        data.append({
-            'State': state,
-            'Ascaris_Prevalence': np.clip(np.random.uniform(20, 60), 0, 100),
-            'Trichuris_Prevalence': np.clip(np.random.uniform(15, 45), 0, 100),
-            'Hookworm_Prevalence': np.clip(np.random.uniform(10, 40), 0, 100),
-            'Population': np.random.randint(100000, 1000000),
-            'Sanitation_Index': np.random.uniform(0.3, 0.9)
-        })
-    return pd.DataFrame(data)
-
-def render_epidemiology(data):
-    """Render epidemiology section with interactive visualizations"""
-    st.title("📊 Epidemiology & Global Burden")
-
+    try:
+        districts = load_district_table(Path("Visual_Assets_Indian_Context/Indian_STH_Data.xlsx"))
+        return summarise_states(districts)
+    except Exception:
+        pass
+
+    districts = compact_district_frame(generate_synthetic_districts(**synthetic_shape(10, 10), seed=42))
+    return summarise_states(districts)
+
+@st.fragment
+@instrument
+def render_epidemiology_charts(data):
+    """Filters and chart; runs as a fragment so widget changes rerun only this block"""
     # Interactive filters
     col1, col2, col3 = st.columns(3)
 
@@ -76,7 +88,14 @@ def render_epidemiology(data):
                      x='State', y=selected_parasites,
                      title='Parasite Prevalence by State',
                      barmode='group', width=800, height=500)
-        st.plotly_chart(fig, use_container_width=True)
+        plotly_chart(fig, use_container_width=True)
+
+@instrument
+def render_epidemiology(data):
+    """Render epidemiology section with interactive visualizations"""
+    st.title("📊 Epidemiology & Global Burden")
+
+    render_epidemiology_charts(data)
 
     # Key epidemiological facts
     st.subheader("📋 Key Epidemiological Facts")
@@ -112,6 +131,7 @@ def render_epidemiology(data):
         - Tropical climate conditions
         """)
 
+@instrument
 def render_etiology():
     """Render parasite information and life cycles"""
     st.title("🦠 Etiology & Life Cycles")
@@ -252,6 +272,7 @@ def render_etiology():
 
     st.dataframe(comparison_data.set_index('Feature'), use_container_width=True)
 
+@instrument
 def render_clinical():
     """Render clinical manifestations section"""
     st.title("🏥 Clinical Manifestations")
@@ -350,6 +371,7 @@ def render_clinical():
         - Impaired nutritional status leading to other diseases
         """)
 
+@instrument
 def render_diagnosis():
     """Render diagnosis section with laboratory methods"""
     st.title("🔬 Diagnosis Methods")
@@ -498,6 +520,7 @@ def render_diagnosis():
         - Public health implications and follow-up recommendations
         """)
 
+@instrument
 def render_treatment():
     """Render treatment and management section"""
     st.title("💊 Treatment & Management")
@@ -529,7 +552,7 @@ def render_treatment():
                     title='Cure Rates by Parasite and Drug (%)',
                     labels={'value': 'Cure Rate (%)', 'variable': 'Parasite'})
         fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        plotly_chart(fig, use_container_width=True)
 
     st.markdown("---")
 
@@ -640,6 +663,7 @@ def render_treatment():
         - Sustainable environmental improvements
         """)
 
+@instrument
 def render_references():
     """Render references section"""
     st.title("📚 References & Additional Resources")
@@ -681,6 +705,7 @@ def render_references():
         - **Ministry of Jal Shakti** - Clean Water Initiatives
         """)
 
+@instrument
 def render_prevention_control():
     """Special emphasis on prevention and control"""
     st.title("🛡️ Prevention & Control Strategies")
@@ -770,8 +795,9 @@ def render_prevention_control():
                   title='National Deworming Program Coverage (2015-2022)',
                   markers=True)
     fig.update_layout(yaxis_title='Coverage (%)')
-    st.plotly_chart(fig, use_container_width=True)
+    plotly_chart(fig, use_container_width=True)
 
+@instrument
 def render_indian_context(data):
     """Indian context section"""
     st.title("🇮🇳 Indian Context")
@@ -789,7 +815,7 @@ def render_indian_context(data):
                  title='Parasite Prevalence by State (%)',
                  barmode='group')
     fig.update_layout(xaxis_tickangle=-45)
-    st.plotly_chart(fig, use_container_width=True)
+    plotly_chart(fig, use_container_width=True)
 
     # Key Indian facts
     st.subheader("🎯 Key Indian Facts")
@@ -825,6 +851,33 @@ def render_indian_context(data):
 
     st.dataframe(challenges, use_container_width=True)
 
+@st.fragment
+@instrument
+def render_quiz_question(i, q):
+    """One quiz question; runs as a fragment so answering reruns only this question"""
+    st.subheader(f"Question {i+1}: {q['question']}")
+
+    key = f"q_{i}"
+    answer = st.radio(
+        f"Select your answer:",
+        q['options'],
+        key=key,
+        index=None
+    )
+
+    if answer is not None:
+        if q['options'].index(answer) == q['correct']:
+            st.success(f"✅ Correct! {q['explanation']}")
+            if not st.session_state.quiz_answers.get(key, False):
+                st.session_state.quiz_score += 1
+            st.session_state.quiz_answers[key] = True
+        else:
+            st.error(f"❌ Incorrect. Correct answer: {q['options'][q['correct']]}")
+            st.info(q['explanation'])
+    else:
+        st.info("Please select an answer to continue.")
+
+@instrument
 def render_quiz():
     """Interactive assessment quiz"""
     st.title("📝 Assessment Quiz")
@@ -866,27 +919,7 @@ def render_quiz():
     total_questions = len(questions)
 
     for i, q in enumerate(questions):
-        st.subheader(f"Question {i+1}: {q['question']}")
-
-        key = f"q_{i}"
-        answer = st.radio(
-            f"Select your answer:",
-            q['options'],
-            key=key,
-            index=None
-        )
-
-        if answer is not None:
-            if q['options'].index(answer) == q['correct']:
-                st.success(f"✅ Correct! {q['explanation']}")
-                if not st.session_state.quiz_answers.get(key, False):
-                    st.session_state.quiz_score += 1
-                st.session_state.quiz_answers[key] = True
-            else:
-                st.error(f"❌ Incorrect. Correct answer: {q['options'][q['correct']]}")
-                st.info(q['explanation'])
-        else:
-            st.info("Please select an answer to continue.")
+        render_quiz_question(i, q)
 
     # Show final score
     if st.button("Get Final Score", type="primary"):
@@ -908,9 +941,11 @@ def render_quiz():
             else:
                 st.warning("📚 Review materials and try again!")
 
+@profiled('complete_dashboard', default_stage='render', per_session=True)  # STH_PROFILE=1: one profile per browser session
 def main():
     """Main dashboard application"""
-    data = load_data()
+    with stage('load'):
+        data = load_data()
 
     # Sidebar navigation
     with st.sidebar:
@@ -987,5 +1022,9 @@ def main():
     st.markdown("---")
     st.markdown("*Dashboard developed for comprehensive STH medical education*")
 
+    # Opt-in timings panel (STH_INSTRUMENT=1), drawn after the page so this run is included
+    with st.sidebar:
+        render_diagnostics_panel()
+
 if __name__ == "__main__":
     main()
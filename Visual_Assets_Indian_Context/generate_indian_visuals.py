@@ -6,12 +6,105 @@ Generates charts, graphs, and infographics specific to Indian STH epidemiology
 
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import seaborn as sns
 import numpy as np
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import argparse
+import hashlib
+import inspect
+import io
+import json
+import os
+import pickle
+import re
+import sys
+import threading
+import time
 import warnings
+from PIL import Image
+try:
+    import resource
+except ImportError:  # Not available on Windows; peak memory is then reported as None
+    resource = None
 warnings.filterwarnings('ignore')
 
+# Shared data-access helpers live at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from sth_data import (load_district_table, generate_synthetic_districts, synthetic_shape,
+                      compact_district_frame, RISK_CATEGORIES)
+from sth_cube import PrevalenceCube
+from sth_profile import profiled, stage, add_profile_argument, enable_profiling
+
+PARASITE_COLUMNS = ['Prevalence_Ascaris', 'Prevalence_Trichuris', 'Prevalence_Hookworm']
+
+# Chart methods in presentation order: (method, output file, data slices it
+# reads, progress message, approximate single-core render seconds at 300 dpi,
+# used to start the slowest charts first)
+CHARTS = [
+    ('create_state_prevalence_map', 'Statewise_STH_Prevalence.png', ('state_data',),
+     "State prevalence map created", 1.1),
+    ('create_parasite_comparison_chart', 'Parasite_Prevalence_Comparison.png', ('district_prevalence',),
+     "Parasite comparison chart created", 0.6),
+    ('create_risk_category_pie_chart', 'Risk_Category_Distribution.png', ('risk_counts',),
+     "Risk category pie chart created", 0.4),
+    ('create_regional_heatmap', 'Regional_Prevalence_Heatmap.png', ('state_means',),
+     "Regional heatmap created", 0.9),
+    ('create_indian_healthcare_integration_chart', 'Healthcare_Integration.png', ('healthcare_integration',),
+     "Healthcare integration chart created", 0.5),
+    ('create_national_deworming_progress', 'Deworming_Progress.png', ('deworming_progress',),
+     "Deworming progress chart created", 0.5),
+    ('create_indian_sth_dashboard', 'STH_India_Dashboard.png',
+     ('state_data', 'risk_counts', 'district_prevalence', 'district_population'),
+     "Comprehensive dashboard created", 1.5),
+]
+
+# Programme figures shown by the healthcare and deworming charts (illustrative;
+# the presentation's native charts reuse them)
+HEALTHCARE_INTEGRATION = {
+    'National Health Mission': 95, 'Swachh Bharat Mission': 87, 'ICDS': 78,
+    'School Health Program': 92, 'RBSK': 85, 'ASHA Workers': 88,
+}
+DEWORMING_YEARS = list(range(2015, 2026))
+DEWORMING_COVERAGE = [0, 15, 35, 55, 68, 72, 78, 82, 85, 88, 90]  # Percentage coverage
+DEWORMING_PREVALENCE = [45, 42, 38, 34, 30, 27, 24, 21, 19, 17, 15]  # Estimated prevalence
+
+# Output profiles: file variants written from each rendered chart. Raster
+# variants share one 300-dpi render; 'png' keeps the original file layout,
+# the others are written to a subdirectory named after the profile
+OUTPUT_PROFILES = {
+    'png': ['.png'],            # 300-dpi PNG in Generated_Charts/ (original output)
+    'print': ['.svg', '.pdf'],  # Vector copies for print
+    'slides': ['.png'],         # 256-colour palette PNG for slide decks
+    'web': ['.webp'],           # WebP at most WEB_MAX_WIDTH pixels wide
+}
+DEFAULT_PROFILES = ('png',)
+WEB_MAX_WIDTH = 1600
+WEB_QUALITY = 80
+
+# Bounded-memory rendering: RGBA canvases held at once while saving a raster
+# (Agg canvas plus the copy made for PNG encoding), the lowest DPI a budget
+# may force, and the district count above which the dashboard scatter is
+# drawn as a fixed-size density image
+RASTER_COPIES = 2
+MIN_BUDGET_DPI = 72
+DENSE_SCATTER_POINTS = 5000
+DENSITY_BINS = (160, 100)
+
+# Panels of the per-state / per-district chart packs
+PACK_PREVALENCE_COLUMNS = PARASITE_COLUMNS + ['Prevalence_Children']
+PACK_COVERAGE_COLUMNS = ['Treatment_Coverage', 'Sanitation_Index']
+PACK_DIR_NAME = 'state_packs'
+
+# Records, per output file, the data/code/style hashes it was last rendered from
+MANIFEST_NAME = '.build_manifest.json'
+
+# Methods every chart's output depends on besides its own create_* method;
+# editing one invalidates all charts in the manifest
+CHART_HELPERS = ('_save_chart', '_raster_dpi', '_variant_paths', '_reusable_dashboard_axes')
+
 # Set Indian-themed color palette
 INDIAN_COLORS = ['#FF9933', '#FFFFFF', '#138808', '#000080', '#FF0000']
 sns.set_palette(INDIAN_COLORS)
@@ -21,34 +114,50 @@ plt.rcParams['font.family'] = ['Arial', 'sans-serif']
 plt.rcParams['axes.titlesize'] = 14
 plt.rcParams['axes.labelsize'] = 12
 
+# Anything that changes every chart's look without touching its code
+STYLE_SETTINGS = {
+    'palette': INDIAN_COLORS,
+    'rcParams': {key: plt.rcParams[key] for key in ('font.family', 'axes.titlesize', 'axes.labelsize')},
+    'matplotlib': plt.matplotlib.__version__,
+    'output': {'web_max_width': WEB_MAX_WIDTH, 'web_quality': WEB_QUALITY, 'raster_copies': RASTER_COPIES,
+               'min_budget_dpi': MIN_BUDGET_DPI, 'dense_scatter_points': DENSE_SCATTER_POINTS,
+               'density_bins': DENSITY_BINS},
+}
+
 class IndianSTHVisualizer:
-    def __init__(self, data_path, output_dir):
+    def __init__(self, data_path, output_dir, profiles=DEFAULT_PROFILES, dpi=300,
+                 memory_budget_mb=None):
         self.data_path = Path(data_path)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Load data
-        try:
-            self.df = pd.read_excel(data_path, engine='openpyxl')
-        except:
+        unknown = set(profiles) - set(OUTPUT_PROFILES)
+        if unknown:
+            raise ValueError(f"Unknown output profiles: {sorted(unknown)}")
+        self.profiles = tuple(profiles)
+        self.dpi = dpi
+        self.memory_budget_mb = memory_budget_mb
+        self._dashboard_figure = None  # Reused figure and axes in bounded-memory mode
+
+        # Load data (through the shared Parquet cache of the workbook)
+        with stage('load'):
             try:
-                self.df = pd.read_excel(data_path, engine='xlrd')
+                self.df = load_district_table(self.data_path)
             except:
                 print("Excel file could not be read, generating visualizations with dummy data...")
                 self.df = self._create_dummy_data()
+            self.df = compact_district_frame(self.df)
 
-        # Create state-wise aggregations
-        self.state_data = self._aggregate_state_data()
+        # Create state-wise aggregations from the pre-aggregated cube
+        with stage('aggregate'):
+            self.cube = PrevalenceCube.from_frame(self.df)
+            self.state_data = self._aggregate_state_data()
 
     def _aggregate_state_data(self):
         """Aggregate data by state for visualization"""
-        state_agg = self.df.groupby('State').agg({
-            'Prevalence_Ascaris': 'mean',
-            'Prevalence_Trichuris': 'mean',
-            'Prevalence_Hookworm': 'mean',
-            'Total_Population': 'sum',
-            'Children_1_14': 'sum'
-        }).reset_index()
+        state_agg = self.cube.state_means(PARASITE_COLUMNS).join(
+            self.cube.state_totals(['Total_Population', 'Children_1_14'])
+        ).reset_index()
 
         # Calculate overall prevalence
         state_agg['Overall_Prevalence'] = (
@@ -59,34 +168,130 @@ class IndianSTHVisualizer:
 
         return state_agg
 
+    def _variant_paths(self, output_name):
+        """Every file the configured profiles write for one chart"""
+        stem = Path(output_name).stem
+        paths = []
+        for profile in self.profiles:
+            directory = self.output_dir if profile == 'png' else self.output_dir / profile
+            paths.extend(directory / f"{stem}{suffix}" for suffix in OUTPUT_PROFILES[profile])
+        return paths
+
+    def __getstate__(self):
+        # Worker snapshots carry data only, never a cached figure
+        state = self.__dict__.copy()
+        state['_dashboard_figure'] = None
+        return state
+
+    def _raster_dpi(self, fig):
+        """self.dpi, capped so the raster canvases of this figure fit memory_budget_mb"""
+        if self.memory_budget_mb is None:
+            return self.dpi
+        width, height = fig.get_size_inches()
+        budget_bytes = self.memory_budget_mb * 2**20 / RASTER_COPIES
+        budget_dpi = int((budget_bytes / (width * height * 4)) ** 0.5)
+        return max(MIN_BUDGET_DPI, min(self.dpi, budget_dpi))
+
+    def _save_chart(self, fig, output_name):
+        """Write the configured output profiles for a figure, then close it
+
+        Matplotlib renders the raster once (at self.dpi, or lower when a memory
+        budget is set); the quantized PNG and
+        the WebP are derived from that image with Pillow. SVG and PDF are
+        written through matplotlib's vector backends.
+        """
+        stem = Path(output_name).stem
+        raster = None
+        if set(self.profiles) & {'png', 'slides', 'web'}:
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format='png', dpi=self._raster_dpi(fig), bbox_inches='tight')
+            raster = buffer.getvalue()
+
+        # Rasterizing above is profiled as render; file writes and encodes as save
+        with stage('save'):
+            if 'png' in self.profiles:
+                (self.output_dir / output_name).write_bytes(raster)
+
+            if 'print' in self.profiles:
+                print_dir = self.output_dir / 'print'
+                print_dir.mkdir(exist_ok=True)
+                for suffix in OUTPUT_PROFILES['print']:
+                    fig.savefig(print_dir / f"{stem}{suffix}", bbox_inches='tight')
+
+            if 'slides' in self.profiles or 'web' in self.profiles:
+                image = Image.open(io.BytesIO(raster)).convert('RGB')
+
+                if 'slides' in self.profiles:
+                    (self.output_dir / 'slides').mkdir(exist_ok=True)
+                    image.quantize(colors=256, dither=Image.Dither.NONE).save(
+                        self.output_dir / 'slides' / f"{stem}.png", optimize=True)
+
+                if 'web' in self.profiles:
+                    (self.output_dir / 'web').mkdir(exist_ok=True)
+                    if image.width > WEB_MAX_WIDTH:
+                        height = round(image.height * WEB_MAX_WIDTH / image.width)
+                        image = image.resize((WEB_MAX_WIDTH, height), Image.Resampling.LANCZOS)
+                    image.save(self.output_dir / 'web' / f"{stem}.webp", quality=WEB_QUALITY, method=6)
+
+        plt.close(fig)
+
+    def _data_slice(self, name):
+        """The part of the loaded data a chart reads, as named in CHARTS"""
+        if name == 'state_data':
+            return self.state_data
+        if name == 'district_prevalence':
+            return self.df[PARASITE_COLUMNS]
+        if name == 'district_population':
+            return self.df[['Total_Population', 'Prevalence_Children']]
+        if name == 'risk_counts':
+            return self.cube.risk_counts()
+        if name == 'state_means':
+            return self.cube.state_means(PARASITE_COLUMNS)
+        if name == 'healthcare_integration':
+            return pd.Series(HEALTHCARE_INTEGRATION, name='Integration_Level')
+        if name == 'deworming_progress':
+            return pd.DataFrame({'Coverage': DEWORMING_COVERAGE, 'Prevalence': DEWORMING_PREVALENCE},
+                                index=DEWORMING_YEARS)
+        raise KeyError(f"Unknown data slice: {name}")
+
+    def _chart_hashes(self, method_name, inputs):
+        """Data, code and style hashes that determine one chart's output"""
+        data = hashlib.sha256()
+        for name in inputs:
+            frame = self._data_slice(name)
+            if isinstance(frame, pd.Series):
+                frame = frame.to_frame()
+            data.update(repr(list(frame.columns)).encode('utf-8'))
+            data.update(pd.util.hash_pandas_object(frame).values.tobytes())
+        code = ''.join(inspect.getsource(getattr(type(self), name))
+                       for name in (method_name, *CHART_HELPERS))
+        return {
+            'profiles': sorted(self.profiles),
+            'dpi': self.dpi,
+            'memory_budget_mb': self.memory_budget_mb,
+            'data': data.hexdigest(),
+            'code': hashlib.sha256(code.encode('utf-8')).hexdigest(),
+            'style': hashlib.sha256(json.dumps(STYLE_SETTINGS, sort_keys=True).encode('utf-8')).hexdigest(),
+        }
+
+    def _read_manifest(self):
+        try:
+            with open(self.output_dir / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_manifest(self, manifest):
+        manifest_path = self.output_dir / MANIFEST_NAME
+        tmp_path = manifest_path.with_name(f'{manifest_path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, manifest_path)
+
     def _create_dummy_data(self):
         """Create dummy data for visualization when Excel file is not available"""
-        np.random.seed(42)  # For reproducible results
-
-        # Create dummy districts data
-        states = ['Maharashtra', 'Uttar Pradesh', 'Bihar', 'West Bengal', 'Madhya Pradesh',
-                 'Tamil Nadu', 'Rajasthan', 'Karnataka', 'Gujarat', 'Odisha',
-                 'Telangana', 'Punjab', 'Chhattisgarh', 'Haryana', 'Delhi']
-        risk_categories = ['High', 'Moderate', 'Low']
-
-        districts_data = []
-        for state in states:
-            for i in range(5):  # 5 districts per state
-                prevalence_base = np.random.uniform(10, 60)
-                district_data = {
-                    'State': state,
-                    'District': f'{state[:3]}_Dist{i+1}',
-                    'Prevalence_Ascaris': np.clip(prevalence_base + np.random.normal(0, 5), 0, 100),
-                    'Prevalence_Trichuris': np.clip(prevalence_base * 0.8 + np.random.normal(0, 3), 0, 100),
-                    'Prevalence_Hookworm': np.clip(prevalence_base * 0.9 + np.random.normal(0, 4), 0, 100),
-                    'Prevalence_Children': np.clip(prevalence_base + np.random.normal(0, 10), 0, 100),
-                    'Total_Population': int(np.random.uniform(500000, 5000000)),
-                    'Children_1_14': int(np.random.uniform(100000, 1000000)),
-                    'Risk_Category': np.random.choice(risk_categories, p=[0.3, 0.4, 0.3])
-                }
-                districts_data.append(district_data)
-
-        return pd.DataFrame(districts_data)
+        # 5 districts per state; seeded for reproducible results
+        return generate_synthetic_districts(**synthetic_shape(15, 5), seed=42)
 
     def create_state_prevalence_map(self):
         """Create state-wise prevalence visualization"""
@@ -113,9 +318,7 @@ class IndianSTHVisualizer:
             ax.text(v + 0.5, i, f'{v:.1f}%', va='center', fontsize=9)
 
         plt.tight_layout()
-        plt.savefig(self.output_dir / 'Statewise_STH_Prevalence.png',
-                    dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_chart(fig, 'Statewise_STH_Prevalence.png')
 
     def create_parasite_comparison_chart(self):
         """Create comparison chart for different parasites"""
@@ -147,16 +350,14 @@ class IndianSTHVisualizer:
             ax.axhline(y=mean, color=colors[i], linestyle='--', alpha=0.8, linewidth=2)
 
         plt.tight_layout()
-        plt.savefig(self.output_dir / 'Parasite_Prevalence_Comparison.png',
-                    dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_chart(fig, 'Parasite_Prevalence_Comparison.png')
 
     def create_risk_category_pie_chart(self):
         """Create pie chart showing risk categories"""
         fig, ax = plt.subplots(figsize=(10, 8))
 
         # Count districts by risk category
-        risk_counts = self.df['Risk_Category'].value_counts()
+        risk_counts = self.cube.risk_counts().sort_values(ascending=False)
 
         # Create pie chart
         wedges, texts, autotexts = ax.pie(risk_counts.values,
@@ -175,18 +376,14 @@ class IndianSTHVisualizer:
                  bbox_to_anchor=(1, 0, 0.5, 1))
 
         plt.tight_layout()
-        plt.savefig(self.output_dir / 'Risk_Category_Distribution.png',
-                    dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_chart(fig, 'Risk_Category_Distribution.png')
 
     def create_regional_heatmap(self):
         """Create a regional comparison heatmap"""
         fig, ax = plt.subplots(figsize=(14, 10))
 
-        # Group by state and calculate means
-        regional_data = self.state_data.groupby('State')[['Prevalence_Ascaris',
-                                                          'Prevalence_Trichuris',
-                                                          'Prevalence_Hookworm']].mean()
+        # State means per parasite, sliced from the cube
+        regional_data = self.cube.state_means(PARASITE_COLUMNS)
 
         # Create heatmap
         sns.heatmap(regional_data, annot=True, fmt='.1f', cmap='YlOrRd',
@@ -199,18 +396,15 @@ class IndianSTHVisualizer:
 
         plt.xticks(rotation=45)
         plt.tight_layout()
-        plt.savefig(self.output_dir / 'Regional_Prevalence_Heatmap.png',
-                    dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_chart(fig, 'Regional_Prevalence_Heatmap.png')
 
     def create_indian_healthcare_integration_chart(self):
         """Create chart showing integration with Indian healthcare system"""
         fig, ax = plt.subplots(figsize=(12, 8))
 
         # Sample data for healthcare integration
-        programs = ['National Health Mission', 'Swachh Bharat Mission',
-                   'ICDS', 'School Health Program', 'RBSK', 'ASHA Workers']
-        integration_levels = [95, 87, 78, 92, 85, 88]
+        programs = list(HEALTHCARE_INTEGRATION)
+        integration_levels = list(HEALTHCARE_INTEGRATION.values())
 
         bars = ax.bar(range(len(programs)), integration_levels,
                      color=['#FF9933', '#138808', '#000080', '#FF0000', '#800080', '#FFA500'])
@@ -228,18 +422,16 @@ class IndianSTHVisualizer:
                    f'{value}%', ha='center', va='bottom')
 
         plt.tight_layout()
-        plt.savefig(self.output_dir / 'Healthcare_Integration.png',
-                    dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_chart(fig, 'Healthcare_Integration.png')
 
     def create_national_deworming_progress(self):
         """Create chart showing national deworming program progress"""
         fig, ax = plt.subplots(figsize=(12, 6))
 
         # Simulated progress data (2015-2025)
-        years = list(range(2015, 2026))
-        coverage = [0, 15, 35, 55, 68, 72, 78, 82, 85, 88, 90]  # Percentage coverage
-        prevalence = [45, 42, 38, 34, 30, 27, 24, 21, 19, 17, 15]  # Estimated prevalence
+        years = DEWORMING_YEARS
+        coverage = DEWORMING_COVERAGE
+        prevalence = DEWORMING_PREVALENCE
 
         ax2 = ax.twinx()
 
@@ -261,13 +453,32 @@ class IndianSTHVisualizer:
 
         ax.grid(alpha=0.3)
         plt.tight_layout()
-        plt.savefig(self.output_dir / 'Deworming_Progress.png',
-                    dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_chart(fig, 'Deworming_Progress.png')
+
+    def _reusable_dashboard_axes(self):
+        """The dashboard figure and its 2x3 axes, created once and cleared for each render"""
+        if self._dashboard_figure is None:
+            fig = Figure(figsize=(18, 12))
+            FigureCanvasAgg(fig)
+            self._dashboard_figure = (fig, fig.subplots(2, 3))
+        fig, axes = self._dashboard_figure
+        for ax in axes.flat:
+            ax.clear()
+        return fig, axes
 
     def create_indian_sth_dashboard(self):
-        """Create a comprehensive dashboard visualization"""
-        fig, axes = plt.subplots(2, 3, figsize=(18, 12))
+        """Create a comprehensive dashboard visualization
+
+        With memory_budget_mb set, the figure and panel axes are reused
+        across renders, the raster DPI is capped to the budget, the scatter
+        is rasterized in vector output, and above DENSE_SCATTER_POINTS
+        districts it becomes a fixed-size population-weighted density image.
+        """
+        bounded = self.memory_budget_mb is not None
+        if bounded:
+            fig, axes = self._reusable_dashboard_axes()
+        else:
+            fig, axes = plt.subplots(2, 3, figsize=(18, 12))
         fig.suptitle('Soil Transmitted Diseases in India - Comprehensive Dashboard',
                     fontsize=16, fontweight='bold')
 
@@ -280,7 +491,7 @@ class IndianSTHVisualizer:
         axes[0,0].set_xlabel('Prevalence (%)')
 
         # Dashboard 2: Risk distribution
-        risk_counts = self.df['Risk_Category'].value_counts()
+        risk_counts = self.cube.risk_counts().sort_values(ascending=False)
         axes[0,1].pie(risk_counts.values, labels=risk_counts.index, autopct='%1.1f%%')
         axes[0,1].set_title('District Risk Distribution')
 
@@ -294,9 +505,17 @@ class IndianSTHVisualizer:
         axes[0,2].set_ylabel('Prevalence (%)')
 
         # Dashboard 4: Population vs Prevalence
-        axes[1,0].scatter(self.df['Total_Population']/1000000,
-                         self.df['Prevalence_Children'],
-                         alpha=0.6, s=self.df['Total_Population']/50000)
+        population = self.df['Total_Population']/1000000
+        if bounded and len(self.df) > DENSE_SCATTER_POINTS:
+            density, x_edges, y_edges = np.histogram2d(
+                population, self.df['Prevalence_Children'].fillna(0),
+                bins=DENSITY_BINS, weights=population)
+            axes[1,0].pcolormesh(x_edges, y_edges, np.ma.masked_equal(density.T, 0),
+                                 cmap='YlOrRd', rasterized=True)
+        else:
+            axes[1,0].scatter(population,
+                             self.df['Prevalence_Children'],
+                             alpha=0.6, s=self.df['Total_Population']/50000, rasterized=bounded)
         axes[1,0].set_xlabel('Population (Millions)')
         axes[1,0].set_ylabel('Children Prevalence (%)')
         axes[1,0].set_title('Population vs STH Prevalence')
@@ -318,82 +537,430 @@ class IndianSTHVisualizer:
         axes[1,2].set_ylabel('Prevalence (%)')
         axes[1,2].grid(True, alpha=0.3)
 
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'STH_India_Dashboard.png',
-                    dpi=300, bbox_inches='tight')
-        plt.close()
-
-    def generate_all_visuals(self):
-        """Generate all visual assets"""
+        fig.tight_layout()
+        self._save_chart(fig, 'STH_India_Dashboard.png')
+
+    def _timed_chart(self, method_name):
+        """Render one chart and return its wall time, CPU time and RSS before/peak"""
+        start_rss_mb = _reset_peak_rss()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        getattr(self, method_name)()
+        return {
+            'wall_s': round(time.perf_counter() - wall_start, 3),
+            'cpu_s': round(time.process_time() - cpu_start, 3),
+            'start_rss_mb': start_rss_mb,
+            'peak_rss_mb': _peak_rss_mb(),
+            'pid': os.getpid(),
+        }
+
+    def create_state_packs(self, states=None, include_districts=False, jobs=1, dpi=None):
+        """Render a prevalence, risk and coverage panel set for every state
+
+        Writes state_packs/<State>.png (state vs national means) and, with
+        include_districts, state_packs/<State>/<District>.png (district vs
+        state means, its risk category highlighted). Uses the latest survey
+        year; states without rows in it are skipped. Each process draws one
+        figure and only updates its data between charts; with jobs > 1 the
+        states are split across worker processes. dpi defaults to the
+        generator's raster resolution (--dpi).
+        """
+        dpi = self.dpi if dpi is None else dpi
+        states = list(states) if states is not None else self.cube.states()
+        (self.output_dir / PACK_DIR_NAME).mkdir(exist_ok=True)
+        print(f"Generating chart packs for {len(states)} states...")
+
+        if jobs > 1 and len(states) > 1:
+            snapshot = pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+            batches = [states[i::jobs] for i in range(min(jobs, len(states)))]
+            with ProcessPoolExecutor(max_workers=len(batches),
+                                     initializer=_init_worker, initargs=(snapshot,)) as pool:
+                written = sum(pool.map(_run_in_worker, ['_render_pack_batch'] * len(batches),
+                                       batches, [include_districts] * len(batches), [dpi] * len(batches)))
+        else:
+            written = self._render_pack_batch(states, include_districts, dpi)
+
+        print(f"✓ {written} chart packs saved to {self.output_dir / PACK_DIR_NAME}")
+        return written
+
+    def _render_pack_batch(self, states, include_districts, dpi):
+        """Render the packs for a list of states on one reused figure; returns the file count"""
+        latest = self.df[self.df['Year'] == self.df['Year'].max()] if 'Year' in self.df else self.df
+        prevalence_columns = [c for c in PACK_PREVALENCE_COLUMNS if c in latest]
+        coverage_columns = [c for c in PACK_COVERAGE_COLUMNS if c in latest]
+        columns = prevalence_columns + coverage_columns
+
+        state_means = latest.groupby('State', observed=True)[columns].mean()
+        national = latest[columns].mean()
+        risk = (latest.groupby(['State', 'Risk_Category'], observed=True).size()
+                .unstack(fill_value=0).reindex(columns=RISK_CATEGORIES, fill_value=0))
+
+        pack = _ChartPack(prevalence_columns, coverage_columns, int(risk.to_numpy().max()), dpi)
+        pack_dir = self.output_dir / PACK_DIR_NAME
+        written = 0
+        try:
+            for state in states:
+                if state not in state_means.index:
+                    print(f"⏭️  {state}: no rows in the latest year, chart pack skipped")
+                    continue
+                pack.update(state, f'{state}: STH Chart Pack', state_means.loc[state], national, 'India',
+                            risk.loc[state])
+                pack.save(pack_dir / f'{_slug(state)}.png')
+                written += 1
+
+                if include_districts:
+                    district_dir = pack_dir / _slug(state)
+                    district_dir.mkdir(exist_ok=True)
+                    for _, district in latest[latest['State'] == state].iterrows():
+                        pack.update(district['District'], f'{district["District"]}, {state}', district,
+                                    state_means.loc[state], state, risk.loc[state],
+                                    highlight=district['Risk_Category'])
+                        pack.save(district_dir / f'{_slug(district["District"])}.png')
+                        written += 1
+        finally:
+            pack.fig.clear()
+        return written
+
+    @profiled('generate_all_visuals', default_stage='render')
+    def generate_all_visuals(self, jobs=1, force=False, charts=None):
+        """Generate all visual assets (or the charts named in charts) and return a timing report
+
+        Charts whose output file exists and whose data slice, method and
+        CHART_HELPERS source and style settings hash the same as in the build
+        manifest are skipped; force=True re-renders everything.
+
+        With jobs > 1 the charts are rendered in a pool of worker processes
+        using the Agg backend. Each worker receives one pickled snapshot of
+        the loaded district table, cube and state aggregates, so the workbook
+        is read once in the parent and never by the workers.
+
+        The report has one entry per selected chart with its status
+        ('rendered' or 'skipped') and, for rendered charts, wall and CPU
+        seconds and the peak RSS of the process that drew it.
+
+        With STH_PROFILE set the call is profiled (see sth_profile); charts
+        rendered in worker processes are not included.
+        """
         print("Generating Indian STH visual assets...")
+        selected = select_charts(charts)
 
         try:
-            self.create_state_prevalence_map()
-            print("✓ State prevalence map created")
-
-            self.create_parasite_comparison_chart()
-            print("✓ Parasite comparison chart created")
-
-            self.create_risk_category_pie_chart()
-            print("✓ Risk category pie chart created")
-
-            self.create_regional_heatmap()
-            print("✓ Regional heatmap created")
-
-            self.create_indian_healthcare_integration_chart()
-            print("✓ Healthcare integration chart created")
-
-            self.create_national_deworming_progress()
-            print("✓ Deworming progress chart created")
-
-            self.create_indian_sth_dashboard()
-            print("✓ Comprehensive dashboard created")
+            manifest = self._read_manifest()
+            report = {}
+            stale = []
+            for chart in selected:
+                method_name, output_name, inputs, message, _ = chart
+                hashes = self._chart_hashes(method_name, inputs)
+                if (not force and manifest.get(output_name) == hashes
+                        and all(path.exists() for path in self._variant_paths(output_name))):
+                    print(f"⏭️  {message.replace(' created', '')} unchanged, skipped")
+                    report[output_name] = {'chart': chart_name(method_name), 'output': output_name,
+                                           'status': 'skipped'}
+                    continue
+                stale.append((chart, hashes))
+
+            def record(chart, hashes, timing):
+                method_name, output_name, _, message, _ = chart
+                manifest[output_name] = hashes
+                self._write_manifest(manifest)
+                report[output_name] = {'chart': chart_name(method_name), 'output': output_name,
+                                       'status': 'rendered', **timing}
+                print(f"✓ {message} ({timing['wall_s']:.2f}s)")
+
+            if jobs > 1 and len(stale) > 1:
+                self._render_parallel(stale, jobs, record)
+            else:
+                for chart, hashes in stale:
+                    record(chart, hashes, self._timed_chart(chart[0]))
 
             print(f"\n🎉 All visual assets generated successfully!")
             print(f"📁 Output directory: {self.output_dir}")
-            print(f"📊 Generated {len(list(self.output_dir.glob('*.png')))} chart files")
+            print(f"📊 Generated {len(stale)} of {len(selected)} chart files "
+                  f"({len(selected) - len(stale)} up to date)")
+
+            # Report in presentation order regardless of completion order
+            return [report[output_name] for _, output_name, _, _, _ in selected]
 
         except Exception as e:
             print(f"❌ Error generating visuals: {str(e)}")
             raise
 
+    def _render_parallel(self, stale, jobs, record):
+        """Render the stale charts across a process pool, slowest charts first"""
+        snapshot = pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+        by_cost = sorted(stale, key=lambda item: item[0][4], reverse=True)
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(stale)),
+                                 initializer=_init_worker, initargs=(snapshot,)) as pool:
+            futures = {pool.submit(_run_in_worker, '_timed_chart', chart[0]): (chart, hashes)
+                       for chart, hashes in by_cost}
+            for future in as_completed(futures):
+                record(*futures[future], future.result())
+
+def chart_name(method_name):
+    """Short CLI name of a chart method (create_regional_heatmap -> regional_heatmap)"""
+    return method_name[len('create_'):]
+
+def select_charts(names=None):
+    """CHARTS entries for the given short or method names, in presentation order"""
+    if not names:
+        return list(CHARTS)
+    wanted = {name[len('create_'):] if name.startswith('create_') else name for name in names}
+    unknown = wanted - {chart_name(chart[0]) for chart in CHARTS}
+    if unknown:
+        raise ValueError(f"Unknown charts: {sorted(unknown)}")
+    return [chart for chart in CHARTS if chart_name(chart[0]) in wanted]
+
+def _proc_status_mb(field):
+    """A memory field of /proc/self/status in MB (Linux), or None"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith(field + ':'):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+def _reset_peak_rss():
+    """Start a new peak-RSS window and return the current RSS in MB
+
+    Linux only; elsewhere the process high-water mark keeps accumulating
+    and the current RSS is reported as None.
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+    return _proc_status_mb('VmRSS')
+
+def _peak_rss_mb():
+    """Peak resident memory in MB since the last reset (VmHWM), or the process high-water mark"""
+    peak = _proc_status_mb('VmHWM')
+    if peak is not None:
+        return peak
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+# Visualizer restored from the parent's snapshot, one per worker process
+_worker_visualizer = None
+
+def _init_worker(snapshot):
+    """Process-pool initializer: headless backend plus the shared read-only data snapshot"""
+    global _worker_visualizer
+    plt.switch_backend('Agg')
+    _worker_visualizer = pickle.loads(snapshot)
+
+def _run_in_worker(method_name, *args):
+    """Call a visualizer method in a worker process and return its result"""
+    return getattr(_worker_visualizer, method_name)(*args)
+
+def _slug(name):
+    """File-system safe version of a state or district name"""
+    return re.sub(r'[^\w\-]+', '_', str(name)).strip('_')
+
+class _ChartPack:
+    """One reusable prevalence / risk / coverage figure for the state and district packs
+
+    Axes, ticks and grids are drawn once and kept as a background bitmap.
+    Each chart only updates the bars, labels, titles and legends, redraws
+    those artists over the background and writes the canvas buffer out.
+    """
+
+    def __init__(self, prevalence_columns, coverage_columns, risk_max, dpi):
+        self.prevalence_columns = prevalence_columns
+        self.coverage_columns = coverage_columns
+
+        self.fig = Figure(figsize=(16, 5), dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.fig)
+        ax_prevalence, ax_risk, ax_coverage = self.fig.subplots(1, 3)
+        self.title = self.fig.suptitle('', fontsize=15, fontweight='bold')
+        self.dynamic = [self.title]
+
+        # Panel 1: prevalence, selected area vs comparison
+        self.prevalence_bars, self.prevalence_labels, self.prevalence_legend = self._paired_bars(
+            ax_prevalence, [c.replace('Prevalence_', '') for c in prevalence_columns],
+            'Prevalence (%)', 'STH Prevalence')
+
+        # Panel 2: districts per risk category
+        self.risk_bars = ax_risk.barh(RISK_CATEGORIES, np.zeros(len(RISK_CATEGORIES)),
+                                      color=['#FF0000', '#FF9933', '#138808'])
+        ax_risk.set_xlim(0, max(risk_max, 1) * 1.2)
+        ax_risk.invert_yaxis()
+        ax_risk.set_xlabel('Districts')
+        ax_risk.set_title('Districts by Risk Category')
+        self.risk_labels = [ax_risk.text(0, bar.get_y() + bar.get_height() / 2, '', va='center', fontsize=9)
+                            for bar in self.risk_bars]
+        self.dynamic += list(self.risk_bars) + self.risk_labels
+
+        # Panel 3: programme coverage (stored as fractions, shown as %)
+        if coverage_columns:
+            self.coverage_bars, self.coverage_labels, self.coverage_legend = self._paired_bars(
+                ax_coverage, [c.replace('_', ' ') for c in coverage_columns],
+                'Coverage (%)', 'Programme Coverage')
+        else:
+            ax_coverage.text(0.5, 0.5, 'No coverage data', ha='center', va='center',
+                             transform=ax_coverage.transAxes)
+            ax_coverage.set_axis_off()
+
+        # Lay out and draw the static parts once; changing artists are left out of the background
+        self.fig.tight_layout(rect=[0, 0, 1, 0.92])
+        self.fig.set_layout_engine('none')
+        for artist in self.dynamic:
+            artist.set_animated(True)
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+
+    def _paired_bars(self, ax, labels, ylabel, title):
+        """Selected-vs-comparison bar pairs with value labels and a legend"""
+        x = np.arange(len(labels))
+        width = 0.38
+        selected = ax.bar(x - width / 2, np.zeros(len(x)), width, color=INDIAN_COLORS[0], label='Selected')
+        reference = ax.bar(x + width / 2, np.zeros(len(x)), width, color=INDIAN_COLORS[3], label='Comparison')
+        ax.set_xticks(x)
+        ax.set_xticklabels(labels)
+        ax.set_ylim(0, 105)
+        ax.set_ylabel(ylabel)
+        ax.set_title(title)
+        ax.grid(axis='y', alpha=0.3)
+        value_labels = [ax.text(bar.get_x() + bar.get_width() / 2, 0, '', ha='center', va='bottom', fontsize=8)
+                        for bar in list(selected) + list(reference)]
+        legend = ax.legend(loc='upper right')
+        self.dynamic += list(selected) + list(reference) + value_labels + [legend]
+        return (selected, reference), value_labels, legend
+
+    @staticmethod
+    def _set_bars(bars, labels, legend, values, reference, label, reference_label):
+        """Update a selected/comparison bar pair in place"""
+        heights = list(values) + list(reference)
+        for bar, value_label, height in zip(list(bars[0]) + list(bars[1]), labels, heights):
+            height = float(height)
+            bar.set_height(0 if np.isnan(height) else height)
+            value_label.set_y(0 if np.isnan(height) else height + 1)
+            value_label.set_text('n/a' if np.isnan(height) else f'{height:.0f}')
+        legend.get_texts()[0].set_text(label)
+        legend.get_texts()[1].set_text(reference_label)
+
+    def update(self, label, title, values, reference, reference_label, risk_counts, highlight=None):
+        """Point the figure at one state or district"""
+        self.title.set_text(title)
+        self._set_bars(self.prevalence_bars, self.prevalence_labels, self.prevalence_legend,
+                       values[self.prevalence_columns], reference[self.prevalence_columns],
+                       label, reference_label)
+        if self.coverage_columns:
+            self._set_bars(self.coverage_bars, self.coverage_labels, self.coverage_legend,
+                           values[self.coverage_columns] * 100, reference[self.coverage_columns] * 100,
+                           label, reference_label)
+
+        for bar, label, category in zip(self.risk_bars, self.risk_labels, RISK_CATEGORIES):
+            count = int(risk_counts[category])
+            bar.set_width(count)
+            bar.set_alpha(1.0 if highlight in (None, category) else 0.3)
+            label.set_x(count + 0.1)
+            label.set_text(str(count))
+
+    def save(self, path):
+        """Redraw the changing artists over the static background and write the PNG"""
+        self.canvas.restore_region(self.background)
+        for artist in self.dynamic:
+            self.fig.draw_artist(artist)
+        with stage('save'):
+            Image.fromarray(np.asarray(self.canvas.buffer_rgba())).convert('RGB').save(path, compress_level=3)
+
 def main():
-    """Main function to generate all Indian STH visuals"""
-    # Define paths
+    """Generate the Indian STH visual assets"""
     script_dir = Path(__file__).parent
-    data_file = script_dir / "Indian_STH_Data.xlsx"
-    output_dir = script_dir / "Generated_Charts"
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('--data', type=Path, default=script_dir / "Indian_STH_Data.xlsx",
+                        help="District workbook (.xlsx) or Parquet table/cache (.parquet)")
+    parser.add_argument('-o', '--output', type=Path, default=script_dir / "Generated_Charts",
+                        help="Output directory (default: Generated_Charts/)")
+    parser.add_argument('--charts', nargs='+', metavar='CHART',
+                        choices=[chart_name(chart[0]) for chart in CHARTS],
+                        help="Only these charts (default: all)")
+    parser.add_argument('-j', '--jobs', type=int, default=1, help="Worker processes (default: 1)")
+    parser.add_argument('--formats', nargs='+', default=list(DEFAULT_PROFILES), choices=list(OUTPUT_PROFILES),
+                        help="Output profiles: png (default), print (SVG+PDF), slides (palette PNG), web (WebP)")
+    parser.add_argument('--dpi', type=int, default=300, help="Raster resolution (default: 300)")
+    parser.add_argument('--memory-budget', type=float, metavar='MB',
+                        help="Cap raster canvases to this many MB (lowers DPI for large figures) and "
+                             "draw dense district scatters as density images")
+    parser.add_argument('--force', action='store_true', help="Re-render charts even if unchanged")
+    parser.add_argument('--state-packs', action='store_true', help="Also render per-state chart packs")
+    parser.add_argument('--districts', action='store_true', help="With --state-packs, add per-district packs")
+    parser.add_argument('--report', type=Path,
+                        help="Write the timing/peak-memory report as JSON (a .jsonl file gets one line appended)")
+    parser.add_argument('--list', action='store_true', help="List chart names and exit")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    if args.profile:
+        enable_profiling(args.profile)
+
+    if args.list:
+        for method_name, output_name, _, _, _ in CHARTS:
+            print(f"{chart_name(method_name):<37}{output_name}")
+        return
 
     # Validate input file
-    if not data_file.exists():
-        print(f"❌ Data file not found: {data_file}")
-        print("Please ensure Indian_STH_Data.xlsx exists in the same directory")
+    if not args.data.exists():
+        print(f"❌ Data file not found: {args.data}")
+        print("Please ensure Indian_STH_Data.xlsx exists in the same directory or pass --data")
         return
 
-    # Create visualizer and generate charts
-    visualizer = IndianSTHVisualizer(data_file, output_dir)
-    visualizer.generate_all_visuals()
+    run_start = time.perf_counter()
+    with profiled('generate_indian_visuals', default_stage='render'):
+        visualizer = IndianSTHVisualizer(args.data, args.output, profiles=args.formats, dpi=args.dpi,
+                                         memory_budget_mb=args.memory_budget)
+        load_s = time.perf_counter() - run_start
+        load_peak_mb = _peak_rss_mb()  # Read before the per-chart windows reset the high-water mark
+        charts = visualizer.generate_all_visuals(jobs=args.jobs, force=args.force, charts=args.charts)
+
+        packs = None
+        if args.state_packs:
+            pack_start = time.perf_counter()
+            written = visualizer.create_state_packs(include_districts=args.districts, jobs=args.jobs,
+                                                   dpi=args.dpi)
+            packs = {'files': written, 'wall_s': round(time.perf_counter() - pack_start, 3)}
+
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'data': str(args.data),
+        'jobs': args.jobs,
+        'formats': args.formats,
+        'dpi': args.dpi,
+        'memory_budget_mb': args.memory_budget,
+        'load_s': round(load_s, 3),
+        'total_s': round(time.perf_counter() - run_start, 3),
+        # Whole-run high-water mark: loading, every chart (in whichever process
+        # drew it) and whatever ran after the last chart's window
+        'peak_rss_mb': max((peak for peak in [load_peak_mb, _peak_rss_mb()] +
+                            [entry.get('peak_rss_mb') for entry in charts] if peak is not None),
+                           default=None),
+        'charts': charts,
+        'state_packs': packs,
+    }
 
     # Print summary
-    print("\n📋 Summary of Generated Visual Assets:")
+    print("\n📋 Chart Timings:")
     print("=" * 50)
-
-    charts = [
-        "State-wise STH Prevalence Map",
-        "Parasite Prevalence Comparison",
-        "Risk Category Distribution",
-        "Regional Prevalence Heatmap",
-        "Healthcare Integration Chart",
-        "National Deworming Progress",
-        "Comprehensive STH Dashboard"
-    ]
-
-    for i, chart in enumerate(charts, 1):
-        print(f"{i}. {chart}")
-
+    for entry in charts:
+        timing = (f"{entry['wall_s']:6.2f}s  peak {entry['peak_rss_mb']} MB"
+                  if entry['status'] == 'rendered' else 'skipped')
+        print(f"{entry['chart']:<37}{timing}")
     print("=" * 50)
-    print("✅ Visual generation complete!")
-    print("📧 All files saved in: Generated_Charts/")
+    print(f"✅ Visual generation complete in {report['total_s']:.2f}s")
+    print(f"📧 All files saved in: {args.output}")
+
+    if args.report:
+        if args.report.suffix == '.jsonl':
+            with open(args.report, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(report) + '\n')
+        else:
+            with open(args.report, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+        print(f"⏱️  Timing report saved to: {args.report}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Build orchestrator for the course assets
+Models the asset pipeline as a dependency graph (district workbook → district
+table cache → chart files → final deck, with the course markdown feeding both
+decks), runs independent steps concurrently in worker processes, skips steps
+whose inputs hash the same as at their last build and reports the critical path
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+from sth_markdown import COURSE_FILES
+from sth_profile import add_profile_argument, enable_profiling, output_dir, profiled, stage
+from sth_slide_cache import DEFAULT_IMAGE_DPI
+from sth_watch import Observer, watch_changes
+
+ROOT = Path(__file__).parent
+GENERATOR_DIR = ROOT / "Visual_Assets_Indian_Context"
+DATA_PATH = GENERATOR_DIR / "Indian_STH_Data.xlsx"
+CHARTS_DIR = GENERATOR_DIR / "Generated_Charts"
+STATE_PATH = ROOT / ".sth_cache" / "build" / "state.json"
+
+FINAL_DECK = ROOT / "STH_Medical_Teaching_Presentation.pptx"
+SLIDES_DECK = ROOT / "STH_Slides_Based_Presentation.pptx"
+SLIDES_MARKDOWN = ROOT / "Presentation_Slides_STH.md"
+
+# Modules every deck build runs through
+DECK_CODE = ['sth_markdown.py', 'sth_slide_cache.py', 'sth_textfit.py']
+
+
+# Node functions run in worker processes and return the files they wrote
+
+@stage('load')
+def build_district_table(data_path):
+    """Parse the workbook into the Parquet cache that the charts and decks aggregate from"""
+    from sth_data import cached_table_path, pq
+
+    if pq is None or not Path(data_path).exists():
+        print("Parquet cache unavailable (no pyarrow or no workbook); consumers read the workbook directly")
+        return []
+    try:
+        return [str(cached_table_path(data_path))]
+    except Exception as e:
+        # The generator and batch decks fall back to dummy data for an unreadable workbook
+        print(f"Workbook could not be read ({type(e).__name__}); charts use dummy data")
+        return []
+
+
+def build_charts(data_path, output_dir, jobs):
+    """Render the charts whose data slice, code or style changed (the generator's own manifest)"""
+    sys.path.insert(0, str(GENERATOR_DIR))
+    from generate_indian_visuals import IndianSTHVisualizer
+
+    report = IndianSTHVisualizer(data_path, output_dir).generate_all_visuals(jobs=jobs)
+    return [str(Path(output_dir) / entry['output']) for entry in report]
+
+
+def build_final_deck(output_file, visuals_dir, image_dpi, native_charts_data=None):
+    """Build the final presentation, reusing cached slides"""
+    from create_final_presentation import build_presentation, deck_slide_cache
+
+    build_presentation(output_file, ROOT, visuals_dir, deck_slide_cache(output_file), image_dpi,
+                       native_charts_data)
+    return [str(output_file)]
+
+
+def build_slides_deck(slides_md_file, output_file):
+    """Build the slides-based presentation, reusing cached slides"""
+    from create_slides_based_presentation import build_presentation, deck_slide_cache
+
+    build_presentation(slides_md_file, output_file, deck_slide_cache(output_file))
+    return [str(output_file)]
+
+
+class Node:
+    """One build step: func(**options) in a worker, rerun when its sources or upstream outputs change"""
+
+    def __init__(self, name, func, deps=(), sources=(), options=None):
+        self.name = name
+        self.func = func
+        self.deps = list(deps)
+        self.sources = [Path(source) for source in sources]
+        self.options = options or {}
+
+    def digest(self, upstream_outputs):
+        """SHA-256 over the node's options and the content of its sources and upstream outputs"""
+        digest = hashlib.sha256(json.dumps([self.func.__name__, self.options], sort_keys=True).encode('utf-8'))
+        for path in sorted(set(self.sources) | {Path(output) for output in upstream_outputs}):
+            digest.update(str(path).encode('utf-8'))
+            digest.update(_file_digest(path).encode('utf-8'))
+        return digest.hexdigest()
+
+
+def _file_digest(path):
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return 'missing'
+
+
+def asset_graph(data_path=DATA_PATH, charts_dir=CHARTS_DIR, chart_jobs=1, image_dpi=DEFAULT_IMAGE_DPI,
+                native_charts=False):
+    """The course asset build graph, by node name in a valid build order"""
+    markdown = [ROOT / name for name in COURSE_FILES]
+    deck_code = [ROOT / name for name in DECK_CODE]
+    table_code = [ROOT / 'sth_data.py', ROOT / 'sth_cube.py']
+    generator = GENERATOR_DIR / 'generate_indian_visuals.py'
+
+    final_deck = Node('final_deck', build_final_deck, deps=['charts'],
+                      sources=[*markdown, ROOT / 'create_final_presentation.py', *deck_code],
+                      options={'output_file': str(FINAL_DECK), 'visuals_dir': str(charts_dir),
+                               'image_dpi': image_dpi})
+    if native_charts:
+        # Native charts are built from the district table, not the chart files
+        final_deck.deps = ['district_table']
+        final_deck.sources += [data_path, generator, *table_code]
+        final_deck.options['native_charts_data'] = str(data_path)
+
+    nodes = [
+        Node('district_table', build_district_table, sources=[data_path, ROOT / 'sth_data.py'],
+             options={'data_path': str(data_path)}),
+        Node('charts', build_charts, deps=['district_table'], sources=[data_path, generator, *table_code],
+             options={'data_path': str(data_path), 'output_dir': str(charts_dir), 'jobs': chart_jobs}),
+        Node('slides_deck', build_slides_deck,
+             sources=[SLIDES_MARKDOWN, ROOT / 'create_slides_based_presentation.py', *deck_code],
+             options={'slides_md_file': str(SLIDES_MARKDOWN), 'output_file': str(SLIDES_DECK)}),
+        final_deck,
+    ]
+    return {node.name: node for node in nodes}
+
+
+def select_nodes(graph, names):
+    """The named nodes and everything they depend on, in graph order"""
+    unknown = set(names) - set(graph)
+    if unknown:
+        raise ValueError(f"Unknown build steps: {sorted(unknown)}")
+    wanted, stack = set(), list(names)
+    while stack:
+        name = stack.pop()
+        if name not in wanted:
+            wanted.add(name)
+            stack.extend(graph[name].deps)
+    return {name: node for name, node in graph.items() if name in wanted}
+
+
+def _run_node(func, options):
+    """Run a node function, capturing what it prints and logs (runs in a worker process)
+
+    With profiling enabled each step writes its own profile, named after its function.
+    """
+    log = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log), profiled(func.__name__, 'render'):
+            outputs = func(**options)
+    except Exception:
+        return {'error': traceback.format_exc(), 'log': log.getvalue()}
+    return {'outputs': outputs, 'log': log.getvalue()}
+
+
+def _read_state(state_path):
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_state(state_path, state):
+    state_path = Path(state_path)
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = state_path.with_name(f'{state_path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, state_path)
+
+
+def run_graph(graph, jobs=1, force=False, state_path=STATE_PATH, verbose=False):
+    """Run the graph's nodes as their dependencies finish; returns one result per node
+
+    A node is skipped when the digest of its sources and upstream outputs
+    matches its last successful build and the files it wrote still exist.
+    Results carry the status ('built', 'skipped', 'failed' or 'blocked'),
+    start and end seconds from the start of the build and the output files.
+    """
+    for node in graph.values():
+        missing = set(node.deps) - set(graph)
+        if missing:
+            raise ValueError(f"{node.name} depends on unknown steps: {sorted(missing)}")
+
+    state = _read_state(state_path)
+    results = {}
+    pending = dict(graph)
+    running = {}
+    build_start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while pending or running:
+            # Start (or skip) every node whose dependencies are done; skips can unblock more nodes
+            progressed = True
+            while progressed:
+                progressed = False
+                for name, node in list(pending.items()):
+                    if any(dep not in results for dep in node.deps):
+                        continue
+                    del pending[name]
+                    progressed = True
+                    now = time.perf_counter() - build_start
+                    if any(results[dep]['status'] in ('failed', 'blocked') for dep in node.deps):
+                        results[name] = {'status': 'blocked', 'start': now, 'end': now, 'outputs': []}
+                        print(f"❌ {name} not built: an upstream step failed")
+                        continue
+
+                    digest = node.digest(output for dep in node.deps for output in results[dep]['outputs'])
+                    previous = state.get(name, {})
+                    if (not force and previous.get('digest') == digest
+                            and all(Path(output).exists() for output in previous.get('outputs', []))):
+                        results[name] = {'status': 'skipped', 'start': now, 'end': now,
+                                         'outputs': previous['outputs']}
+                        print(f"⏭️  {name} unchanged, skipped")
+                        continue
+                    running[pool.submit(_run_node, node.func, node.options)] = (name, digest, now)
+
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, digest, start = running.pop(future)
+                end = time.perf_counter() - build_start
+                outcome = future.result()
+                if verbose or 'error' in outcome:
+                    for line in outcome['log'].splitlines():
+                        print(f"   {name} | {line}")
+                if 'error' in outcome:
+                    results[name] = {'status': 'failed', 'start': start, 'end': end, 'outputs': []}
+                    print(f"❌ {name} failed ({end - start:.2f}s):\n{outcome['error']}")
+                    continue
+                results[name] = {'status': 'built', 'start': start, 'end': end, 'outputs': outcome['outputs']}
+                state[name] = {'digest': digest, 'outputs': outcome['outputs']}
+                _write_state(state_path, state)
+                print(f"✓ {name} built ({end - start:.2f}s)")
+
+    return {name: results[name] for name in graph}
+
+
+def dependents(graph, names):
+    """The named nodes and every node downstream of them (graph is in build order)"""
+    affected = set(names)
+    for name, node in graph.items():
+        if affected.intersection(node.deps):
+            affected.add(name)
+    return affected
+
+
+def watch(graph, jobs=1, verbose=False, polling=False):
+    """Build, then rebuild the steps downstream of each batch of source edits until interrupted"""
+    # Import the step modules once, so forked workers start without import time
+    sys.path.insert(0, str(GENERATOR_DIR))
+    import create_final_presentation, create_slides_based_presentation, generate_indian_visuals  # noqa: F401
+
+    run_graph(graph, jobs, verbose=verbose)
+    sources = {}
+    for node in graph.values():
+        for path in node.sources:
+            sources.setdefault(path.resolve(), []).append(node.name)
+    mode = 'polling' if polling or Observer is None else 'file events'
+    print(f"\n👀 Watching {len(sources)} source files ({mode}); Ctrl+C to stop")
+
+    try:
+        for changed in watch_changes(sources, polling=polling):
+            steps = dependents(graph, {name for path in changed for name in sources[path]})
+            print(f"\n📝 Changed: {', '.join(sorted(path.name for path in changed))}")
+            start = time.perf_counter()
+            results = run_graph(select_nodes(graph, steps), jobs, verbose=verbose)
+            rebuilt = [name for name, result in results.items() if result['status'] == 'built']
+            print(f"⏱️ Rebuilt {', '.join(rebuilt) or 'nothing'} in {time.perf_counter() - start:.2f}s")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+
+
+def critical_path(graph, results):
+    """Nodes on the chain of dependencies that finished last, ending at the last node to finish"""
+    if not results:
+        return []
+    path = [max(results, key=lambda name: results[name]['end'])]
+    while graph[path[-1]].deps:
+        path.append(max(graph[path[-1]].deps, key=lambda dep: results[dep]['end']))
+    return path[::-1]
+
+
+def main():
+    """Build the charts and both presentations, rebuilding only what changed"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('steps', nargs='*', metavar='STEP',
+                        help="Only these steps and their dependencies (default: all)")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help="Steps run at once (default: one per CPU)")
+    parser.add_argument('--chart-jobs', type=int, default=1, help="Worker processes for chart rendering")
+    parser.add_argument('--data', type=Path, default=DATA_PATH, help="District workbook")
+    parser.add_argument('--image-dpi', type=int, default=DEFAULT_IMAGE_DPI,
+                        help="Resample charts to this many pixels per inch of slide (0 keeps full resolution)")
+    parser.add_argument('--native-charts', action='store_true',
+                        help="Build the final deck's charts as native PowerPoint charts")
+    parser.add_argument('--force', action='store_true', help="Rebuild every step even if unchanged")
+    parser.add_argument('-v', '--verbose', action='store_true', help="Show the output of each step")
+    parser.add_argument('--list', action='store_true', help="List the build steps and exit")
+    parser.add_argument('--watch', action='store_true',
+                        help="Keep running and rebuild what changed whenever a source file is saved")
+    parser.add_argument('--poll', action='store_true', help="With --watch, poll file stats instead of file events")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    if args.profile:
+        enable_profiling(args.profile)  # Inherited by the step worker processes
+
+    graph = asset_graph(args.data, chart_jobs=args.chart_jobs, image_dpi=args.image_dpi or None,
+                        native_charts=args.native_charts)
+    if args.list:
+        for node in graph.values():
+            print(f"{node.name:<16}← {', '.join(node.deps) or 'sources only'}")
+        return
+    if args.steps:
+        graph = select_nodes(graph, args.steps)
+    if args.watch:
+        watch(graph, args.jobs, args.verbose, args.poll)
+        return
+
+    print("🎯 Building STH course assets...")
+    start = time.perf_counter()
+    results = run_graph(graph, args.jobs, args.force, verbose=args.verbose)
+    wall = time.perf_counter() - start
+
+    print("\n📋 Build Steps:")
+    print("=" * 50)
+    for name, result in results.items():
+        print(f"{name:<16}{result['status']:<9}start {result['start']:6.2f}s  "
+              f"took {result['end'] - result['start']:6.2f}s")
+    print("=" * 50)
+    path = critical_path(graph, results)
+    path_s = sum(results[name]['end'] - results[name]['start'] for name in path)
+    print(f"⏱️ Critical path: {' → '.join(path)} ({path_s:.2f}s of {wall:.2f}s wall)")
+
+    failed = [name for name, result in results.items() if result['status'] in ('failed', 'blocked')]
+    if failed:
+        print(f"❌ Not built: {', '.join(failed)}")
+        sys.exit(1)
+    print(f"\n🎉 Assets up to date ({sum(r['status'] == 'built' for r in results.values())} steps rebuilt)")
+    if args.profile:
+        print(f"🔬 Step profiles written to {output_dir()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Batch PPTX Generator: one deck per course module and one India-context deck per state
+Fans deck builds out over a process pool (each worker owns its Presentation),
+writes every deck atomically and records build times and sizes in an index
+"""
+
+import argparse
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from pptx import Presentation
+from pptx.util import Pt
+
+from create_final_presentation import ProfessionalSTHPresenter, VISUAL_FRAME
+from create_slides_based_presentation import DirectSlidePresenter
+from sth_markdown import COURSE_FILES, load_document, section_bullets
+from sth_slide_cache import CACHE_DIR, DEFAULT_IMAGE_DPI, SlideCache, prepare_image
+from sth_textfit import text_area
+
+ROOT = Path(__file__).parent
+OUTPUT_DIR = ROOT / "Batch_Decks"
+VISUALS_DIR = ROOT / "Visual_Assets_Indian_Context" / "Generated_Charts"
+MODULE_FILES = [name for name in COURSE_FILES if name.startswith('Module_')]
+PACK_DIR_NAME = 'state_packs'  # Written by generate_indian_visuals.py --state-packs
+INDEX_NAME = 'index.json'
+
+PARASITE_LABELS = {
+    'Prevalence_Ascaris': 'Ascaris',
+    'Prevalence_Trichuris': 'Trichuris',
+    'Prevalence_Hookworm': 'Hookworm',
+    'Prevalence_Children': 'Children (1-14 years)',
+}
+
+
+def _slug(name):
+    """File-system safe version of a state name (as in generate_indian_visuals)"""
+    return re.sub(r'[^\w\-]+', '_', str(name)).strip('_')
+
+
+class ModuleDeckPresenter(DirectSlidePresenter):
+    """Deck for one Module_N markdown file: its title, then a slide per section that has bullets"""
+
+    def _parse_slides_md(self):
+        document = load_document(self.slides_md_path)
+        headings = [node['title'] for node in document['nodes'] if node['type'] == 'heading']
+        self.module_title = headings[0] if headings else self.slides_md_path.stem.replace('_', ' ')
+        return [{'title': section['title'], 'content': section['bullets']}
+                for section in section_bullets(document)]
+
+    def create_title_slide(self):
+        """Create the module's title slide"""
+        self._add_slide(0, self._fill_module_title, self.module_title)
+
+    def _fill_module_title(self, slide, module_title):
+        title = slide.shapes.title
+        title.text = module_title
+        title.text_frame.paragraphs[0].font.size = self.subtitle_font_size
+        title.text_frame.paragraphs[0].font.bold = True
+        title.text_frame.paragraphs[0].font.color.rgb = self.colors['primary']
+
+        subtitle = slide.placeholders[1]
+        subtitle.text = "Soil Transmitted Diseases (STH) - MBBS 3rd Year Teaching Module"
+        subtitle.text_frame.paragraphs[0].font.size = self.caption_font_size
+
+
+class StateDeckPresenter(ProfessionalSTHPresenter):
+    """India-context deck for one state: key figures against the national means and its chart pack"""
+
+    def __init__(self, visuals_dir, slide_cache=None, image_dpi=DEFAULT_IMAGE_DPI):
+        # Theme and layout only: a state deck never reads the course markdown
+        self.visuals_dir = Path(visuals_dir)
+        self.presentation = Presentation()
+        self.slide_cache = slide_cache
+        self.image_dpi = image_dpi
+        self._setup_theme()
+        self.body_area = text_area(self.presentation.slide_layouts[1].placeholders[1])
+
+    def create_state_slides(self, summary):
+        """Create the title, key figures and chart pack slides from a state_summaries() entry"""
+        state = summary['state']
+        self._add_slide(0, self._fill_state_title, state, summary['year'])
+        self._add_topic_slides(f"{state}: Key Figures", summary['figures'],
+                               'secondary', f"STH in {state} - Key Figures")
+
+        pack_path = self.visuals_dir / PACK_DIR_NAME / f"{_slug(state)}.png"
+        if pack_path.exists():
+            if self.image_dpi:
+                pack_path = prepare_image(pack_path, *VISUAL_FRAME[2:], self.image_dpi)
+            self._add_slide(5, self._fill_visual_slide, f"{state}: Prevalence, Risk and Coverage", pack_path)
+
+    def _fill_state_title(self, slide, state, year):
+        title = slide.shapes.title
+        title.text = f"Soil Transmitted Diseases in {state}"
+        title.text_frame.paragraphs[0].font.size = self.subtitle_font_size
+        title.text_frame.paragraphs[0].font.bold = True
+        title.text_frame.paragraphs[0].font.color.rgb = self.colors['primary']
+
+        subtitle = slide.placeholders[1]
+        subtitle.text = "India Context Briefing" + (f" | Survey year {year}" if year else "")
+        subtitle.text_frame.paragraphs[0].font.size = Pt(24)
+        subtitle.text_frame.paragraphs[0].font.color.rgb = self.colors['text']
+
+        self._add_footer(slide, "Medical Education Department | 2025")
+
+
+def state_summaries(states=None):
+    """Key-figure bullets per state for the latest survey year, from the prevalence cube
+
+    Loads the district table the same way as the visual generator (dummy data
+    when the workbook cannot be read), so the figures match its chart packs.
+    """
+    from sth_cube import PrevalenceCube
+    from sth_data import (DATA_PATH, RISK_CATEGORIES, compact_district_frame,
+                          generate_synthetic_districts, load_district_table, synthetic_shape)
+
+    try:
+        df = load_district_table(DATA_PATH)
+    except Exception:
+        df = generate_synthetic_districts(**synthetic_shape(15, 5), seed=42)
+    df = compact_district_frame(df)
+    cube = PrevalenceCube.from_frame(df)
+
+    year = int(df['Year'].max()) if 'Year' in df else None
+    latest = {'years': [year]} if year is not None else {}
+    parasites = [p for p in PARASITE_LABELS if p in cube.parasites]
+    means = cube.state_means(parasites, **latest)
+    cells = cube.slice(**latest)
+    national = cube.national_means(parasites, **latest)
+    totals = cube.state_totals(**latest)
+    by_state = cells.groupby(level='State').sum()
+    risk = (cells.groupby(level=['State', 'Risk_Category'])['count'].sum()
+            .unstack(fill_value=0).reindex(columns=RISK_CATEGORIES, fill_value=0))
+
+    # States with no districts in the latest year have nothing to report
+    available = list(by_state.index)
+    if states:
+        for state in states:
+            if state not in available:
+                print(f"⏭️  {state}: no districts in the latest survey year, deck skipped")
+        available = [state for state in states if state in available]
+
+    summaries = []
+    for state in available:
+        figures = [f"Districts surveyed: {int(by_state.loc[state, 'count'])}"]
+        if 'Total_Population' in totals:
+            population = f"Population: {totals.loc[state, 'Total_Population'] / 1e6:.1f} million"
+            if 'Children_1_14' in totals:
+                population += f" (children 1-14: {totals.loc[state, 'Children_1_14'] / 1e6:.1f} million)"
+            figures.append(population)
+        for parasite, india in national.items():
+            figures.append(f"{PARASITE_LABELS[parasite]} prevalence: {means.loc[state, parasite]:.1f}% "
+                           f"(India: {india:.1f}%)")
+        figures.append("Districts by risk: " + ", ".join(
+            f"{category} {int(risk.loc[state, category])}" for category in RISK_CATEGORIES))
+        summaries.append({'state': state, 'year': year, 'figures': figures})
+    return summaries
+
+
+def build_deck(job):
+    """Build and atomically save one deck; returns its index entry (runs in a worker process)"""
+    start = time.perf_counter()
+    output_path = Path(job['output'])
+    slide_cache = None
+    if job['cache_dir']:
+        slide_cache = SlideCache(f"{job['kind']}-{output_path.stem}", job['cache_dir'],
+                                 helpers=[ProfessionalSTHPresenter._setup_theme,
+                                          ProfessionalSTHPresenter._add_footer,
+                                          DirectSlidePresenter._setup_theme,
+                                          DirectSlidePresenter._add_footer])
+
+    if job['kind'] == 'module':
+        presenter = ModuleDeckPresenter(job['source'], slide_cache)
+        presenter.create_title_slide()
+        presenter.create_content_slides()
+    else:
+        presenter = StateDeckPresenter(job['visuals_dir'], slide_cache, job['image_dpi'])
+        presenter.create_state_slides(job['source'])
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(f'{output_path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    presenter.presentation.save(tmp_path)
+    os.replace(tmp_path, output_path)
+    if slide_cache is not None:
+        slide_cache.prune()
+
+    return {
+        'deck': job['name'],
+        'kind': job['kind'],
+        'file': output_path.relative_to(job['output_dir']).as_posix(),
+        'slides': len(presenter.presentation.slides),
+        'build_s': round(time.perf_counter() - start, 3),
+        'bytes': output_path.stat().st_size,
+        'reused_slides': slide_cache.hits if slide_cache is not None else 0,
+        'pid': os.getpid(),
+    }
+
+
+def batch_jobs(output_dir, modules=True, states=None, visuals_dir=VISUALS_DIR,
+               image_dpi=DEFAULT_IMAGE_DPI, cache_dir=None):
+    """Deck build jobs for the module files and, unless states is None, the given states ([] for all)"""
+    common = {'output_dir': str(output_dir), 'visuals_dir': str(visuals_dir),
+              'image_dpi': image_dpi, 'cache_dir': str(cache_dir) if cache_dir else None}
+    jobs = []
+    if modules:
+        for name in MODULE_FILES:
+            if (ROOT / name).exists():
+                jobs.append({'kind': 'module', 'name': Path(name).stem, 'source': str(ROOT / name),
+                             'output': str(Path(output_dir) / 'modules' / f"{Path(name).stem}.pptx"), **common})
+    if states is not None:
+        for summary in state_summaries(states or None):
+            jobs.append({'kind': 'state', 'name': summary['state'], 'source': summary,
+                         'output': str(Path(output_dir) / 'states' / f"STH_{_slug(summary['state'])}.pptx"),
+                         **common})
+    return jobs
+
+
+def build_batch(jobs, workers=1):
+    """Build the decks, in a process pool when workers > 1; returns index entries in job order"""
+    entries = {}
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            futures = {pool.submit(build_deck, job): i for i, job in enumerate(jobs)}
+            for future in as_completed(futures):
+                entry = future.result()
+                entries[futures[future]] = entry
+                print(f"✓ {entry['file']} ({entry['slides']} slides, {entry['build_s']:.2f}s)")
+    else:
+        for i, job in enumerate(jobs):
+            entry = entries[i] = build_deck(job)
+            print(f"✓ {entry['file']} ({entry['slides']} slides, {entry['build_s']:.2f}s)")
+    return [entries[i] for i in range(len(jobs))]
+
+
+def write_index(output_dir, entries, wall_s, workers):
+    """Write index.json (atomically) listing every generated deck"""
+    index_path = Path(output_dir) / INDEX_NAME
+    tmp_path = index_path.with_name(f'{index_path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'generated': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'workers': workers,
+            'wall_s': round(wall_s, 3),
+            'total_bytes': sum(entry['bytes'] for entry in entries),
+            'decks': entries,
+        }, f, indent=2)
+    os.replace(tmp_path, index_path)
+    return index_path
+
+
+def main():
+    """Generate per-module and per-state PPTX decks in parallel"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('-o', '--output-dir', type=Path, default=OUTPUT_DIR)
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: one per CPU)")
+    parser.add_argument('--no-modules', action='store_true', help="Skip the per-module decks")
+    parser.add_argument('--states', nargs='*', metavar='STATE',
+                        help="Only these states (default: every state in the district table)")
+    parser.add_argument('--no-states', action='store_true', help="Skip the per-state decks")
+    parser.add_argument('--image-dpi', type=int, default=DEFAULT_IMAGE_DPI,
+                        help="Resample chart packs to this many pixels per inch of slide (0 keeps full resolution)")
+    parser.add_argument('--incremental', action='store_true', help="Reuse cached slides whose inputs are unchanged")
+    args = parser.parse_args()
+
+    states = None if args.no_states else (args.states or [])
+    print("🎯 Creating per-module and per-state STH decks...")
+    start = time.perf_counter()
+    jobs = batch_jobs(args.output_dir, modules=not args.no_modules, states=states, image_dpi=args.image_dpi or None,
+                      cache_dir=CACHE_DIR if args.incremental else None)
+    entries = build_batch(jobs, args.jobs)
+    wall = time.perf_counter() - start
+    index_path = write_index(args.output_dir, entries, wall, args.jobs)
+
+    print(f"\n🎉 {len(entries)} decks built in {wall:.2f}s with {args.jobs} worker(s)")
+    print(f"📊 Total size: {sum(entry['bytes'] for entry in entries) / 1e6:.1f} MB")
+    print(f"📁 Index: {index_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,29 +4,58 @@ Final Professional PPTX Presentation Generator for STH MBBS Teaching
 Creates a comprehensive PowerPoint presentation with professional formatting
 """
 
+import argparse
 import os
+import sys
+import time
 from pathlib import Path
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
 import markdown
 import re
 
+from sth_markdown import load_corpus, section_lines
+from sth_profile import profiled, stage, add_profile_argument, enable_profiling
+from sth_slide_cache import CACHE_DIR, DEFAULT_IMAGE_DPI, SlideCache, prepare_image
+from sth_textfit import fit_bullets, text_area
+
+# Picture frame of the visual slides (below the title, above the footer)
+VISUAL_FRAME = (Inches(0.5), Inches(1.5), Inches(12.33), Inches(5.5))
+
+GENERATOR_DIR = Path(__file__).parent / "Visual_Assets_Indian_Context"
+PARASITE_NAMES = {'Prevalence_Ascaris': 'Ascaris', 'Prevalence_Trichuris': 'Trichuris',
+                  'Prevalence_Hookworm': 'Hookworm'}
+
 class ProfessionalSTHPresenter:
-    def __init__(self, content_dir, visuals_dir):
+    def __init__(self, content_dir, visuals_dir, slide_cache=None, image_dpi=DEFAULT_IMAGE_DPI):
         self.content_dir = Path(content_dir)
         self.visuals_dir = Path(visuals_dir)
         self.presentation = Presentation()
+        self.slide_cache = slide_cache
+        self.image_dpi = image_dpi  # None embeds the charts at full resolution
 
         # Set up professional theme
         self._setup_theme()
+        self.body_area = text_area(self.presentation.slide_layouts[1].placeholders[1])
 
         # Load content
         self.slide_content = self._load_markdown_content()
         self.visual_files = self._get_visual_files()
 
+    def _add_slide(self, layout_index, fill, *args):
+        """Add a slide filled by fill(slide, *args), spliced from the slide cache when unchanged"""
+        layout = self.presentation.slide_layouts[layout_index]
+        if self.slide_cache is not None:
+            return self.slide_cache.add_slide(self.presentation, layout, fill, *args)
+        slide = self.presentation.slides.add_slide(layout)
+        fill(slide, *args)
+        return slide
+
     def _setup_theme(self):
         """Set up professional presentation theme"""
         # Set slide dimensions to 16:9
@@ -49,50 +78,9 @@ class ProfessionalSTHPresenter:
         self.caption_font_size = Pt(18)
 
     def _load_markdown_content(self):
-        """Load and parse markdown content for slides"""
-        content_files = [
-            'Presentation_Slides_STH.md',
-            'Student_Notes_STH.md'
-        ]
-
-        all_content = {}
-        for file in content_files:
-            file_path = self.content_dir / file
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                # Parse markdown to extract sections
-                sections = self._parse_markdown_sections(content)
-                all_content[file] = sections
-
-        return all_content
-
-    def _parse_markdown_sections(self, markdown_content):
-        """Parse markdown content into sections and slides"""
-        lines = markdown_content.split('\n')
-        sections = {}
-        current_section = None
-        current_content = []
-
-        for line in lines:
-            line = line.strip()
-            if line.startswith('#'):
-                # Save previous section
-                if current_section and current_content:
-                    sections[current_section] = current_content
-
-                # Start new section
-                current_section = line.lstrip('#').strip()
-                current_content = []
-            elif current_section and line:
-                current_content.append(line)
-
-        # Save final section
-        if current_section and current_content:
-            sections[current_section] = current_content
-
-        return sections
+        """Load the course markdown files' sections from the shared parser cache"""
+        corpus = load_corpus(self.content_dir)
+        return {file: section_lines(document) for file, document in corpus.items()}
 
     def _get_visual_files(self):
         """Get list of available visual files"""
@@ -105,7 +93,9 @@ class ProfessionalSTHPresenter:
 
     def create_title_slide(self):
         """Create professional title slide"""
-        slide = self.presentation.slides.add_slide(self.presentation.slide_layouts[0])
+        self._add_slide(0, self._fill_title_slide)
+
+    def _fill_title_slide(self, slide):
 
         # Title
         title = slide.shapes.title
@@ -125,7 +115,9 @@ class ProfessionalSTHPresenter:
 
     def create_learning_objectives_slide(self):
         """Create learning objectives slide"""
-        slide = self.presentation.slides.add_slide(self.presentation.slide_layouts[1])
+        self._add_slide(1, self._fill_objectives_slide)
+
+    def _fill_objectives_slide(self, slide):
         title = slide.shapes.title
         title.text = "Learning Objectives"
 
@@ -200,29 +192,35 @@ class ProfessionalSTHPresenter:
         ]
 
         for section_title, bullet_points in topic_sequence:
-            slide = self.presentation.slides.add_slide(self.presentation.slide_layouts[1])
+            self._add_topic_slides(section_title, bullet_points, 'secondary', f"STH Module - {section_title}")
 
-            # Set title
-            title = slide.shapes.title
-            title.text = section_title
-            title.text_frame.paragraphs[0].font.size = Pt(36)
-            title.text_frame.paragraphs[0].font.bold = True
-            title.text_frame.paragraphs[0].font.color.rgb = self.colors['secondary']
+        # Add expanded prevention and control section (multiple slides) - Special Focus
+        self._create_prevention_control_slides()
 
-            # Add content
-            content_box = slide.placeholders[1]
+    def _add_topic_slides(self, section_title, bullet_points, title_color, footer_text):
+        """Add a topic slide, plus continuation slides for bullets that do not fit the body placeholder"""
+        for page, points in enumerate(fit_bullets(self.body_area, bullet_points, self.body_font_size)):
+            title = section_title if page == 0 else f"{section_title} (cont.)"
+            self._add_slide(1, self._fill_topic_slide, title, points, title_color, footer_text)
 
-            for point in bullet_points:
-                p = content_box.text_frame.add_paragraph()
-                p.text = "• " + point
-                p.font.size = self.body_font_size
-                p.font.color.rgb = self.colors['text']
-                p.level = 0
+    def _fill_topic_slide(self, slide, section_title, bullet_points, title_color, footer_text):
+        # Set title
+        title = slide.shapes.title
+        title.text = section_title
+        title.text_frame.paragraphs[0].font.size = Pt(36)
+        title.text_frame.paragraphs[0].font.bold = True
+        title.text_frame.paragraphs[0].font.color.rgb = self.colors[title_color]
 
-                self._add_footer(slide, f"STH Module - {section_title}")
+        # Add content
+        content_box = slide.placeholders[1]
+        for point in bullet_points:
+            p = content_box.text_frame.add_paragraph()
+            p.text = "• " + point
+            p.font.size = self.body_font_size
+            p.font.color.rgb = self.colors['text']
+            p.level = 0
 
-        # Add expanded prevention and control section (multiple slides) - Special Focus
-        self._create_prevention_control_slides()
+        self._add_footer(slide, footer_text)
 
     def _extract_bullet_points(self, text):
         """Extract bullet points from text"""
@@ -251,32 +249,154 @@ class ProfessionalSTHPresenter:
         ]
 
         for title, image_file in visual_slides:
-            slide = self.presentation.slides.add_slide(self.presentation.slide_layouts[5])  # Title only layout
-
-            # Add title
-            title_shape = slide.shapes.title
-            title_shape.text = title
-            title_shape.text_frame.paragraphs[0].font.size = Pt(36)
-            title_shape.text_frame.paragraphs[0].font.bold = True
-            title_shape.text_frame.paragraphs[0].font.color.rgb = self.colors['accent']
-
-            # Add image if exists
-            if image_file in self.visual_files:
-                image_path = self.visual_files[image_file]
-
-                # Calculate image size (leave margin for title)
-                left = Inches(0.5)
-                top = Inches(1.5)
-                width = Inches(12.33)
-                height = Inches(5.5)
-
-                slide.shapes.add_picture(str(image_path), left, top, width, height)
-
-            self._add_footer(slide, "Indian Context Data Visualization")
+            # Generated charts are indexed by file stem
+            image_path = self.visual_files.get(Path(image_file).stem)
+            if image_path is not None and self.image_dpi:
+                image_path = prepare_image(image_path, *VISUAL_FRAME[2:], self.image_dpi)
+            self._add_slide(5, self._fill_visual_slide, title, image_path)  # Title only layout
+
+    def _fill_visual_slide(self, slide, title, image_path):
+        # Add title
+        title_shape = slide.shapes.title
+        title_shape.text = title
+        title_shape.text_frame.paragraphs[0].font.size = Pt(36)
+        title_shape.text_frame.paragraphs[0].font.bold = True
+        title_shape.text_frame.paragraphs[0].font.color.rgb = self.colors['accent']
+
+        # Add image if exists
+        if image_path is not None:
+            slide.shapes.add_picture(str(image_path), *VISUAL_FRAME)
+
+        self._add_footer(slide, "Indian Context Data Visualization")
+
+    def create_native_chart_slides(self, visualizer):
+        """Create the visual slides as native, editable PowerPoint charts
+
+        Uses the state aggregates of an IndianSTHVisualizer instead of its PNG
+        renders, so nothing is rasterised and the deck stays small.
+        """
+        # Programme figures shared with the matplotlib charts (generator is on sys.path, see main)
+        from generate_indian_visuals import (HEALTHCARE_INTEGRATION, DEWORMING_YEARS,
+                                             DEWORMING_COVERAGE, DEWORMING_PREVALENCE)
+
+        state_data = visualizer.state_data
+        by_prevalence = state_data.sort_values('Overall_Prevalence')
+        top_states = state_data.nlargest(10, 'Overall_Prevalence').iloc[::-1]
+        risk_counts = visualizer.cube.risk_counts().sort_values(ascending=False)
+        parasite_means = [round(float(state_data[column].mean()), 1) for column in PARASITE_NAMES]
+
+        def chart(chart_type, title, categories, series, number_format='0.0"%"'):
+            return {'type': chart_type, 'title': title, 'categories': [str(c) for c in categories],
+                    'series': [[name, [round(float(v), 1) for v in values]] for name, values in series],
+                    'number_format': number_format}
+
+        state_prevalence = chart('BAR_CLUSTERED', 'Average STH Prevalence by State (%)', by_prevalence['State'],
+                                 [('Overall prevalence', by_prevalence['Overall_Prevalence'])])
+        parasite_spread = chart('COLUMN_CLUSTERED', 'Parasite Prevalence Across States (%)',
+                                PARASITE_NAMES.values(),
+                                [('Lowest state', state_data[list(PARASITE_NAMES)].min()),
+                                 ('Average', parasite_means),
+                                 ('Highest state', state_data[list(PARASITE_NAMES)].max())])
+        risk_pie = chart('PIE', 'Districts by STH Risk Category', risk_counts.index,
+                         [('Districts', risk_counts.values)], number_format='0')
+        regional = chart('BAR_CLUSTERED', 'Regional STH Prevalence Patterns (%)', state_data['State'],
+                         [(name, state_data[column]) for column, name in PARASITE_NAMES.items()])
+        integration = chart('COLUMN_CLUSTERED', 'Integration of STH Control with National Programs (%)',
+                            HEALTHCARE_INTEGRATION, [('Integration level', HEALTHCARE_INTEGRATION.values())])
+        progress = chart('LINE_MARKERS', 'National Deworming Day Program Progress (%)', DEWORMING_YEARS,
+                         [('Coverage', DEWORMING_COVERAGE), ('Prevalence', DEWORMING_PREVALENCE)])
+
+        native_slides = [
+            ('Indian STH Epidemiology', [state_prevalence]),
+            ('Parasite Prevalence Patterns', [parasite_spread]),
+            ('Risk Distribution', [risk_pie]),
+            ('Regional Comparisons', [regional]),
+            ('Healthcare Integration', [integration]),
+            ('Program Progress', [progress]),
+            ('Comprehensive Dashboard', [
+                chart('BAR_CLUSTERED', 'Top 10 States by STH Prevalence (%)', top_states['State'],
+                      [('Overall prevalence', top_states['Overall_Prevalence'])]),
+                risk_pie,
+                chart('COLUMN_CLUSTERED', 'Average Parasite Prevalence (%)', PARASITE_NAMES.values(),
+                      [('Average', parasite_means)]),
+                chart('LINE_MARKERS', 'STH Prevalence Reduction Trend (%)', DEWORMING_YEARS,
+                      [('Prevalence', DEWORMING_PREVALENCE)]),
+            ]),
+        ]
+        for title, charts in native_slides:
+            self._add_slide(5, self._fill_chart_slide, title, charts)  # Title only layout
+
+    def _fill_chart_slide(self, slide, title, charts):
+        # Add title
+        title_shape = slide.shapes.title
+        title_shape.text = title
+        title_shape.text_frame.paragraphs[0].font.size = Pt(36)
+        title_shape.text_frame.paragraphs[0].font.bold = True
+        title_shape.text_frame.paragraphs[0].font.color.rgb = self.colors['accent']
+
+        # One chart fills the picture frame; several share it as a two-column grid
+        left, top, width, height = VISUAL_FRAME
+        columns = 1 if len(charts) == 1 else 2
+        rows = -(-len(charts) // columns)
+        for i, spec in enumerate(charts):
+            self._add_native_chart(slide, spec,
+                                   left + (i % columns) * (width // columns), top + (i // columns) * (height // rows),
+                                   width // columns, height // rows)
+
+        self._add_footer(slide, "Indian Context Data Visualization")
+
+    def _add_native_chart(self, slide, spec, left, top, width, height):
+        """Add one chart described by a create_native_chart_slides spec, in the Indian theme colors"""
+        chart_data = CategoryChartData(number_format=spec['number_format'])
+        chart_data.categories = spec['categories']
+        for name, values in spec['series']:
+            chart_data.add_series(name, values)
+
+        chart_type = getattr(XL_CHART_TYPE, spec['type'])
+        chart = slide.shapes.add_chart(chart_type, left, top, width, height, chart_data).chart
+        chart.font.size = Pt(11)
+        chart.has_title = True
+        chart.chart_title.text_frame.text = spec['title']
+        chart.chart_title.text_frame.paragraphs[0].font.size = Pt(14)
+        chart.chart_title.text_frame.paragraphs[0].font.bold = True
+
+        is_pie = chart_type == XL_CHART_TYPE.PIE
+        chart.has_legend = is_pie or len(spec['series']) > 1
+        if chart.has_legend:
+            chart.legend.position = XL_LEGEND_POSITION.BOTTOM
+            chart.legend.include_in_layout = False
+
+        palette = [self.colors['primary'], self.colors['secondary'], self.colors['accent']]
+        plot = chart.plots[0]
+        if is_pie:
+            for i, point in enumerate(plot.series[0].points):
+                point.format.fill.solid()
+                point.format.fill.fore_color.rgb = palette[i % len(palette)]
+        else:
+            for series, color in zip(plot.series, palette):
+                if chart_type == XL_CHART_TYPE.LINE_MARKERS:
+                    series.format.line.color.rgb = color
+                    series.smooth = False
+                else:
+                    series.format.fill.solid()
+                    series.format.fill.fore_color.rgb = color
+
+        # Label single-series charts with their values and pies with their shares
+        if is_pie or len(spec['series']) == 1:
+            plot.has_data_labels = True
+            data_labels = plot.data_labels
+            data_labels.font.size = Pt(9)
+            data_labels.number_format = '0.0%' if is_pie else spec['number_format']
+            data_labels.number_format_is_linked = False
+            if is_pie:
+                data_labels.show_percentage = True
+                data_labels.show_value = False
 
     def create_summary_slide(self):
         """Create summary and key points slide"""
-        slide = self.presentation.slides.add_slide(self.presentation.slide_layouts[1])
+        self._add_slide(1, self._fill_summary_slide)
+
+    def _fill_summary_slide(self, slide):
         title = slide.shapes.title
         title.text = "Summary and Key Takeaways"
 
@@ -298,154 +418,64 @@ class ProfessionalSTHPresenter:
 
     def _create_prevention_control_slides(self):
         """Create multiple slides focused on prevention and control - Special Emphasis"""
-        # Slide 1: Prevention Strategies Overview
-        slide1 = self.presentation.slides.add_slide(self.presentation.slide_layouts[1])
-        title1 = slide1.shapes.title
-        title1.text = "Prevention and Control Strategies - Overview"
-        title1.text_frame.paragraphs[0].font.size = Pt(36)
-        title1.text_frame.paragraphs[0].font.bold = True
-        title1.text_frame.paragraphs[0].font.color.rgb = self.colors['accent']
-
-        prevention_overview = [
-            "WHO Control Framework: Preventive chemotherapy, WASH interventions, Health education",
-            "Three Pillars: Mass drug administration, Sanitation improvement, Behavioral change",
-            "Target Population: School-age children (5-14 years), preschoolers, high-risk groups",
-            "WHO 2030 Targets: 75% prevalence reduction, 90% coverage, elimination in some countries",
-            "Cost-Effective: $0.02-0.50 per treatment, benefit-cost ratio 1:30"
-        ]
-
-        content1 = slide1.placeholders[1]
-        for point in prevention_overview:
-            p = content1.text_frame.add_paragraph()
-            p.text = "• " + point
-            p.font.size = self.body_font_size
-            p.font.color.rgb = self.colors['text']
-        self._add_footer(slide1, "Prevention & Control - Overview")
-
-        # Slide 2: Mass Drug Administration (MDA)
-        slide2 = self.presentation.slides.add_slide(self.presentation.slide_layouts[1])
-        title2 = slide2.shapes.title
-        title2.text = "Mass Drug Administration (MDA) Programs"
-        title2.text_frame.paragraphs[0].font.size = Pt(36)
-        title2.text_frame.paragraphs[0].font.bold = True
-        title2.text_frame.paragraphs[0].font.color.rgb = self.colors['accent']
-
-        mda_content = [
-            "Primary Control Strategy: Periodic deworming of at-risk populations",
-            "Frequency: 1-2 times annually in high-prevalence areas",
-            "Coverage Target: ≥75% of school-age children and high-risk groups",
-            "Drugs: Albendazole 400mg or Mebendazole 500mg single oral dose",
-            "Safety: Generally safe, even in pregnancy (avoid first trimester)",
-            "Monitoring: Treatment coverage, drug efficacy, side effects reporting"
-        ]
-
-        content2 = slide2.placeholders[1]
-        for point in mda_content:
-            p = content2.text_frame.add_paragraph()
-            p.text = "• " + point
-            p.font.size = self.body_font_size
-            p.font.color.rgb = self.colors['text']
-        self._add_footer(slide2, "Prevention & Control - MDA Programs")
-
-        # Slide 3: WASH Interventions
-        slide3 = self.presentation.slides.add_slide(self.presentation.slide_layouts[1])
-        title3 = slide3.shapes.title
-        title3.text = "Water, Sanitation and Hygiene (WASH) Interventions"
-        title3.text_frame.paragraphs[0].font.size = Pt(36)
-        title3.text_frame.paragraphs[0].font.bold = True
-        title3.text_frame.paragraphs[0].font.color.rgb = self.colors['accent']
-
-        wash_content = [
-            "Sustainable Prevention: Breaks transmission cycle through environmental control",
-            "Safe Water Supply: Protected sources, household water treatment and storage",
-            "Sanitation: Latrine construction and maintenance, elimination of open defecation",
-            "Hygiene Education: Handwashing at critical points, footwear use, food hygiene",
-            "Behavioral Change: Community-led programs, school-based education",
-            "F Diagram: Feces → Fields → Flies → Fingers → Food → Mouth"
+        prevention_slides = [
+            # Slide 1: Prevention Strategies Overview
+            ("Prevention and Control Strategies - Overview", [
+                "WHO Control Framework: Preventive chemotherapy, WASH interventions, Health education",
+                "Three Pillars: Mass drug administration, Sanitation improvement, Behavioral change",
+                "Target Population: School-age children (5-14 years), preschoolers, high-risk groups",
+                "WHO 2030 Targets: 75% prevalence reduction, 90% coverage, elimination in some countries",
+                "Cost-Effective: $0.02-0.50 per treatment, benefit-cost ratio 1:30"
+            ], "Prevention & Control - Overview"),
+            # Slide 2: Mass Drug Administration (MDA)
+            ("Mass Drug Administration (MDA) Programs", [
+                "Primary Control Strategy: Periodic deworming of at-risk populations",
+                "Frequency: 1-2 times annually in high-prevalence areas",
+                "Coverage Target: ≥75% of school-age children and high-risk groups",
+                "Drugs: Albendazole 400mg or Mebendazole 500mg single oral dose",
+                "Safety: Generally safe, even in pregnancy (avoid first trimester)",
+                "Monitoring: Treatment coverage, drug efficacy, side effects reporting"
+            ], "Prevention & Control - MDA Programs"),
+            # Slide 3: WASH Interventions
+            ("Water, Sanitation and Hygiene (WASH) Interventions", [
+                "Sustainable Prevention: Breaks transmission cycle through environmental control",
+                "Safe Water Supply: Protected sources, household water treatment and storage",
+                "Sanitation: Latrine construction and maintenance, elimination of open defecation",
+                "Hygiene Education: Handwashing at critical points, footwear use, food hygiene",
+                "Behavioral Change: Community-led programs, school-based education",
+                "F Diagram: Feces → Fields → Flies → Fingers → Food → Mouth"
+            ], "Prevention & Control - WASH Interventions"),
+            # Slide 4: Health Education and Community Mobilization
+            ("Health Education and Community Engagement", [
+                "Community Empowerment: Local ownership and participation in control programs",
+                "Health Education: Understanding transmission, prevention, treatment compliance",
+                "School Programs: Child-to-child education, teacher training, regular deworming",
+                "Social Mobilization: Religious leaders, local government, NGOs involvement",
+                "Monitoring & Evaluation: Community health workers, surveillance systems",
+                "Sustainability: Building local capacity for long-term program success"
+            ], "Prevention & Control - Health Education"),
+            # Slide 5: Indian National Programs
+            ("National Deworming Day (NDD) - India", [
+                "Launched 2015: Annual deworming on February 10th and August 10th",
+                "Target Population: Children aged 1-19 years (540 million eligible)",
+                "Coverage Achievement: Over 85% in recent years with government efforts",
+                "Integration: With Ministry of Health, Education, and Rural Development",
+                "Monitoring: Real-time tracking through government portal",
+                "Success: Significant reduction in STH prevalence in school-aged children"
+            ], "Prevention & Control - India Programs"),
+            # Slide 6: Challenges and Future Directions
+            ("Challenges and Future Directions", [
+                "Drug Resistance: Emerging benzimidazole resistance in some areas",
+                "Climate Change: Extended transmission seasons and changing patterns",
+                "Urbanization: New transmission dynamics in growing cities",
+                "Supply Chain: Ensuring consistent drug availability and quality",
+                "Integration: Better coordination between health and other sectors",
+                "Future: Vaccines, new drugs, elimination targets achievement"
+            ], "Prevention & Control - Challenges & Future"),
         ]
 
-        content3 = slide3.placeholders[1]
-        for point in wash_content:
-            p = content3.text_frame.add_paragraph()
-            p.text = "• " + point
-            p.font.size = self.body_font_size
-            p.font.color.rgb = self.colors['text']
-        self._add_footer(slide3, "Prevention & Control - WASH Interventions")
-
-        # Slide 4: Health Education and Community Mobilization
-        slide4 = self.presentation.slides.add_slide(self.presentation.slide_layouts[1])
-        title4 = slide4.shapes.title
-        title4.text = "Health Education and Community Engagement"
-        title4.text_frame.paragraphs[0].font.size = Pt(36)
-        title4.text_frame.paragraphs[0].font.bold = True
-        title4.text_frame.paragraphs[0].font.color.rgb = self.colors['accent']
-
-        education_content = [
-            "Community Empowerment: Local ownership and participation in control programs",
-            "Health Education: Understanding transmission, prevention, treatment compliance",
-            "School Programs: Child-to-child education, teacher training, regular deworming",
-            "Social Mobilization: Religious leaders, local government, NGOs involvement",
-            "Monitoring & Evaluation: Community health workers, surveillance systems",
-            "Sustainability: Building local capacity for long-term program success"
-        ]
-
-        content4 = slide4.placeholders[1]
-        for point in education_content:
-            p = content4.text_frame.add_paragraph()
-            p.text = "• " + point
-            p.font.size = self.body_font_size
-            p.font.color.rgb = self.colors['text']
-        self._add_footer(slide4, "Prevention & Control - Health Education")
-
-        # Slide 5: Indian National Programs
-        slide5 = self.presentation.slides.add_slide(self.presentation.slide_layouts[1])
-        title5 = slide5.shapes.title
-        title5.text = "National Deworming Day (NDD) - India"
-        title5.text_frame.paragraphs[0].font.size = Pt(36)
-        title5.text_frame.paragraphs[0].font.bold = True
-        title5.text_frame.paragraphs[0].font.color.rgb = self.colors['accent']
-
-        india_programs = [
-            "Launched 2015: Annual deworming on February 10th and August 10th",
-            "Target Population: Children aged 1-19 years (540 million eligible)",
-            "Coverage Achievement: Over 85% in recent years with government efforts",
-            "Integration: With Ministry of Health, Education, and Rural Development",
-            "Monitoring: Real-time tracking through government portal",
-            "Success: Significant reduction in STH prevalence in school-aged children"
-        ]
-
-        content5 = slide5.placeholders[1]
-        for point in india_programs:
-            p = content5.text_frame.add_paragraph()
-            p.text = "• " + point
-            p.font.size = self.body_font_size
-            p.font.color.rgb = self.colors['text']
-        self._add_footer(slide5, "Prevention & Control - India Programs")
-
-        # Slide 6: Challenges and Future Directions
-        slide6 = self.presentation.slides.add_slide(self.presentation.slide_layouts[1])
-        title6 = slide6.shapes.title
-        title6.text = "Challenges and Future Directions"
-        title6.text_frame.paragraphs[0].font.size = Pt(36)
-        title6.text_frame.paragraphs[0].font.bold = True
-        title6.text_frame.paragraphs[0].font.color.rgb = self.colors['accent']
-
-        challenges_content = [
-            "Drug Resistance: Emerging benzimidazole resistance in some areas",
-            "Climate Change: Extended transmission seasons and changing patterns",
-            "Urbanization: New transmission dynamics in growing cities",
-            "Supply Chain: Ensuring consistent drug availability and quality",
-            "Integration: Better coordination between health and other sectors",
-            "Future: Vaccines, new drugs, elimination targets achievement"
-        ]
-
-        content6 = slide6.placeholders[1]
-        for point in challenges_content:
-            p = content6.text_frame.add_paragraph()
-            p.text = "• " + point
-            p.font.size = self.body_font_size
-            p.font.color.rgb = self.colors['text']
-        self._add_footer(slide6, "Prevention & Control - Challenges & Future")
+        for section_title, points, footer_text in prevention_slides:
+            self._add_topic_slides(section_title, points, 'accent', footer_text)
 
     def _add_footer(self, slide, text):
         """Add professional footer to slide"""
@@ -472,20 +502,18 @@ class ProfessionalSTHPresenter:
         print(f"📈 Visuals integrated: {len(self.visual_files)} images")
         print(f"📝 Content sections: {len(self.slide_content)} sources")
 
-def main():
-    """Generate the final professional PPTX presentation"""
-    script_dir = Path(__file__).parent
-    content_dir = script_dir  # Repository root
-    visuals_dir = script_dir / "Visual_Assets_Indian_Context" / "Generated_Charts"
-    output_file = script_dir / "STH_Medical_Teaching_Presentation.pptx"
+def deck_slide_cache(output_file, cache_dir=CACHE_DIR):
+    """Slide cache for an incremental build of this deck"""
+    return SlideCache(Path(output_file).stem, cache_dir,
+                      helpers=[ProfessionalSTHPresenter._setup_theme, ProfessionalSTHPresenter._add_footer])
 
-    print("🎯 Creating Professional STH Teaching Presentation...")
-    print("🎨 Applying Indian theme with saffron, green, navy colors")
-    print("📊 Integrating generated visualizations")
-    print("📝 Processing markdown content for slides")
 
-    # Create presenter
-    presenter = ProfessionalSTHPresenter(content_dir, visuals_dir)
+@profiled('final_presentation', default_stage='render')
+def build_presentation(output_file, content_dir, visuals_dir, slide_cache=None, image_dpi=DEFAULT_IMAGE_DPI,
+                       native_charts_data=None):
+    """Build and save the deck; with native_charts_data (a district workbook) charts are native PowerPoint charts"""
+    with stage('load'):
+        presenter = ProfessionalSTHPresenter(content_dir, visuals_dir, slide_cache, image_dpi)
 
     # Build presentation
     presenter.create_title_slide()
@@ -497,14 +525,60 @@ def main():
     presenter.create_content_slides()
     print("✓ Content slides generated from markdown")
 
-    presenter.create_visual_slides()
-    print("✓ Visual slides with Indian context data created")
+    if native_charts_data is not None:
+        sys.path.insert(0, str(GENERATOR_DIR))
+        from generate_indian_visuals import IndianSTHVisualizer  # pulls in matplotlib, but renders nothing
+
+        presenter.create_native_chart_slides(IndianSTHVisualizer(native_charts_data, visuals_dir))
+        print("✓ Native chart slides built from the state aggregates")
+    else:
+        presenter.create_visual_slides()
+        print("✓ Visual slides with Indian context data created")
 
     presenter.create_summary_slide()
     print("✓ Summary slide added")
 
     # Save presentation
-    presenter.save_presentation(output_file)
+    with stage('save'):
+        presenter.save_presentation(output_file)
+    if slide_cache is not None:
+        slide_cache.prune()
+        print(f"♻️ Reused {slide_cache.hits} cached slides, rebuilt {slide_cache.misses}")
+    return presenter
+
+
+def main():
+    """Generate the final professional PPTX presentation"""
+    script_dir = Path(__file__).parent
+    content_dir = script_dir  # Repository root
+    visuals_dir = script_dir / "Visual_Assets_Indian_Context" / "Generated_Charts"
+    output_file = script_dir / "STH_Medical_Teaching_Presentation.pptx"
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('--incremental', action='store_true',
+                        help="Reuse cached slides whose content and chart images are unchanged")
+    parser.add_argument('--cache-dir', type=Path, default=CACHE_DIR, help="Slide cache location")
+    parser.add_argument('--native-charts', action='store_true',
+                        help="Build editable PowerPoint charts from the state aggregates instead of embedding PNGs")
+    parser.add_argument('--data', type=Path, default=GENERATOR_DIR / "Indian_STH_Data.xlsx",
+                        help="District workbook for --native-charts")
+    parser.add_argument('--image-dpi', type=int, default=DEFAULT_IMAGE_DPI,
+                        help="Resample charts to this many pixels per inch of slide (0 keeps full resolution)")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    if args.profile:
+        enable_profiling(args.profile)
+
+    print("🎯 Creating Professional STH Teaching Presentation...")
+    print("🎨 Applying Indian theme with saffron, green, navy colors")
+    print("📊 Integrating generated visualizations")
+    print("📝 Processing markdown content for slides")
+    start = time.perf_counter()
+
+    slide_cache = deck_slide_cache(output_file, args.cache_dir) if args.incremental else None
+    build_presentation(output_file, content_dir, visuals_dir, slide_cache, args.image_dpi or None,
+                       args.data if args.native_charts else None)
+    print(f"⏱️ Built in {time.perf_counter() - start:.2f}s")
 
     print("\n🎉 Professional STH presentation complete!")
     print("=" * 50)
@@ -4,22 +4,39 @@ Direct PPTX Generator from Presentation_Slides_STH.md
 Creates a PowerPoint presentation that directly follows the slide content structure
 """
 
-import re
+import argparse
+import time
 from pathlib import Path
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 
+from sth_markdown import load_document, slides
+from sth_profile import profiled, stage, add_profile_argument, enable_profiling
+from sth_slide_cache import CACHE_DIR, SlideCache
+from sth_textfit import fit_bullets, text_area
+
 class DirectSlidePresenter:
-    def __init__(self, slides_md_path):
+    def __init__(self, slides_md_path, slide_cache=None):
         self.slides_md_path = Path(slides_md_path)
         self.presentation = Presentation()
+        self.slide_cache = slide_cache
 
         # Set professional slide dimensions and colors
         self._setup_theme()
+        self.body_area = text_area(self.presentation.slide_layouts[1].placeholders[1])
         self.slide_data = self._parse_slides_md()
 
+    def _add_slide(self, layout_index, fill, *args):
+        """Add a slide filled by fill(slide, *args), spliced from the slide cache when unchanged"""
+        layout = self.presentation.slide_layouts[layout_index]
+        if self.slide_cache is not None:
+            return self.slide_cache.add_slide(self.presentation, layout, fill, *args)
+        slide = self.presentation.slides.add_slide(layout)
+        fill(slide, *args)
+        return slide
+
     def _setup_theme(self):
         """Set up professional theme"""
         self.presentation.slide_width = Inches(13.33)
@@ -39,101 +56,60 @@ class DirectSlidePresenter:
         self.caption_font_size = Pt(16)
 
     def _parse_slides_md(self):
-        """Parse the Presentation_Slides_STH.md file to extract slide content"""
-        with open(self.slides_md_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        slides_data = []
-        current_slide = None
-        slide_content = []
-
-        lines = content.split('\n')
-
-        for line in lines:
-            line = line.strip()
-
-            # Skip headers and non-slide content
-            if line.startswith('#') or not line:
-                continue
-
-            # Check for slide markers: **Slide X: Title**
-            if line.startswith('**Slide ') and ':' in line:
-                # Save previous slide
-                if current_slide and slide_content:
-                    slides_data.append({
-                        'title': current_slide,
-                        'content': slide_content
-                    })
-
-                # Extract slide title
-                match = re.search(r'\*\*Slide \d+:\s*(.+?)\*\*', line)
-                if match:
-                    current_slide = match.group(1).strip()
-                    slide_content = []
-            elif current_slide and line.startswith('-'):
-                # Extract bullet points
-                bullet = line.lstrip('-').strip()
-                if bullet and not bullet.startswith('['):  # Skip image placeholders
-                    slide_content.append(bullet)
-
-        # Add final slide
-        if current_slide and slide_content:
-            slides_data.append({
-                'title': current_slide,
-                'content': slide_content
-            })
-
-        return slides_data
+        """Slides of Presentation_Slides_STH.md (marked **Slide X: Title**) that have bullet points"""
+        document = load_document(self.slides_md_path)
+        return [{'title': slide['title'], 'content': slide['bullets']}
+                for slide in slides(document) if slide['bullets']]
 
     def create_title_slide(self):
         """Create title slide from the first slide content"""
-        slide = self.presentation.slides.add_slide(self.presentation.slide_layouts[0])
-
-        # Find title slide content
-        for slide_data in self.slide_data:
-            if 'title' in slide_data['title'].lower() or 'soil transmitted' in slide_data['title'].lower():
-                title = slide.shapes.title
-                title.text = "Soil Transmitted Diseases (STH)"
-                title.text_frame.paragraphs[0].font.size = self.title_font_size
-                title.text_frame.paragraphs[0].font.bold = True
-                title.text_frame.paragraphs[0].font.color.rgb = self.colors['primary']
-
-                subtitle = slide.placeholders[1]
-                subtitle.text = "Comprehensive Teaching Module for MBBS 3rd Year Students"
-                subtitle.text_frame.paragraphs[0].font.size = self.subtitle_font_size
-                break
-        else:
-            # Default title slide
-            title = slide.shapes.title
-            title.text = "Soil Transmitted Diseases (STH)"
-            title.text_frame.paragraphs[0].font.size = self.title_font_size
+        has_title = any('title' in slide_data['title'].lower() or 'soil transmitted' in slide_data['title'].lower()
+                        for slide_data in self.slide_data)
+        self._add_slide(0, self._fill_title_slide, has_title)
+
+    def _fill_title_slide(self, slide, has_title):
+        title = slide.shapes.title
+        title.text = "Soil Transmitted Diseases (STH)"
+        title.text_frame.paragraphs[0].font.size = self.title_font_size
+        if not has_title:
+            return  # Default title slide
+
+        title.text_frame.paragraphs[0].font.bold = True
+        title.text_frame.paragraphs[0].font.color.rgb = self.colors['primary']
+
+        subtitle = slide.placeholders[1]
+        subtitle.text = "Comprehensive Teaching Module for MBBS 3rd Year Students"
+        subtitle.text_frame.paragraphs[0].font.size = self.subtitle_font_size
 
     def create_content_slides(self):
-        """Create slides directly from parsed slide data"""
+        """Create slides directly from parsed slide data, continuing bullets that overflow onto extra slides"""
         for slide_info in self.slide_data:
-            slide = self.presentation.slides.add_slide(self.presentation.slide_layouts[1])
-
-            # Set title
-            title = slide.shapes.title
-            title.text = slide_info['title']
-            title.text_frame.paragraphs[0].font.size = Pt(32)
-            title.text_frame.paragraphs[0].font.bold = True
-            title.text_frame.paragraphs[0].font.color.rgb = self.colors['secondary']
-
-            # Add content bullets
-            content_box = slide.placeholders[1]
-            content_box.text = ""  # Clear default text
-
-            for i, bullet in enumerate(slide_info['content'][:8]):  # Limit to 8 bullets per slide
-                if bullet:
-                    p = content_box.text_frame.add_paragraph()
-                    p.text = "• " + bullet
-                    p.font.size = self.body_font_size
-                    p.font.color.rgb = self.colors['text']
-                    p.level = 0
-
-            # Add footer
-            self._add_footer(slide, f"STH Module - {slide_info['title'][:20]}")
+            bullets = [bullet for bullet in slide_info['content'] if bullet]
+            for page, page_bullets in enumerate(fit_bullets(self.body_area, bullets, self.body_font_size)):
+                title = slide_info['title'] if page == 0 else f"{slide_info['title']} (cont.)"
+                self._add_slide(1, self._fill_content_slide, {'title': title, 'content': page_bullets})
+
+    def _fill_content_slide(self, slide, slide_info):
+        # Set title
+        title = slide.shapes.title
+        title.text = slide_info['title']
+        title.text_frame.paragraphs[0].font.size = Pt(32)
+        title.text_frame.paragraphs[0].font.bold = True
+        title.text_frame.paragraphs[0].font.color.rgb = self.colors['secondary']
+
+        # Add content bullets
+        content_box = slide.placeholders[1]
+        content_box.text = ""  # Clear default text
+
+        for bullet in slide_info['content']:
+            p = content_box.text_frame.add_paragraph()
+            p.text = "• " + bullet
+            p.font.size = self.body_font_size
+            p.font.color.rgb = self.colors['text']
+            p.level = 0
+
+        # Add footer
+        self._add_footer(slide, f"STH Module - {slide_info['title'][:20]}")
 
     def _add_footer(self, slide, text):
         """Add footer to slide"""
@@ -150,7 +126,9 @@ class DirectSlidePresenter:
 
     def create_summary_slide(self):
         """Create a final summary slide"""
-        slide = self.presentation.slides.add_slide(self.presentation.slide_layouts[1])
+        self._add_slide(1, self._fill_summary_slide)
+
+    def _fill_summary_slide(self, slide):
         title = slide.shapes.title
         title.text = "Summary - Key Learning Points"
         title.text_frame.paragraphs[0].font.size = Pt(36)
@@ -179,21 +157,17 @@ class DirectSlidePresenter:
         print(f"📊 Total slides: {len(self.presentation.slides)}")
         print("📝 Based on Presentation_Slides_STH.md structure")
 
-def main():
-    """Generate PPTX from Presentation_Slides_STH.md"""
-    script_dir = Path(__file__).parent
-    slides_md_file = script_dir / "Presentation_Slides_STH.md"
-    output_file = script_dir / "STH_Slides_Based_Presentation.pptx"
-
-    if not slides_md_file.exists():
-        print(f"❌ Slides markdown file not found: {slides_md_file}")
-        return
+def deck_slide_cache(output_file, cache_dir=CACHE_DIR):
+    """Slide cache for an incremental build of this deck"""
+    return SlideCache(Path(output_file).stem, cache_dir,
+                      helpers=[DirectSlidePresenter._setup_theme, DirectSlidePresenter._add_footer])
 
-    print("🎯 Creating PPTX presentation from Presentation_Slides_STH.md...")
-    print("📖 Parsing slide content and structure...")
 
-    # Create presenter
-    presenter = DirectSlidePresenter(slides_md_file)
+@profiled('slides_presentation', default_stage='render')
+def build_presentation(slides_md_file, output_file, slide_cache=None):
+    """Build and save the deck for a slides markdown file"""
+    with stage('load'):
+        presenter = DirectSlidePresenter(slides_md_file, slide_cache)
 
     # Build presentation
     presenter.create_title_slide()
@@ -206,7 +180,40 @@ def main():
     print("✓ Summary slide added")
 
     # Save
-    presenter.save_presentation(output_file)
+    with stage('save'):
+        presenter.save_presentation(output_file)
+    if slide_cache is not None:
+        slide_cache.prune()
+        print(f"♻️ Reused {slide_cache.hits} cached slides, rebuilt {slide_cache.misses}")
+    return presenter
+
+
+def main():
+    """Generate PPTX from Presentation_Slides_STH.md"""
+    script_dir = Path(__file__).parent
+    slides_md_file = script_dir / "Presentation_Slides_STH.md"
+    output_file = script_dir / "STH_Slides_Based_Presentation.pptx"
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('--incremental', action='store_true',
+                        help="Reuse cached slides whose markdown section is unchanged")
+    parser.add_argument('--cache-dir', type=Path, default=CACHE_DIR, help="Slide cache location")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    if args.profile:
+        enable_profiling(args.profile)
+
+    if not slides_md_file.exists():
+        print(f"❌ Slides markdown file not found: {slides_md_file}")
+        return
+
+    print("🎯 Creating PPTX presentation from Presentation_Slides_STH.md...")
+    print("📖 Parsing slide content and structure...")
+    start = time.perf_counter()
+
+    slide_cache = deck_slide_cache(output_file, args.cache_dir) if args.incremental else None
+    build_presentation(slides_md_file, output_file, slide_cache)
+    print(f"⏱️ Built in {time.perf_counter() - start:.2f}s")
 
     print("\n🎉 Presentation from slides markdown completed!")
     print("=" * 50)
@@ -0,0 +1,30 @@
+"""
+Page modules for the STH Learning Dashboard
+Each page lives in its own module and is imported the first time it is
+navigated to, so a session only pays for the libraries its pages use
+"""
+
+import importlib
+
+# Configure colors and styling
+INDIAN_COLORS = ['#FF9933', '#138808', '#000080', '#FFFFFF', '#FF0000']
+
+# Sidebar label -> (module, render function, inputs passed to it, progress key)
+PAGES = {
+    "🏠 Dashboard Overview": ('overview', 'render_dashboard_overview', ('sth_data', 'sth_cube'), None),
+    "📊 Epidemiology & Burden": ('epidemiology', 'render_epidemiology', ('sth_data', 'sth_cube'), 'epidemiology'),
+    "🦠 Etiology & Life Cycles": ('etiology', 'render_etiology', (), 'etiology'),
+    "🏥 Clinical Manifestations": ('clinical', 'render_clinical', (), 'clinical'),
+    "🔬 Diagnosis Methods": ('diagnosis', 'render_diagnosis', (), 'diagnosis'),
+    "💊 Treatment & Management": ('treatment', 'render_treatment', (), 'treatment'),
+    "🛡️ Prevention & Control": ('prevention', 'render_prevention_control', (), 'prevention'),  # Special emphasis
+    "🇮🇳 Indian Context": ('indian_context', 'render_indian_context', ('sth_cube',), None),
+    "📝 Assessment Quiz": ('quiz', 'render_quiz', (), 'quiz'),
+    "📚 References": ('references', 'render_references', ('content',), None),
+}
+
+
+def load_page(label):
+    """Import the page module for a sidebar label on first use and return its render function"""
+    module_name, function_name, _, _ = PAGES[label]
+    return getattr(importlib.import_module(f"{__name__}.{module_name}"), function_name)
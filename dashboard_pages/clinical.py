@@ -0,0 +1,99 @@
+"""
+Clinical Manifestations page of the STH Learning Dashboard
+"""
+
+import streamlit as st
+
+from sth_instrument import instrument
+
+
+@instrument
+def render_clinical():
+    """Render clinical manifestations section"""
+    st.title("🏥 Clinical Manifestations")
+
+    # Symptom categories
+    symptom_categories = st.tabs(["Asymptomatic Infection", "Pulmonary Phase", "Intestinal Phase", "Complications"])
+
+    with symptom_categories[0]:
+        st.subheader("🤫 Asymptomatic Infection")
+        st.markdown("""
+        **Incidence:** 60-80% of infected individuals show no symptoms
+
+        **Hidden Impact:**
+        - Subclinical morbidity in apparently healthy individuals
+        - Growth retardation and nutritional deficiencies
+        - Impaired cognitive development in children
+        - Reservoir for ongoing transmission
+
+        **Public Health Significance:**
+        - Silent carrier state maintains community transmission
+        - Economic impact through reduced productivity
+        - Long-term developmental consequences
+        """)
+
+    with symptom_categories[1]:
+        st.subheader("🫁 Pulmonary Phase (Loeffler's Syndrome)")
+        st.markdown("""
+        **Timing:** 2-4 weeks post-infection (Ascaris migration)
+
+        **Symptoms:**
+        - Dry cough and wheezing
+        - Chest pain and shortness of breath
+        - Low-grade fever (37.5-38.5°C)
+        - Blood eosinophilia (20-50%)
+
+        **Radiological Findings:**
+        - Transient pulmonary infiltrates
+        - Ground-glass opacities
+        - Usually resolves within 10-14 days
+
+        **Cause:** Larval migration through lung capillaries
+        """)
+
+    with symptom_categories[2]:
+        st.subheader("🫄 Intestinal Phase")
+        st.markdown("""
+        **Ascaris lumbricoides:**
+        - Abdominal pain and discomfort
+        - Nausea, vomiting, irregular bowel movements
+        - Malnutrition and growth retardation
+        - Subclinical protein-energy malnutrition
+
+        **Trichuris trichiura (Heavy infection):**
+        - Chronic diarrhea with mucus and blood
+        - Rectal prolapse (especially in children <5 years)
+        - Iron-deficiency anemia
+        - Failure to thrive
+
+        **Hookworm Disease:**
+        - Ground itch (pruritic dermatitis at penetration sites)
+        - Iron deficiency anemia (classic triad: anemia + edema + hypoproteinemia)
+        - General malaise and fatigue
+        - Increased susceptibility to other infections
+        """)
+
+    with symptom_categories[3]:
+        st.subheader("⚠️ Complications")
+        st.markdown("""
+        **High Worm Burden:**
+        - Intestinal obstruction (Ascaris volvulus)
+        - Severe anemia (<8 g/dL hemoglobin)
+        - Rectal prolapse with secondary infection
+
+        **Rare but Serious:**
+        - Biliary ascariasis (worms in bile ducts)
+        - Pancreatic ascariasis
+        - Perforation and peritonitis
+        - Toxic megacolon (Trichuris)
+
+        **Pregnancy Complications:**
+        - Severe anemia in pregnant women
+        - Low birth weight infants
+        - Increased maternal morbidity
+
+        **Secondary Infections:**
+        - Bacterial superinfection of damaged mucosa
+        - Viral gastroenteritis complications
+        - Helminth co-infections
+        """)
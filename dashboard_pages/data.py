@@ -0,0 +1,77 @@
+"""
+Cached data loaders shared by the STH Learning Dashboard pages
+"""
+
+import os
+from pathlib import Path
+
+import streamlit as st
+
+# sth_data, sth_cube and sth_markdown (pandas, numpy, pyarrow) are imported inside
+# the loaders, so text-only pages never pay for them
+from sth_instrument import instrument, track_cache
+from sth_profile import stage
+
+
+# Load data (use dummy data if real data unavailable)
+@instrument
+@st.cache_data
+@track_cache
+@stage('load')
+def load_sth_data():
+    """Load STH epidemiological data with fallback to dummy data"""
+    from sth_data import (load_district_table, generate_synthetic_districts, synthetic_shape,
+                          compact_district_frame)
+    try:
+        # Served from the shared Parquet cache; rebuilt only when the workbook changes
+        df = load_district_table(Path("Visual_Assets_Indian_Context/Indian_STH_Data.xlsx"))
+    except:
+        # Generate comprehensive dummy data (10 districts per state, vectorized and seeded)
+        df = generate_synthetic_districts(**synthetic_shape(15, 10), seed=42)
+
+    # Individual-level Kato-Katz survey (streamed in chunks) overrides district prevalence
+    survey_path = os.environ.get('STH_SURVEY_PATH')
+    if survey_path:
+        from sth_ingest import ingest_kato_katz, apply_survey_prevalence  # pulls in openpyxl
+        df = apply_survey_prevalence(df, ingest_kato_katz(survey_path))
+
+    # Categorical strings and 32-bit numbers keep the cached copy small
+    return compact_district_frame(df)
+
+# State × Risk_Category × Year aggregates, built once per data load
+@instrument
+@st.cache_data
+@track_cache
+@stage('aggregate')
+def load_sth_cube():
+    """Build the pre-aggregated prevalence cube from the district table"""
+    from sth_cube import PrevalenceCube
+    return PrevalenceCube.from_frame(load_sth_data())
+
+# Optional DuckDB backend for the epidemiology filters (STH_QUERY_BACKEND=duckdb)
+@instrument
+@st.cache_resource
+@track_cache
+def load_query_backend():
+    """Load the district table the dashboard is using into DuckDB, or None when not enabled"""
+    from sth_query import DuckDBBackend, backend_requested  # pulls in duckdb
+    if not backend_requested():
+        return None
+    # Same frame as the pandas path, so STH_SURVEY_PATH overrides and the
+    # synthetic fallback apply to DuckDB queries too
+    return DuckDBBackend.from_frame(load_sth_data())
+
+# Load content from markdown files
+@instrument
+@st.cache_data
+@track_cache
+def load_content():
+    """Load the course markdown files as parsed documents (see sth_markdown)"""
+    from sth_markdown import load_corpus, parse_markdown
+    content = load_corpus(Path('.'))
+    for filename in ('Student_Notes_STH.md', 'Presentation_Slides_STH.md'):
+        if filename not in content:
+            content[filename] = {'file': filename,
+                                 'nodes': list(parse_markdown([f"# {filename}", "Content not found."]))}
+
+    return content
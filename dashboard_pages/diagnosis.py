@@ -0,0 +1,120 @@
+"""
+Diagnosis Methods page of the STH Learning Dashboard
+"""
+
+import streamlit as st
+
+from sth_instrument import instrument
+
+
+@instrument
+def render_diagnosis():
+    """Render diagnosis section with laboratory methods"""
+    st.title("🔬 Diagnosis Methods")
+
+    # Interactive diagnostic workflow
+    st.subheader("🔍 Diagnostic Approach")
+
+    diagnosis_steps = st.expander("📋 Step-by-Step Diagnostic Process", expanded=True)
+    with diagnosis_steps:
+        st.markdown("""
+        1. **Clinical History:**
+           - Geographic location (endemic areas)
+           - Travel to tropical/subtropical regions
+           - Occupational exposure (farmers, miners)
+           - Behavioral factors (geophagia, poor hygiene)
+
+        2. **Physical Examination:**
+           - Nutritional status assessment
+           - Pallor (anemia)
+           - Abdominal tenderness
+           - Digital rectal examination for Trichuris
+
+        3. **Laboratory Diagnosis:**
+           - Stool examination (primary method)
+           - Blood tests (eosinophilia)
+           - Imaging (obstruction, biliary parasites)
+        """)
+
+    # Diagnostic methods
+    methods = st.tabs(["Stool Examination", "Concentration Techniques", "Advanced Methods"])
+
+    with methods[0]:
+        st.subheader("🎯 Direct Stool Examination")
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("""
+            **Direct Smear Method:**
+            - Fresh stool sample (pea-sized)
+            - Mix with saline on glass slide
+            - Cover with coverslip
+            - Examine under microscope (10x, 40x)
+
+            **Limitations:**
+            - Low sensitivity (detects heavy infections only)
+            - Requires experienced microscopist
+            - Time-consuming for population surveys
+            """)
+
+        with col2:
+            st.markdown("""
+            **Kato-Katz Technique (WHO Gold Standard):**
+            - Quantitative method for field surveys
+            - Template (41.7 mg stool) for volume standardization
+            - Glycerol-malachite green preserves eggs
+            - Increases sensitivity by 2-3 fold
+
+            **Egg Count Categories:**
+            - Light: 1-999 EPG (eggs per gram)
+            - Moderate: 1,000-9,999 EPG
+            - Heavy: ≥10,000 EPG
+            """)
+
+    with methods[1]:
+        st.subheader("🔬 Concentration Techniques")
+        st.markdown("""
+        **Formol-Ether Concentration:**
+        - Enhances detection sensitivity
+        - Suitable for low-intensity infections
+        - Requires laboratory equipment
+
+        **Harada-Mori Method:**
+        - Filtration technique
+        - Good for Trichuris detection
+        - Quantitative assessment possible
+
+        **Zinc Sulfate Flotation:**
+        - Density gradient method
+        - Superior for hookworm eggs
+        - Quick and reliable technique
+
+        **Multiple Samples Recommended:**
+        - Examine 3 consecutive stool samples
+        - Increases sensitivity to >90%
+        - Required for epidemiological surveys
+        """)
+
+    with methods[2]:
+        st.subheader("🧬 Advanced Diagnostic Methods")
+        st.markdown("""
+        **Molecular Diagnostics:**
+        - PCR for species identification
+        - Real-time PCR for quantitative assays
+        - LAMP (Loop-mediated isothermal amplification) for field use
+
+        **Serological Tests:**
+        - Antibody detection (limited clinical use)
+        - Not recommended for routine diagnosis
+        - Useful for epidemiological studies
+
+        **Imaging Techniques:**
+        - X-ray for pulmonary migration
+        - Ultrasound for biliary ascariasis
+        - CT/MRI for complications
+
+        **Emerging Technologies:**
+        - Smartphone microscopy
+        - Artificial intelligence for egg identification
+        - Portable molecular diagnostics
+        """)
@@ -0,0 +1,127 @@
+"""
+Epidemiology & Burden page of the STH Learning Dashboard
+"""
+
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+
+from dashboard_pages import INDIAN_COLORS
+from dashboard_pages.data import load_query_backend
+from sth_instrument import instrument, plotly_chart
+
+
+@st.fragment
+@instrument
+def render_epidemiology_charts(sth_cube):
+    """Filters and chart; runs as a fragment so widget changes rerun only this block"""
+    # Filter queries run as SQL when the DuckDB backend is enabled, else on the cube
+    aggregates = load_query_backend() or sth_cube
+    state_options = aggregates.states()
+
+    # Interactive filters
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        selected_states = st.multiselect(
+            "Select States",
+            options=state_options,
+            default=state_options[:5],
+            help="Choose states to visualize"
+        )
+
+    with col2:
+        selected_parasites = st.multiselect(
+            "Select Parasites",
+            options=['Prevalence_Ascaris', 'Prevalence_Trichuris', 'Prevalence_Hookworm'],
+            default=['Prevalence_Ascaris'],
+            format_func=lambda x: x.replace('Prevalence_', '').replace('_', ' '),
+            help="Choose parasites to display"
+        )
+
+    with col3:
+        chart_type = st.selectbox(
+            "Chart Type",
+            options=["Bar Chart", "Heatmap", "Scatter Plot", "Box Plot"],
+            help="Select visualization type"
+        )
+
+    # Per-state means for the selection
+    selected_means = aggregates.state_means(selected_parasites, states=selected_states)
+
+    st.markdown("---")
+
+    if chart_type == "Bar Chart":
+        # Comparative bar chart
+        fig = go.Figure()
+
+        for parasite in selected_parasites:
+            state_means = selected_means[parasite].sort_values(ascending=False)
+
+            fig.add_trace(go.Bar(
+                name=parasite.replace('Prevalence_', '').replace('_', ' '),
+                x=state_means.index,
+                y=state_means.values,
+                marker_color=INDIAN_COLORS[len(fig.data)]
+            ))
+
+        fig.update_layout(
+            title="State-wise Parasite Prevalence Comparison",
+            xaxis_title="States",
+            yaxis_title="Prevalence (%)",
+            barmode='group',
+            height=500
+        )
+        plotly_chart(fig, use_container_width=True)
+
+    elif chart_type == "Heatmap":
+        # Correlation heatmap
+        pivot_data = selected_means
+
+        fig = px.imshow(
+            pivot_data.T,
+            color_continuous_scale='YlOrRd',
+            title="Parasite Prevalence Heatmap by State"
+        )
+        fig.update_layout(height=400)
+        plotly_chart(fig, use_container_width=True)
+
+@instrument
+def render_epidemiology(sth_data, sth_cube):
+    """Render epidemiology section with interactive visualizations"""
+    st.title("📊 Epidemiology & Global Burden")
+
+    render_epidemiology_charts(sth_cube)
+
+    # Key epidemiological facts
+    st.markdown("---")
+    st.subheader("📋 Key Epidemiological Facts")
+
+    facts_col1, facts_col2 = st.columns(2)
+
+    with facts_col1:
+        st.markdown("""
+        **🌍 Global Burden:**
+        - 1.5 billion people infected (24% world population)
+        - Children: Highest intensity and burden
+        - Rural areas: 2-3x higher prevalence than urban
+
+        **💰 Economic Impact:**
+        - $7-12 billion annual global cost
+        - Lost productivity and healthcare expenses
+        - Prevention cost-effective: $0.02-0.50/treatment
+        """)
+
+    with facts_col2:
+        st.markdown("""
+        **🇮🇳 India Specific:**
+        - 225 million cases (highest global burden)
+        - Rural prevalence: 40-60%
+        - School-aged children: 18-25% infected
+
+        **🎯 Risk Factors:**
+        - Open defecation (OR: 2.3)
+        - Poverty and poor sanitation
+        - Geophagia in children
+        - Tropical climate conditions
+        """)
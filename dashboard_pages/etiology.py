@@ -0,0 +1,146 @@
+"""
+Etiology & Life Cycles page of the STH Learning Dashboard
+"""
+
+import streamlit as st
+import pandas as pd
+
+from sth_instrument import instrument
+
+
+@instrument
+def render_etiology():
+    """Render parasite information and life cycles"""
+    st.title("🦠 Etiology & Life Cycles")
+
+    st.markdown("""
+    Soil Transmitted Helminthiases (STH) are caused by three main nematode parasites:
+    intestinal roundworms, whipworms, and hookworms.
+    """)
+
+    # Interactive parasite selector
+    parasite = st.selectbox(
+        "Select Parasite for Detailed Information",
+        ["Ascaris lumbricoides", "Trichuris trichiura", "Hookworms (Necator americanus & Ancylostoma duodenale)"]
+    )
+
+    if parasite == "Ascaris lumbricoides":
+        st.subheader("🪱 Ascaris lumbricoides (Roundworm)")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("""
+            **📐 Biology:**
+            - Size: 20-35 cm (females), 15-30 cm (males)
+            - Lifespan: 12-18 months
+            - Egg size: 45-75 μm × 35-50 μm
+            - Egg appearance: Oval, golden-brown, mamillated shell
+
+            **🔄 Transmission:** Fecal-oral route
+            - Eggs ingested via contaminated food/water
+            - Eggs embryonate in soil (3-4 weeks)
+            - Infective stage: Embryonated eggs
+            """)
+
+        with col2:
+            st.markdown("""
+            **🌀 Life Cycle Stages:**
+
+            1. **Ingestion:** Embryonated eggs in contaminated food
+            2. **Hatching:** Larvae released in small intestine
+            3. **Migration:** Through blood to liver → lungs → trachea
+            4. **Swallowing:** Reach small intestine again
+            5. **Maturation:** Develop into adult worms (6-8 weeks)
+
+            **🌡️ Environmental Requirements:**
+            - Temperature: 22-33°C (optimal 28°C)
+            - Moisture: >20% soil humidity
+            - pH: 5.5-7.0
+            """)
+
+    elif parasite == "Trichuris trichiura":
+        st.subheader("🪱 Trichuris trichiura (Whipworm)")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("""
+            **📐 Biology:**
+            - Size: Females 3-5 cm, males 3-4 cm
+            - Lifespan: 1-3 years
+            - Appearance: Whip-like shape (thicker posterior)
+            - Egg size: 50-55 μm × 22-24 μm
+            - Egg appearance: Barrel-shaped with bipolar plugs
+
+            **🔄 Transmission:** Fecal-oral route
+            - Eggs excreted in feces
+            - Develop in soil (3-6 weeks)
+            - Infective stage: Embryonated eggs
+            """)
+
+        with col2:
+            st.markdown("""
+            **🌀 Life Cycle Stages:**
+
+            1. **Ingestion:** Embryonated eggs in contaminated food
+            2. **Hatching:** Larvae released in small intestine
+            3. **Penetration:** Local tissue invasion (no migration)
+            4. **Maturation:** Adults in cecum/colon
+            5. **Egg Production:** Females produce 5,000-10,000 eggs/day
+
+            **🌡️ Environmental Requirements:**
+            - Temperature: 25-30°C optimal
+            - Moisture: High humidity required
+            - Survival: Resistant to environmental stress
+            """)
+
+    elif "Hookworms" in parasite:
+        st.subheader("🪝 Hookworms (Necator americanus & Ancylostoma duodenale)")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("""
+            **📐 Biology:**
+            - Size: Females 0.7-1.3 cm, males smaller
+            - Lifespan: Necator (1-5 years), Ancylostoma (1 year)
+            - Appearance: C-shaped, cutting plates (Necator) or teeth (Ancylostoma)
+            - Egg size: 65-75 μm × 35-40 μm
+            - Egg appearance: Oval, thin-shelled, 4-8 celled larva
+
+            **🔄 Transmission:** Percutaneous
+            - Larvae penetrate skin (feet/hands)
+            - Migrate through bloodstream
+            - Infective stage: Filariform larvae
+            """)
+
+        with col2:
+            st.markdown("""
+            **🌀 Life Cycle Stages:**
+
+            1. **Egg Excretion:** In feces to soil
+            2. **Development:** Eggs → rhabditiform → filariform larvae (5-8 days)
+            3. **Skin Penetration:** Filariform larvae through skin
+            4. **Migration:** Bloodstream → lungs → swallowed
+            5. **Maturation:** Adults attach to small intestine mucosa
+            6. **Blood Feeding:** Daily blood loss 0.1-0.3 ml per worm
+
+            **🌡️ Environmental Requirements:**
+            - Temperature: 24-30°C optimal
+            - Soil type: Sandy, well-drained
+            - Moisture: Essential for larval development
+            """)
+
+    # Comparative table
+    st.markdown("---")
+    st.subheader("📊 Comparative Analysis")
+
+    comparison_data = pd.DataFrame({
+        'Aspect': ['Average Length', 'Lifespan', 'Egg Shape', 'Transmission', 'Development Time', 'Infective Stage'],
+        'Ascaris lumbricoides': ['20-35 cm (♀)', '12-18 months', 'Oval, mamillated', 'Fecal-oral', '3-4 weeks', 'Embryonated egg'],
+        'Trichuris trichiura': ['3-5 cm (♀)', '1-3 years', 'Barrel, bipolar plugs', 'Fecal-oral', '3-6 weeks', 'Embryonated egg'],
+        'Hookworms': ['0.7-1.3 cm (♀)', '1-5 years', 'Oval, thin shell', 'Percutaneous', '5-8 days', 'Filariform larva']
+    })
+
+    st.dataframe(comparison_data.set_index('Aspect'), use_container_width=True)
@@ -0,0 +1,67 @@
+"""
+Indian Context page of the STH Learning Dashboard
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from sth_instrument import instrument, plotly_chart
+
+PARASITE_COLUMNS = ['Prevalence_Ascaris', 'Prevalence_Trichuris', 'Prevalence_Hookworm']
+
+
+@instrument
+def render_indian_context(sth_cube):
+    """Indian context section"""
+    st.title("🇮🇳 Indian Context")
+
+    st.markdown("""
+    India bears the highest absolute burden of STH globally, with 225 million cases.
+    The National Deworming Day program represents one of the world's largest public health interventions.
+    """)
+
+    # State-wise data
+    st.subheader("📍 State-wise Disease Burden")
+
+    data = sth_cube.state_means(PARASITE_COLUMNS).rename(columns=lambda c: c.replace('Prevalence_', ''))
+    fig = px.bar(data.sort_values('Ascaris', ascending=False).reset_index(),
+                 x='State', y=['Ascaris', 'Trichuris', 'Hookworm'],
+                 title='Parasite Prevalence by State (%)',
+                 barmode='group')
+    fig.update_layout(xaxis_tickangle=-45)
+    plotly_chart(fig, use_container_width=True)
+
+    # Key Indian facts
+    st.subheader("🎯 Key Indian Facts")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.info("""
+        **Program Scale:**
+        - 540 million children covered annually
+        - 11.5 lakh schools participating
+        - 35 lakh ASHAs involved
+        - Treatment cost: ~₹100 crore/year
+        """)
+
+    with col2:
+        st.success("""
+        **Success Metrics:**
+        - Coverage reached 85%+ in recent years
+        - Mixed infection rates reduced by 20-30%
+        - Anemia prevalence decreased in target areas
+        - Integration with ICDS and MDM programs
+        """)
+
+    # Challenges and solutions
+    st.subheader("🎯 Challenges & Solutions")
+
+    challenges = pd.DataFrame({
+        'Challenge': ['Supply Chain Management', 'Community Acceptance', 'Monitoring Quality', 'Drug Resistance Emergence'],
+        'Solution': ['State-level planning coordination', 'IEC campaigns and mobilization', 'Real-time digital reporting', 'Alternative drug combinations'],
+        'Status': ['🔄 Ongoing', '✅ Achieved', '▶️ In Progress', '👁️ Under Surveillance']
+    })
+
+    st.dataframe(challenges, use_container_width=True)
@@ -0,0 +1,111 @@
+"""
+Dashboard Overview page of the STH Learning Dashboard
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from dashboard_pages import INDIAN_COLORS
+from sth_instrument import instrument, plotly_chart
+
+
+@instrument
+def render_dashboard_overview(sth_data, sth_cube):
+    """Render main dashboard overview"""
+    st.title("🦟 Soil Transmitted Diseases (STH)")
+    st.subheader("Interactive Learning Dashboard for MBBS 3rd Year Students")
+
+    # Key metrics row
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric(
+            label="Global Infected Population",
+            value="1.5 Billion",
+            delta="24% of world population"
+        )
+
+    with col2:
+        st.metric(
+            label="India Burden",
+            value="225 Million",
+            delta="Highest absolute burden"
+        )
+
+    with col3:
+        st.metric(
+            label="Annual DALYs",
+            value="4.98 Million",
+            delta="Economic impact: $7-12B"
+        )
+
+    with col4:
+        st.metric(
+            label="Prevention Success",
+            value="MDA + WASH",
+            delta="WHO strategy"
+        )
+
+    st.markdown("---")
+
+    # Interactive overview
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.subheader("📊 Epidemiological Overview")
+
+        # State-wise prevalence chart
+        fig = px.bar(
+            sth_cube.state_means(['Prevalence_Ascaris']).reset_index().sort_values('Prevalence_Ascaris', ascending=False).head(10),
+            x='State',
+            y='Prevalence_Ascaris',
+            color='State',
+            color_discrete_sequence=INDIAN_COLORS,
+            title='Top 10 States by Ascaris Prevalence'
+        )
+        fig.update_layout(showlegend=False)
+        plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        st.subheader("🦠 Major Parasites")
+        parasite_data = pd.DataFrame({
+            'Parasite': ['Ascaris lumbricoides', 'Trichuris trichiura', 'Hookworms'],
+            'Global Cases (M)': [807-1221, 604-795, 576-740],
+            'Size': ['20-35 cm', '3-5 cm', '0.7-1.3 cm']
+        })
+
+        for _, row in parasite_data.iterrows():
+            with st.expander(f"**{row['Parasite'].split()[0]}**"):
+                st.write(f"**Scientific Name:** {row['Parasite']}")
+                st.write(f"**Size:** {row['Size']}")
+                st.write(f"**Global Cases:** {row['Global Cases (M)']} million")
+
+    st.markdown("---")
+
+    # Learning path
+    st.subheader("🎓 Learning Path")
+    learning_modules = [
+        {"name": "Epidemiology & Burden", "icon": "📊", "status": "📖 15 min"},
+        {"name": "Etiology & Life Cycles", "icon": "🦠", "status": "📖 20 min"},
+        {"name": "Clinical Manifestations", "icon": "🏥", "status": "📖 18 min"},
+        {"name": "Diagnosis Methods", "icon": "🔬", "status": "📖 12 min"},
+        {"name": "Treatment & Management", "icon": "💊", "status": "📖 15 min"},
+        {"name": "Prevention & Control", "icon": "🛡️", "status": "📖 25 min"},  # Special emphasis
+        {"name": "Indian Context", "icon": "🇮🇳", "status": "📖 10 min"},
+        {"name": "Assessment Quiz", "icon": "📝", "status": "🧠 15 min"}
+    ]
+
+    cols = st.columns(4)
+    for i, module in enumerate(learning_modules):
+        with cols[i % 4]:
+            if st.button(f"{module['icon']} {module['name']}\n{module['status']}",
+                        key=f"module_{i}"):
+                st.rerun()
+                # Navigation would happen here
+
+    st.markdown("---")
+
+    # Recent activity placeholder
+    st.subheader("📈 Recent Activity")
+    st.info("Complete modules in order to track your learning progress!")
@@ -0,0 +1,102 @@
+"""
+Prevention & Control page of the STH Learning Dashboard
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from sth_instrument import instrument, plotly_chart
+
+
+@instrument
+def render_prevention_control():
+    """Special emphasis on prevention and control"""
+    st.title("🛡️ Prevention & Control Strategies")
+
+    st.markdown("""
+    **Special Focus Section:** Prevention is better than cure.
+    WHO's comprehensive approach combines multiple strategies.
+    """)
+
+    # Main strategies
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("💊 Mass Drug Administration (MDA)")
+        st.markdown("""
+        **Primary Strategy:**
+        - Target: School-age children (5-14 years)
+        - Frequency: 1-2 times annually
+        - Coverage: ≥75% required for effectiveness
+        - Drugs: Albendazole 400mg or Mebendazole 500mg
+
+        **India: National Deworming Day**
+        - February 10th and August 10th
+        - 540 million children targeted
+        - Free medication distribution
+        """)
+
+    with col2:
+        st.subheader("🚰 Water, Sanitation & Hygiene (WASH)")
+        st.markdown("""
+        **Sustainable Prevention:**
+        - Safe water supply and treatment
+        - Proper sanitation facilities
+        - Handwashing education
+        - Proper waste disposal
+
+        **F Diagram:**
+        Feces → Fields → Flies → Fingers → Food → Mouth
+        *Break this chain to prevent transmission*
+        """)
+
+    st.markdown("---")
+
+    # Health education and monitoring
+    col3, col4 = st.columns(2)
+
+    with col3:
+        st.subheader("📚 Health Education & Community")
+        st.markdown("""
+        **Key Messages:**
+        - Open defecation stops here
+        - Handwashing prevents disease
+        - Proper footwear against hookworms
+        - Clean food and water safety
+
+        **Community Involvement:**
+        - Local leadership engagement
+        - School-based education
+        - Religious institution partnerships
+        """)
+
+    with col4:
+        st.subheader("📊 Monitoring & Evaluation")
+        st.markdown("""
+        **WHO Targets 2030:**
+        - 75% prevalence reduction
+        - 90% treatment coverage
+        - Elimination in selected countries
+
+        **Success Indicators:**
+        - Parasitological surveys
+        - Treatment coverage reports
+        - Disease burden reduction
+        - Cost-benefit analysis
+        """)
+
+    # Progress visualization
+    st.markdown("---")
+    st.subheader("📈 MDA Progress in India")
+
+    progress_data = pd.DataFrame({
+        'Year': [2015, 2016, 2017, 2018, 2019, 2020, 2021, 2022],
+        'Coverage': [0, 15, 35, 55, 68, 75, 82, 85]
+    })
+
+    fig = px.line(progress_data, x='Year', y='Coverage',
+                  title='National Deworming Program Coverage (2015-2022)',
+                  markers=True)
+    fig.update_layout(yaxis_title='Coverage (%)')
+    plotly_chart(fig, use_container_width=True)
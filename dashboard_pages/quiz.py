@@ -0,0 +1,98 @@
+"""
+Assessment Quiz page of the STH Learning Dashboard
+"""
+
+import streamlit as st
+
+from sth_instrument import instrument
+
+
+@st.fragment
+@instrument
+def render_quiz_question(i, q):
+    """One quiz question; runs as a fragment so answering reruns only this question"""
+    st.subheader(f"Question {i+1}: {q['question']}")
+
+    key = f"q_{i}"
+    answer = st.radio(
+        f"Select your answer:",
+        q['options'],
+        key=key,
+        index=None
+    )
+
+    if answer is not None:
+        if q['options'].index(answer) == q['correct']:
+            st.success(f"✅ Correct! {q['explanation']}")
+            if not st.session_state.quiz_answers.get(key, False):
+                st.session_state.quiz_score += 1
+            st.session_state.quiz_answers[key] = True
+        else:
+            st.error(f"❌ Incorrect. Correct answer: {q['options'][q['correct']]}")
+            st.info(q['explanation'])
+    else:
+        st.info("Please select an answer to continue.")
+
+@instrument
+def render_quiz():
+    """Interactive assessment quiz"""
+    st.title("📝 Assessment Quiz")
+    st.markdown("Test your knowledge of Soil Transmitted Diseases")
+
+    if 'quiz_answers' not in st.session_state:
+        st.session_state.quiz_answers = {}
+    if 'quiz_score' not in st.session_state:
+        st.session_state.quiz_score = 0
+
+    questions = [
+        {
+            'question': 'Which parasite causes Loeffler\'s syndrome?',
+            'options': ['Ascaris lumbricoides', 'Trichuris trichiura', 'Hookworms', 'Strongyloides'],
+            'correct': 0,
+            'explanation': 'Ascaris larvae migrate through lungs causing pulmonary symptoms.'
+        },
+        {
+            'question': 'What is the WHO gold standard for STH diagnosis?',
+            'options': ['Direct smear', 'Kato-Katz technique', 'Blood film', 'Urine examination'],
+            'correct': 1,
+            'explanation': 'Kato-Katz provides quantitative egg counts for epidemiological surveys.'
+        },
+        {
+            'question': 'Which drug is safest for use in pregnancy?',
+            'options': ['Albendazole', 'Mebendazole', 'Pyrantel pamoate', 'Levamisole'],
+            'correct': 2,
+            'explanation': 'Pyrantel pamoate is Category A and safest during pregnancy.'
+        },
+        {
+            'question': 'What is India\'s National Deworming Day?',
+            'options': ['January 26', 'February 10 & August 10', 'May 5', 'August 15'],
+            'correct': 1,
+            'explanation': 'Twice annually on February 10th and August 10th, aligned with Republic Day and Independence Day.'
+        }
+    ]
+
+    score = 0
+    total_questions = len(questions)
+
+    for i, q in enumerate(questions):
+        render_quiz_question(i, q)
+
+    # Show final score
+    if st.button("Get Final Score", type="primary"):
+        st.markdown("---")
+        st.subheader("📊 Quiz Results")
+        final_score = sum(st.session_state.quiz_answers.values())
+        percentage = (final_score / total_questions) * 100
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Score", f"{final_score}/{total_questions}")
+        with col2:
+            st.metric("Percentage", f"{percentage:.1f}%")
+        with col3:
+            if percentage >= 80:
+                st.success("🏆 Excellent!")
+            elif percentage >= 60:
+                st.info("👍 Good effort!")
+            else:
+                st.warning("📚 Review materials and try again!")
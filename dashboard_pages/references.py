@@ -0,0 +1,58 @@
+"""
+References page of the STH Learning Dashboard
+"""
+
+import streamlit as st
+
+from sth_instrument import instrument
+from sth_markdown import section_lines
+
+
+@instrument
+def render_references(content):
+    """Render references section"""
+    st.title("📚 References & Additional Resources")
+
+    st.markdown("""
+    **Academic and Clinical References:**
+    """)
+
+    # Add reference categories as expandable sections
+    with st.expander("📖 WHO Guidelines", expanded=False):
+        st.markdown("""
+        - **WHO Guidelines for the Control of Soil-transmitted Helminth Infections** (2021)
+        - **Preventive Chemotherapy in Human Helminthiasis** (WHO)
+        - **Guidelines for Deworming Interventions** (WHO & UNICEF)
+        - **International Standards for Clinical Laboratory Methods** (WHO)
+        """)
+
+    with st.expander("🔬 Research Publications", expanded=False):
+        st.markdown("""
+        - **Global Burden of Disease Study 2019** - Parasitic Diseases Trends
+        - **STEM Project Publications** - MDA Impact Studies
+        - **Indian Deworming Program Evaluations** - HPC Publications
+        - **WHO Technical Reports** - Control Strategy Updates
+        """)
+
+    with st.expander("📊 Treatment Guidelines", expanded=False):
+        st.markdown("""
+        - **Manson's Tropical Diseases** - Chapter on Helminths
+        - **CDC Parasitic Diseases Guidelines** - Diagnostic Standards
+        - **Indian Academy of Pediatrics** - Pediatric Treatment Protocols
+        - **Essential Medicines List** - WHO Recommended Anthelmintics
+        """)
+
+    with st.expander("🇮🇳 Indian National Programs", expanded=False):
+        st.markdown("""
+        - **Ministry of Health & Family Welfare** - National Deworming Day
+        - **National Vector Borne Disease Control Programme** (NVBDCP)
+        - **National Health Mission** - Reproductive & Child Health
+        - **Ministry of Jal Shakti** - Clean Water Initiatives
+        """)
+
+    # Reading lists of the course files themselves
+    for filename, document in content.items():
+        for title, lines in section_lines(document).items():
+            if 'references' in title.lower():
+                with st.expander(f"📘 {title} ({filename})", expanded=False):
+                    st.markdown('\n'.join(lines))
@@ -0,0 +1,86 @@
+"""
+Treatment & Management page of the STH Learning Dashboard
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from sth_instrument import instrument, plotly_chart
+
+
+@instrument
+def render_treatment():
+    """Render treatment and management section"""
+    st.title("💊 Treatment & Management")
+
+    # Principal drugs
+    col1, col2 = st.columns([1, 2])
+
+    with col1:
+        st.subheader("🛡️ First-Line Anthelmintics")
+        drugs_data = pd.DataFrame({
+            'Drug': ['Albendazole', 'Mebendazole', 'Pyrantel Pamoate'],
+            'Adult Dose': ['400 mg single', '500 mg single', '10 mg/kg single'],
+            'Pregnancy Safety': ['Category C', 'Category C', 'Category A'],
+            'Efficacy': ['95-100%', '90-95%', '85-90%']
+        })
+        st.dataframe(drugs_data, use_container_width=True)
+
+    with col2:
+        st.subheader("📊 Comparative Efficacy")
+        efficacy_data = pd.DataFrame({
+            'Drug': ['Albendazole', 'Mebendazole', 'Pyrantel'],
+            'Ascaris': [95, 90, 85],
+            'Trichuris': [30, 90, 40],
+            'Hookworm': [70, 95, 90]
+        })
+
+        fig = px.bar(efficacy_data.melt(id_vars='Drug', var_name='Parasite', value_name='Efficacy'),
+                    x='Drug', y='Efficacy', color='Parasite',
+                    title='Anthelmintic Efficacy by Parasite',
+                    text_auto='.0f')
+        fig.update_layout(height=400)
+        plotly_chart(fig, use_container_width=True)
+
+    st.markdown("---")
+
+    # Special considerations
+    considerations = st.tabs(["Pregnancy", "Children", "Severe Cases", "Drug Resistance"])
+
+    with considerations[0]:
+        st.subheader("🤰 Treatment in Pregnancy")
+        st.markdown("""
+        **First Trimester:**
+        - Avoid routine treatment
+        - Treat only if symptomatic and benefits outweigh risks
+        - Mebendazole and albendazole: Category C (teratogenic potential)
+
+        **Second/Third Trimester:**
+        - Albendazole can be used after first trimester
+        - Pyrantel pamoate: Safest option (Category A)
+        - Iron supplementation essential alongside anthelmintic treatment
+
+        **WHO Recommendations:**
+        - Individualized risk-benefit assessment
+        - Focus on iron supplementation for anemia
+        - Delay elective treatment until after delivery when possible
+        """)
+
+    with considerations[1]:
+        st.subheader("👶 Pediatric Treatment")
+        st.markdown("""
+        **Children <2 Years:**
+        - Individual assessment required
+        - WHO recommends treatment in high-prevalence areas
+        - Age-appropriate dosing critical
+        - Close monitoring for adverse reactions
+
+        **School-Age Children:**
+        - Target population for MDA programs
+        - Regular deworming alongside other interventions
+        - Educational component essential
+        - Monitor growth and development
+
+        **Adolescent
+        """)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Pre-aggregated State × Risk_Category × Year cube for the district table
+Charts slice these sums instead of re-running groupby over every district
+"""
+
+import pandas as pd
+
+DIMENSIONS = ['State', 'Risk_Category', 'Year']
+PREVALENCE_COLUMNS = ['Prevalence_Ascaris', 'Prevalence_Trichuris',
+                      'Prevalence_Hookworm', 'Prevalence_Children']
+POPULATION_COLUMNS = ['Total_Population', 'Children_1_14']
+UNDATED_YEAR = 0  # Year key used when the source table has no Year column
+
+
+class PrevalenceCube:
+    """Materialised sums, counts and population weights per State × Risk_Category × Year
+
+    Each cell holds the district count, population totals and, per parasite,
+    the plain and population-weighted prevalence sums together with the
+    number and population of the districts that report that parasite. Means
+    for any slice are derived from these sums, so appending districts only
+    touches the cells they fall into; districts with a missing prevalence
+    are left out of that parasite's denominators.
+    """
+
+    def __init__(self, cells):
+        self.cells = cells
+
+    @classmethod
+    def from_frame(cls, districts):
+        """Build the cube from a district table"""
+        return cls(cls._aggregate(districts))
+
+    def append(self, districts):
+        """Fold newly appended district rows into the existing cells"""
+        self.cells = self.cells.add(self._aggregate(districts), fill_value=0)
+        return self
+
+    @staticmethod
+    def _aggregate(districts):
+        """Collapse district rows into cube cells"""
+        keys = pd.DataFrame({
+            'State': districts['State'].astype(str),
+            'Risk_Category': districts['Risk_Category'].astype(str),
+            'Year': districts['Year'] if 'Year' in districts else UNDATED_YEAR
+        }, index=districts.index)
+
+        population = districts['Total_Population'].astype('float64')
+        measures = {'count': 1.0}
+        for column in POPULATION_COLUMNS:
+            if column in districts:
+                measures[column] = districts[column].astype('float64')
+        for column in PREVALENCE_COLUMNS:
+            if column in districts:
+                prevalence = districts[column].astype('float64')
+                weighted = prevalence * population
+                measures[f'sum_{column}'] = prevalence
+                measures[f'count_{column}'] = prevalence.notna().astype('float64')
+                measures[f'wsum_{column}'] = weighted
+                measures[f'pop_{column}'] = population.where(weighted.notna())
+
+        cells = pd.DataFrame(measures, index=districts.index)
+        return cells.groupby([keys[d] for d in DIMENSIONS]).sum()
+
+    @property
+    def parasites(self):
+        return [c[len('sum_'):] for c in self.cells.columns if c.startswith('sum_')]
+
+    def states(self):
+        return sorted(self.cells.index.unique('State'))
+
+    def slice(self, states=None, risk_categories=None, years=None):
+        """Return the cells matching the given State / Risk_Category / Year filters"""
+        mask = pd.Series(True, index=self.cells.index)
+        for level, values in zip(DIMENSIONS, (states, risk_categories, years)):
+            if values is not None:
+                mask &= self.cells.index.get_level_values(level).isin(list(values))
+        return self.cells[mask.to_numpy()]
+
+    def state_means(self, parasites=None, weighted=False, **filters):
+        """Mean prevalence per state for the selected parasites
+
+        Unweighted means match groupby('State').mean() over the raw districts
+        (missing values skipped); weighted=True weights each district by
+        Total_Population.
+        """
+        return self._means(self.slice(**filters).groupby(level='State').sum(), parasites, weighted)
+
+    def national_means(self, parasites=None, weighted=False, **filters):
+        """Mean prevalence over all districts in the slice, as a Series by parasite"""
+        return self._means(self.slice(**filters).sum().to_frame().T, parasites, weighted).iloc[0]
+
+    def _means(self, sums, parasites, weighted):
+        parasites = self.parasites if parasites is None else list(parasites)
+        numerator, denominator = ('wsum_', 'pop_') if weighted else ('sum_', 'count_')
+        return pd.DataFrame({p: sums[numerator + p] / sums[denominator + p] for p in parasites},
+                            index=sums.index, columns=parasites)
+
+    def state_totals(self, columns=POPULATION_COLUMNS, **filters):
+        """Summed population columns per state"""
+        by_state = self.slice(**filters).groupby(level='State').sum()
+        return by_state[[c for c in columns if c in by_state]]
+
+    def risk_counts(self, **filters):
+        """Number of districts per Risk_Category"""
+        return self.slice(**filters).groupby(level='Risk_Category')['count'].sum()
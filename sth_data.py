@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Shared data-access layer for the Indian STH district workbook
+Converts Indian_STH_Data.xlsx once into a columnar Parquet cache that the
+dashboards and the visual generator read instead of re-parsing the workbook
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet cache is optional; fall back to reading the workbook
+    pa = None
+    pq = None
+
+# Default workbook location (relative to the repository root)
+DATA_PATH = Path(__file__).parent / "Visual_Assets_Indian_Context" / "Indian_STH_Data.xlsx"
+CACHE_DIR_NAME = ".sth_cache"
+
+# States and UTs used to label synthetic districts (highest-burden states first)
+INDIAN_STATES = [
+    'Maharashtra', 'Uttar Pradesh', 'Bihar', 'West Bengal', 'Madhya Pradesh',
+    'Tamil Nadu', 'Rajasthan', 'Karnataka', 'Gujarat', 'Odisha',
+    'Telangana', 'Punjab', 'Chhattisgarh', 'Haryana', 'Delhi',
+    'Andhra Pradesh', 'Kerala', 'Jharkhand', 'Assam', 'Uttarakhand',
+    'Himachal Pradesh', 'Jammu and Kashmir', 'Goa', 'Tripura', 'Meghalaya',
+    'Manipur', 'Nagaland', 'Arunachal Pradesh', 'Mizoram', 'Sikkim',
+    'Puducherry', 'Chandigarh', 'Ladakh', 'Andaman and Nicobar Islands',
+    'Dadra and Nagar Haveli and Daman and Diu', 'Lakshadweep'
+]
+RISK_CATEGORIES = ['High', 'Moderate', 'Low']
+
+# Compact dtypes for the district table; bump SCHEMA_VERSION when this changes
+# so existing Parquet caches are rebuilt with the new types
+SCHEMA_VERSION = 1
+DISTRICT_SCHEMA = {
+    'State': 'category',
+    'District': 'category',
+    'Risk_Category': 'category',
+    'Year': 'int16',
+    'Prevalence_Ascaris': 'float32',
+    'Prevalence_Trichuris': 'float32',
+    'Prevalence_Hookworm': 'float32',
+    'Prevalence_Children': 'float32',
+    'Sanitation_Index': 'float32',
+    'Treatment_Coverage': 'float32',
+    'Total_Population': 'int32',
+    'Children_1_14': 'int32'
+}
+
+
+def read_workbook(data_path):
+    """Parse the workbook directly (openpyxl, then xlrd), raising if neither engine can read it"""
+    try:
+        return pd.read_excel(data_path, engine='openpyxl')
+    except Exception:
+        return pd.read_excel(data_path, engine='xlrd')
+
+
+def compact_district_frame(df):
+    """Cast the district table to DISTRICT_SCHEMA dtypes (categorical strings, float32, int32)
+
+    Columns outside the schema are left untouched; integer columns with
+    missing values use the nullable equivalent instead of failing.
+    """
+    casts = {}
+    for column, dtype in DISTRICT_SCHEMA.items():
+        if column not in df or df[column].dtype == dtype:
+            continue
+        if dtype.startswith('int') and df[column].isna().any():
+            dtype = dtype.capitalize()
+        casts[column] = dtype
+    return df.astype(casts) if casts else df
+
+
+def _file_digest(path, chunk_size=1 << 20):
+    """SHA-256 of a file's contents, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cache_paths(data_path):
+    """Return (cache directory, manifest path) for a workbook"""
+    cache_dir = data_path.parent / CACHE_DIR_NAME
+    return cache_dir, cache_dir / f"{data_path.stem}.manifest.json"
+
+
+def _read_manifest(manifest_path):
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_json_atomic(path, payload):
+    tmp_path = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def cached_table_path(data_path=DATA_PATH):
+    """Return the Parquet cache file for a workbook, rebuilding it if the workbook changed
+
+    The cache is keyed on the workbook's mtime and size (cheap check) and its
+    SHA-256 content hash (authoritative check). A touched but unchanged file
+    only refreshes the manifest; a changed file is re-parsed once.
+    """
+    if pq is None:
+        raise ImportError("pyarrow is required for the Parquet cache")
+
+    data_path = Path(data_path)
+    stat = data_path.stat()
+    cache_dir, manifest_path = _cache_paths(data_path)
+    manifest = _read_manifest(manifest_path)
+    parquet_path = cache_dir / manifest.get('parquet', '')
+
+    current_schema = manifest.get('schema') == SCHEMA_VERSION
+
+    if (current_schema and manifest.get('mtime_ns') == stat.st_mtime_ns
+            and manifest.get('size') == stat.st_size and parquet_path.is_file()):
+        return parquet_path
+
+    content_hash = _file_digest(data_path)
+    parquet_path = cache_dir / f"{data_path.stem}-{content_hash[:16]}.parquet"
+
+    if not current_schema or manifest.get('sha256') != content_hash or not parquet_path.is_file():
+        df = compact_district_frame(read_workbook(data_path))
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = parquet_path.with_name(f'{parquet_path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, parquet_path)
+
+        # Drop cache files left behind by earlier versions of the workbook
+        for stale in cache_dir.glob(f"{data_path.stem}-*.parquet"):
+            if stale != parquet_path:
+                stale.unlink(missing_ok=True)
+
+    _write_json_atomic(manifest_path, {
+        'source': data_path.name,
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'sha256': content_hash,
+        'parquet': parquet_path.name,
+        'schema': SCHEMA_VERSION,
+    })
+    return parquet_path
+
+
+def load_district_table(data_path=DATA_PATH, columns=None):
+    """Load the district table through the Parquet cache
+
+    Columns are read from a memory-mapped Parquet file so only the requested
+    columns are materialised, already in DISTRICT_SCHEMA dtypes. Without
+    pyarrow the workbook is parsed and compacted directly. A .parquet path
+    (e.g. an existing cache file) is read as the district table itself.
+    """
+    if Path(data_path).suffix == '.parquet':
+        return compact_district_frame(pd.read_parquet(data_path, columns=columns))
+
+    if pq is None:
+        df = compact_district_frame(read_workbook(data_path))
+        return df[columns] if columns is not None else df
+
+    table = pq.read_table(cached_table_path(data_path), columns=columns, memory_map=True)
+    return compact_district_frame(table.to_pandas())
+
+
+def generate_synthetic_districts(n_states=15, districts_per_state=10, n_years=1,
+                                 seed=42, latest_year=2025):
+    """Generate a synthetic district table with one NumPy call per column
+
+    Rows are ordered state → district → year. Each district draws one base
+    prevalence that declines by ~6% per survey round, so multi-year tables
+    show the deworming trend. The same seed always yields the same table.
+    """
+    rng = np.random.default_rng(seed)
+    n_districts = n_states * districts_per_state
+    n_rows = n_districts * n_years
+
+    states = np.array(INDIAN_STATES[:n_states] +
+                      [f'State_{i + 1}' for i in range(len(INDIAN_STATES), n_states)])
+    # Full state slugs: three-letter prefixes collide (Uttar Pradesh / Uttarakhand, State_1 / State_10)
+    prefixes = np.array([re.sub(r'\W+', '_', state).strip('_') for state in states])
+    width = max(2, len(str(districts_per_state)))
+    numbers = np.char.zfill(np.arange(1, districts_per_state + 1).astype(str), width)
+    districts = np.char.add(np.char.add(np.repeat(prefixes, districts_per_state), '_'),
+                            np.tile(numbers, n_states))
+
+    # Per-district draws, repeated across survey rounds
+    prevalence_base = np.repeat(rng.uniform(8, 65, n_districts), n_years)
+    total_population = np.repeat(rng.uniform(300000, 3000000, n_districts), n_years)
+    children = np.repeat(rng.uniform(60000, 600000, n_districts), n_years)
+
+    years = np.tile(np.arange(latest_year - n_years + 1, latest_year + 1), n_districts)
+    prevalence_base = prevalence_base * 0.94 ** (latest_year - years)
+
+    def prevalence(scale, noise_sd):
+        return np.clip(prevalence_base * scale + rng.normal(0, noise_sd, n_rows), 0, 100)
+
+    return pd.DataFrame({
+        'State': np.repeat(states, districts_per_state * n_years),
+        'District': np.repeat(districts, n_years),
+        'Year': years,
+        'Prevalence_Ascaris': prevalence(1.0, 8),
+        'Prevalence_Trichuris': prevalence(0.75, 5),
+        'Prevalence_Hookworm': prevalence(0.85, 7),
+        'Prevalence_Children': prevalence(1.0, 12),
+        'Total_Population': total_population.astype(np.int64),
+        'Children_1_14': children.astype(np.int64),
+        'Risk_Category': rng.choice(RISK_CATEGORIES, size=n_rows, p=[0.35, 0.45, 0.2]),
+        'Sanitation_Index': rng.uniform(0.3, 0.95, n_rows),
+        'Treatment_Coverage': rng.uniform(0.4, 0.9, n_rows)
+    })
+
+
+def synthetic_shape(n_states, districts_per_state, n_years=1):
+    """Return the synthetic table shape, overridable as STH_SYNTHETIC_SHAPE="states,districts,years"
+
+    Lets load tests size the dummy-data fallback without editing the callers.
+    """
+    override = os.environ.get('STH_SYNTHETIC_SHAPE')
+    if override:
+        values = [int(v) for v in override.split(',')]
+        n_states, districts_per_state = values[0], values[1]
+        n_years = values[2] if len(values) > 2 else n_years
+    return {'n_states': n_states, 'districts_per_state': districts_per_state, 'n_years': n_years}
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Streaming ingest of individual-level Kato-Katz survey spreadsheets
+Reads egg counts in fixed-size chunks, classifies WHO infection intensity
+and folds the results into district-level prevalence aggregates
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+from sth_data import compact_district_frame
+
+# WHO intensity thresholds in eggs per gram (EPG): lower bounds of the
+# light, moderate and heavy classes for each species
+WHO_EPG_THRESHOLDS = {
+    'Ascaris': (1, 5000, 50000),
+    'Trichuris': (1, 1000, 10000),
+    'Hookworm': (1, 2000, 4000),
+}
+INTENSITY_CLASSES = ['Negative', 'Light', 'Moderate', 'Heavy']
+
+# WHO preventive-chemotherapy bands on any-STH prevalence (%)
+RISK_THRESHOLDS = (20, 50)
+
+DEFAULT_CHUNK_SIZE = 50000
+
+
+def iter_survey_chunks(survey_path, chunk_size=DEFAULT_CHUNK_SIZE, sheet_name=None):
+    """Yield the survey sheet as DataFrames of at most chunk_size rows
+
+    Uses openpyxl's read-only mode, so only one chunk of rows is held in
+    memory at a time. The first row of the sheet is taken as the header.
+    """
+    workbook = load_workbook(survey_path, read_only=True, data_only=True)
+    try:
+        sheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        rows = sheet.iter_rows(values_only=True)
+        header = [str(h).strip() for h in next(rows)]
+
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                yield pd.DataFrame.from_records(chunk, columns=header)
+                chunk = []
+        if chunk:
+            yield pd.DataFrame.from_records(chunk, columns=header)
+    finally:
+        workbook.close()
+
+
+def classify_intensity(epg, species):
+    """Vectorised WHO intensity class per egg count (0=negative ... 3=heavy, -1=blank or unreadable)"""
+    counts = pd.to_numeric(epg, errors='coerce').to_numpy(dtype='float64')
+    intensity = np.searchsorted(WHO_EPG_THRESHOLDS[species], np.nan_to_num(counts), side='right')
+    return np.where(np.isnan(counts), -1, intensity).astype(np.int8)
+
+
+def survey_keys(chunk):
+    """Grouping keys of survey rows: State, District and, when the sheet has one, Year"""
+    keys = [chunk['State'].astype(str), chunk['District'].astype(str)]
+    if 'Year' in chunk:
+        keys.append(pd.to_numeric(chunk['Year'], errors='coerce').astype('Int64'))
+    return keys
+
+
+def _aggregate_chunk(chunk, children_ages):
+    """Sum examined, positive and intensity counts per district for one chunk
+
+    A species counts an individual as examined only when its egg count can be
+    read; rows without any readable count are left out entirely.
+    """
+    measures = {}
+    examined_any = np.zeros(len(chunk), dtype=bool)
+    any_positive = np.zeros(len(chunk), dtype=bool)
+
+    for species in WHO_EPG_THRESHOLDS:
+        column = f'{species}_EPG'
+        if column not in chunk:
+            continue
+        intensity = classify_intensity(chunk[column], species)
+        examined = intensity >= 0
+        positive = intensity > 0
+        examined_any |= examined
+        any_positive |= positive
+        measures[f'Examined_{species}'] = examined
+        measures[f'Positive_{species}'] = positive
+        measures[f'Moderate_{species}'] = intensity == 2
+        measures[f'Heavy_{species}'] = intensity == 3
+
+    measures['Examined'] = examined_any
+    measures['Positive_Any'] = any_positive
+    if 'Age' in chunk:
+        age = pd.to_numeric(chunk['Age'], errors='coerce').to_numpy()
+        is_child = (age >= children_ages[0]) & (age <= children_ages[1]) & examined_any
+        measures['Examined_Children'] = is_child
+        measures['Positive_Children'] = is_child & any_positive
+
+    counts = pd.DataFrame(measures, index=chunk.index).astype('int64')
+    return counts.groupby(survey_keys(chunk), dropna=False).sum()
+
+
+def summarise_counts(totals):
+    """Turn accumulated district counts into the Prevalence_* columns the dashboards use
+
+    Districts where nobody has a readable egg count are dropped.
+    """
+    totals = totals[totals['Examined'] > 0]
+    summary = pd.DataFrame(index=totals.index)
+    examined = totals['Examined']
+
+    for species in WHO_EPG_THRESHOLDS:
+        if f'Positive_{species}' not in totals:
+            continue
+        # Each species is divided by the individuals with a readable count for it
+        species_examined = totals[f'Examined_{species}'].where(totals[f'Examined_{species}'] > 0)
+        summary[f'Prevalence_{species}'] = 100 * totals[f'Positive_{species}'] / species_examined
+        summary[f'Moderate_Heavy_{species}'] = (
+            100 * (totals[f'Moderate_{species}'] + totals[f'Heavy_{species}']) / species_examined)
+
+    if 'Positive_Children' in totals:
+        children = totals['Examined_Children'].where(totals['Examined_Children'] > 0)
+        summary['Prevalence_Children'] = 100 * totals['Positive_Children'] / children
+    summary['Prevalence_Any'] = 100 * totals['Positive_Any'] / examined
+    summary['Examined'] = totals['Examined']
+
+    summary['Risk_Category'] = pd.cut(summary['Prevalence_Any'],
+                                      bins=[-np.inf, RISK_THRESHOLDS[0], RISK_THRESHOLDS[1], np.inf],
+                                      labels=['Low', 'Moderate', 'High'], right=False).astype(str)
+    return summary.reset_index()
+
+
+def ingest_kato_katz(survey_path, chunk_size=DEFAULT_CHUNK_SIZE, sheet_name=None,
+                     children_ages=(1, 14)):
+    """Stream an individual-level Kato-Katz sheet into a district summary
+
+    Expects State, District and per-species <Species>_EPG columns (Ascaris_EPG,
+    Trichuris_EPG, Hookworm_EPG); an optional Age column adds
+    Prevalence_Children and an optional Year column keeps survey rounds apart.
+    Blank or non-numeric egg counts are not counted as examined. Only
+    per-district counters are kept between chunks.
+    """
+    totals = None
+    for chunk in iter_survey_chunks(survey_path, chunk_size, sheet_name):
+        counts = _aggregate_chunk(chunk, children_ages)
+        totals = counts if totals is None else totals.add(counts, fill_value=0)
+
+    if totals is None:
+        raise ValueError(f"No survey rows found in {survey_path}")
+    totals.index.names = ['State', 'District', 'Year'][:totals.index.nlevels]
+    return summarise_counts(totals)
+
+
+def apply_survey_prevalence(districts, summary):
+    """Overwrite the district table's Prevalence_* and Risk_Category columns from a survey summary
+
+    The table has one row per district and Year, so each survey row updates
+    the year given in its Year column, or the table's latest year when the
+    survey has none. Districts not covered by the survey keep their existing
+    values; surveyed districts missing from the table are appended.
+    """
+    key = ['State', 'District']
+    columns = [c for c in summary.columns if c.startswith('Prevalence_') and c != 'Prevalence_Any']
+    columns.append('Risk_Category')
+
+    summary = summary.copy()
+    if 'Year' in districts:
+        key.append('Year')
+        latest = int(districts['Year'].max())
+        years = summary['Year'] if 'Year' in summary else pd.Series(pd.NA, index=summary.index)
+        summary['Year'] = years.fillna(latest).astype('int64')
+
+    # Plain strings and float64 so survey values can be written into compact columns
+    casts = {c: str for c in ['State', 'District', 'Risk_Category']}
+    casts.update({c: 'float64' for c in columns if c in districts and c != 'Risk_Category'})
+    if 'Year' in key:
+        casts['Year'] = 'int64'
+    updated = districts.astype(casts).set_index(key)
+    survey = summary.set_index(key)[columns]
+    updated = updated.reindex(updated.index.union(survey.index))
+    for column in columns:
+        if column not in updated:
+            updated[column] = np.nan
+    updated.update(survey)
+    return compact_district_frame(updated.reset_index())
+
+
+def main():
+    """Summarise a Kato-Katz survey workbook into district prevalence"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('survey', type=Path, help="Individual-level Kato-Katz .xlsx sheet")
+    parser.add_argument('-o', '--output', type=Path,
+                        help="Write the district summary (.csv, .parquet or .xlsx)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--sheet', help="Worksheet name (default: first sheet)")
+    args = parser.parse_args()
+
+    summary = ingest_kato_katz(args.survey, args.chunk_size, args.sheet)
+    print(f"✓ {int(summary['Examined'].sum()):,} individuals across {len(summary)} districts")
+
+    if args.output:
+        suffix = args.output.suffix.lower()
+        if suffix == '.parquet':
+            summary.to_parquet(args.output, index=False)
+        elif suffix in ('.xlsx', '.xls'):
+            summary.to_excel(args.output, index=False)
+        else:
+            summary.to_csv(args.output, index=False)
+        print(f"📁 District summary saved to: {args.output}")
+    else:
+        print(summary.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
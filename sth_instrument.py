@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Opt-in render instrumentation for the Streamlit dashboards
+Set STH_INSTRUMENT=1 to time loaders and render_* pages, record st.cache_data
+hits/misses and Plotly payload sizes, and append each record to a JSON-lines log
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import streamlit as st
+
+LOG_PATH = Path(os.environ.get('STH_INSTRUMENT_LOG', 'sth_diagnostics.jsonl'))
+MAX_SESSION_RECORDS = 200
+
+_local = threading.local()
+_log_lock = threading.Lock()
+
+
+def enabled():
+    return os.environ.get('STH_INSTRUMENT', '').lower() in ('1', 'true', 'yes')
+
+
+def _session_id():
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+        return ctx.session_id if ctx else None
+    except Exception:
+        return None
+
+
+def _active_records():
+    if not hasattr(_local, 'records'):
+        _local.records = []
+    return _local.records
+
+
+def track_cache(func):
+    """Place directly under @st.cache_data: marks the enclosing call as a cache miss"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        records = _active_records()
+        if records:
+            records[-1]['cache'] = 'miss'
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def instrument(func):
+    """Record wall time (and cache hit/miss for cached loaders) of each call when enabled"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not enabled():
+            return func(*args, **kwargs)
+
+        record = {'name': func.__name__, 'cache': None, 'figure_bytes': 0, 'figures': 0}
+        if hasattr(func, 'clear'):  # st.cache_data / st.cache_resource wrapped function
+            record['cache'] = 'hit'
+        records = _active_records()
+        records.append(record)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record['wall_ms'] = round((time.perf_counter() - start) * 1000, 2)
+            records.pop()
+            _store(record)
+    return wrapper
+
+
+def plotly_chart(fig, **kwargs):
+    """st.plotly_chart that also records the figure's serialized size when enabled"""
+    if enabled():
+        size = len(fig.to_json().encode('utf-8'))
+        for record in _active_records():
+            record['figure_bytes'] += size
+            record['figures'] += 1
+    return st.plotly_chart(fig, **kwargs)
+
+
+def _store(record):
+    """Keep the record for the sidebar panel and append it to the JSON-lines log"""
+    record.update({'ts': time.time(), 'session': _session_id()})
+    try:
+        history = st.session_state.setdefault('_diagnostics', [])
+        history.append(record)
+        del history[:-MAX_SESSION_RECORDS]
+    except Exception:
+        pass  # Outside a script run (e.g. cache warm-up) there is no session state
+
+    with _log_lock:
+        with open(LOG_PATH, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + '\n')
+
+
+def render_diagnostics_panel():
+    """Sidebar expander with this session's recent timings (only shown when enabled)"""
+    if not enabled():
+        return
+    history = st.session_state.get('_diagnostics', [])
+    with st.expander("🩺 Diagnostics", expanded=False):
+        if not history:
+            st.caption("No timings recorded yet.")
+            return
+        st.dataframe(
+            [{k: r.get(k) for k in ('name', 'wall_ms', 'cache', 'figures', 'figure_bytes')}
+             for r in reversed(history)],
+            use_container_width=True
+        )
+        st.caption(f"Appending to {LOG_PATH}")
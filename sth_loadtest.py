@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Concurrent-session load test for the Streamlit dashboards
+Drives N simulated students through every sidebar page with
+streamlit.testing.v1.AppTest (changing the epidemiology filters and
+answering the quiz on the way) and reports p50/p95/p99 rerun latency
+and the peak RSS reached while each page reran
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Not available on Windows; peak RSS is then reported as n/a
+    resource = None
+
+os.environ.setdefault('STREAMLIT_LOGGER_LEVEL', 'error')  # Keep deprecation notices out of the report
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parent
+DASHBOARDS = {
+    'learning': ROOT / 'STH_Learning_Dashboard.py',
+    'complete': ROOT / 'STH_Dashboard_Complete.py',
+}
+PERCENTILES = (50, 95, 99)
+
+
+def peak_rss_mb():
+    """Process high-water RSS in MB (ru_maxrss is KB on Linux, bytes on macOS)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def reset_peak_rss():
+    """Start a new peak-RSS window (Linux only); returns False where the high-water mark cannot be reset"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def window_peak_rss_mb():
+    """Peak RSS in MB since the last reset_peak_rss (VmHWM), or None when unavailable"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+
+def _by_label(widgets, label):
+    return next((w for w in widgets if w.label == label), None)
+
+
+def student_session(app_path, rng, timeout):
+    """Generator for one simulated student; each step performs one rerun and yields (page, action)
+
+    The student opens the app, then visits every page in the sidebar
+    selectbox. On a page with epidemiology filters they pick states,
+    parasites and each chart type; on the quiz they answer every question
+    and ask for the final score.
+    """
+    at = AppTest.from_file(str(app_path), default_timeout=timeout)
+    at.run()
+    navigator = at.sidebar.selectbox[0]
+    pages = list(navigator.options)
+    yield pages[0], 'open'
+
+    for page in pages:
+        at.sidebar.selectbox[0].select(page).run()
+        yield page, 'navigate'
+
+        states = _by_label(at.multiselect, "Select States")
+        if states is not None:
+            k = min(len(states.options), int(rng.integers(2, 7)))
+            states.set_value(list(rng.choice(states.options, size=k, replace=False))).run()
+            yield page, 'filter states'
+
+            parasites = _by_label(at.multiselect, "Select Parasites")
+            k = int(rng.integers(1, len(parasites.options) + 1))
+            parasites.set_value(list(rng.choice(parasites.options, size=k, replace=False))).run()
+            yield page, 'filter parasites'
+
+            for chart_type in _by_label(at.selectbox, "Chart Type").options:
+                _by_label(at.selectbox, "Chart Type").select(chart_type).run()
+                yield page, 'chart type'
+
+        questions = [r for r in at.radio if str(r.key).startswith('q_')]
+        for question in questions:
+            at.radio(key=question.key).set_value(rng.choice(question.options)).run()
+            yield page, 'answer'
+        if questions:
+            score = next((b for b in at.button if b.label == "Get Final Score"), None)
+            if score is not None:
+                score.click().run()
+                yield page, 'final score'
+
+        if at.exception:
+            raise RuntimeError(f"{app_path.name} raised on {page}: {at.exception[0].message}")
+
+
+def run_load_test(app_path, n_sessions, seed=0, timeout=120):
+    """Interleave n_sessions students step by step and time every rerun
+
+    AppTest cannot drive sessions from parallel threads (each run owns the
+    global Streamlit runtime), so sessions take turns one rerun at a time
+    inside this process. They share st.cache_data and process memory
+    exactly as concurrent users of one Streamlit server would.
+
+    The high-water mark is reset before every rerun, so a page's peak RSS is
+    the most the process held while that page ran rather than everything
+    before it. Where it cannot be reset (not Linux) the per-page peak is n/a.
+    """
+    sessions = [student_session(app_path, np.random.default_rng(seed + i), timeout)
+                for i in range(n_sessions)]
+    samples = {}
+    run_peak = peak_rss_mb()  # Resetting the window also resets ru_maxrss, so the run's peak is tracked here
+    start = time.perf_counter()
+
+    while sessions:
+        for session in list(sessions):
+            windowed = reset_peak_rss()
+            step_start = time.perf_counter()
+            try:
+                page, action = next(session)
+            except StopIteration:
+                sessions.remove(session)
+                continue
+            page_samples = samples.setdefault(page, {'latency_ms': [], 'actions': set(), 'peak_rss_mb': None})
+            page_samples['latency_ms'].append((time.perf_counter() - step_start) * 1000)
+            page_samples['actions'].add(action)
+            step_peak = window_peak_rss_mb() if windowed else None
+            if step_peak is not None:
+                page_samples['peak_rss_mb'] = max(page_samples['peak_rss_mb'] or 0, step_peak)
+                run_peak = max(run_peak or 0, step_peak)
+
+    wall = time.perf_counter() - start
+    pages = {}
+    for page, page_samples in samples.items():
+        latencies = np.array(page_samples['latency_ms'])
+        pages[page] = {
+            'reruns': len(latencies),
+            'actions': sorted(page_samples['actions']),
+            **{f'p{p}_ms': round(float(np.percentile(latencies, p)), 1) for p in PERCENTILES},
+            'max_ms': round(float(latencies.max()), 1),
+            'peak_rss_mb': page_samples['peak_rss_mb'],
+        }
+    reruns = sum(page['reruns'] for page in pages.values())
+    return {
+        'app': app_path.name,
+        'sessions': n_sessions,
+        'reruns': reruns,
+        'wall_s': round(wall, 2),
+        'reruns_per_s': round(reruns / wall, 1),
+        'peak_rss_mb': max(run_peak or 0, peak_rss_mb() or 0) or None,
+        'pages': pages,
+    }
+
+
+def print_report(report):
+    """Print one dashboard's per-page latency table"""
+    print(f"\n📊 {report['app']}: {report['sessions']} sessions, {report['reruns']} reruns "
+          f"in {report['wall_s']}s ({report['reruns_per_s']} reruns/s), "
+          f"process peak RSS {report['peak_rss_mb'] or 'n/a'} MB")
+    print(f"   {'Page':<32}{'reruns':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'rerun peak MB':>15}")
+    for page, stats in report['pages'].items():
+        rss = stats['peak_rss_mb'] if stats['peak_rss_mb'] is not None else 'n/a'
+        print(f"   {page:<32}{stats['reruns']:>7}{stats['p50_ms']:>9}{stats['p95_ms']:>9}"
+              f"{stats['p99_ms']:>9}{rss:>15}")
+
+
+def main():
+    """Load-test the STH dashboards with simulated concurrent sessions"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('-n', '--sessions', type=int, default=10, help="Simulated students per dashboard")
+    parser.add_argument('--app', choices=['both', *DASHBOARDS], default='both')
+    parser.add_argument('--seed', type=int, default=0, help="Seed for the students' widget choices")
+    parser.add_argument('--timeout', type=float, default=120, help="Per-rerun timeout in seconds")
+    parser.add_argument('--json', type=Path, help="Also write the report to this JSON file")
+    parser.add_argument('--emit-json', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # The dashboards resolve their data and markdown files relative to the repository root
+    os.chdir(ROOT)
+
+    if args.app == 'both':
+        # Peak RSS is a process high-water mark, so each dashboard runs in its own
+        # process; otherwise the second would inherit the first one's peak
+        reports = []
+        for name in DASHBOARDS:
+            result = subprocess.run(
+                [sys.executable, __file__, '--app', name, '-n', str(args.sessions),
+                 '--seed', str(args.seed), '--timeout', str(args.timeout), '--emit-json'],
+                capture_output=True, text=True, check=True)
+            reports.append(json.loads(result.stdout.splitlines()[-1]))
+    else:
+        reports = [run_load_test(DASHBOARDS[args.app], args.sessions, args.seed, args.timeout)]
+
+    if args.emit_json:
+        print(json.dumps(reports[0]))
+        return
+
+    for report in reports:
+        print_report(report)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(reports, f, indent=2)
+        print(f"\n📁 Report saved to: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
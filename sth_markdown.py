@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Shared markdown parser for the STH course files
+Turns each course markdown file into a flat list of nodes (headings, slide
+markers, bullets, image placeholders, text) in one pass over its lines, and
+caches the result as JSON so the presentation scripts and the dashboards
+parse a file once per change
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+
+CACHE_DIR_NAME = ".sth_cache"  # Shared with sth_data's Parquet cache
+
+# Bump when the node format changes so cached documents are re-parsed
+AST_VERSION = 1
+
+COURSE_FILES = [
+    'Module_1_Epidemiology_STH.md',
+    'Module_2_Etiology_Life_Cycle_STH.md',
+    'Module_3_Clinical_Manifestations_STH.md',
+    'Module_4_Diagnosis_STH.md',
+    'Module_5_Treatment_Management_STH.md',
+    'Module_6_Prevention_Control_STH.md',
+    'Student_Notes_STH.md',
+    'Presentation_Slides_STH.md',
+    'Case_Studies_Scenarios_STH.md',
+    'Practical_Exercises_Activities_STH.md',
+    'Assessment_Materials_STH.md',
+    'Reference_Materials_Further_Reading_STH.md',
+    'NotebookLM_VideoScript.md',
+]
+
+SLIDE_MARKER = re.compile(r'\*\*Slide (\d+):\s*(.+?)\*\*')
+IMAGE_LINK = re.compile(r'!\[([^\]]*)\]\(([^)]*)\)')
+
+
+def parse_node(raw):
+    """Classify one markdown line as a node dict; 'raw' keeps the line as written"""
+    line = raw.strip()
+    if not line:
+        return {'type': 'blank', 'raw': raw}
+    if line.startswith('#'):
+        return {'type': 'heading', 'raw': raw, 'level': len(line) - len(line.lstrip('#')),
+                'title': line.lstrip('#').strip()}
+    if line.startswith('**Slide ') and ':' in line:
+        marker = SLIDE_MARKER.search(line)
+        if marker:
+            return {'type': 'slide', 'raw': raw, 'number': int(marker.group(1)),
+                    'title': marker.group(2).strip()}
+    if line.startswith('-'):
+        text = line.lstrip('-').strip()
+        if not text:
+            return {'type': 'rule', 'raw': raw}
+        if text.startswith('['):
+            return {'type': 'image', 'raw': raw, 'alt': text.strip('[]')}
+        return {'type': 'bullet', 'raw': raw, 'depth': (len(raw) - len(raw.lstrip())) // 2, 'text': text}
+    image = IMAGE_LINK.fullmatch(line)
+    if image:
+        return {'type': 'image', 'raw': raw, 'alt': image.group(1), 'src': image.group(2)}
+    if line.startswith('[') and line.endswith(']'):
+        return {'type': 'image', 'raw': raw, 'alt': line[1:-1]}
+    return {'type': 'text', 'raw': raw}
+
+
+def parse_markdown(lines):
+    """Yield one node per line of an iterable of lines"""
+    for raw in lines:
+        yield parse_node(raw.rstrip('\n'))
+
+
+def _read_cache(cache_path):
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def load_document(path):
+    """Parsed document for a markdown file, re-parsed only when the file changed
+
+    The cache is keyed like sth_data's Parquet cache: mtime and size as the
+    cheap check, the SHA-256 of the content as the authoritative one.
+    """
+    path = Path(path)
+    stat = path.stat()
+    cache_dir = path.parent / CACHE_DIR_NAME / "markdown"
+    cache_path = cache_dir / f"{path.name}.json"
+    cached = _read_cache(cache_path)
+
+    current = cached.get('version') == AST_VERSION
+    if current and cached.get('mtime_ns') == stat.st_mtime_ns and cached.get('size') == stat.st_size:
+        return cached
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    content_hash = hashlib.sha256(data).hexdigest()
+    if current and cached.get('sha256') == content_hash:
+        document = cached
+    else:
+        # Universal newlines, as when the file is opened in text mode
+        text = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        document = {'file': path.name, 'sha256': content_hash, 'version': AST_VERSION,
+                    'nodes': list(parse_markdown(text.split('\n')))}
+    document.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(document, f)
+    os.replace(tmp_path, cache_path)
+    return document
+
+
+def load_corpus(content_dir, files=COURSE_FILES):
+    """Parsed documents for the course files present in content_dir, by file name"""
+    content_dir = Path(content_dir)
+    return {name: load_document(content_dir / name) for name in files if (content_dir / name).exists()}
+
+
+def document_text(document):
+    """The markdown source of a parsed document"""
+    return '\n'.join(node['raw'] for node in document['nodes'])
+
+
+def section_lines(document):
+    """Non-blank lines under each heading, by heading title (headings without content are left out)"""
+    sections = {}
+    title, lines = None, []
+    for node in document['nodes']:
+        if node['type'] == 'heading':
+            if title and lines:
+                sections[title] = lines
+            title, lines = node['title'], []
+        elif title and node['type'] != 'blank':
+            lines.append(node['raw'].strip())
+    if title and lines:
+        sections[title] = lines
+    return sections
+
+
+def slides(document):
+    """Slides introduced by **Slide N: Title** markers, with the bullets and image placeholders that follow
+
+    A slide ends at the next marker or at a heading of level 1 or 2, so the
+    sections after the last slide (guidelines, handouts) are not appended to it.
+    """
+    deck, current = [], None
+    for node in document['nodes']:
+        if node['type'] == 'slide':
+            current = {'number': node['number'], 'title': node['title'], 'bullets': [], 'images': []}
+            deck.append(current)
+        elif node['type'] == 'heading' and node['level'] <= 2:
+            current = None
+        elif current and node['type'] == 'bullet':
+            current['bullets'].append(node['text'])
+        elif current and node['type'] == 'image':
+            current['images'].append(node['alt'])
+    return deck
+
+
+def section_bullets(document):
+    """Headings that have bullets, in document order, with those bullets (nested ones included)"""
+    sections = []
+    for node in document['nodes']:
+        if node['type'] == 'heading':
+            sections.append({'title': node['title'], 'level': node['level'], 'bullets': []})
+        elif sections and node['type'] == 'bullet':
+            sections[-1]['bullets'].append(node['text'])
+    return [section for section in sections if section['bullets']]
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Opt-in CPU and memory profiling for the dashboards, chart generator and deck builders
+Set STH_PROFILE=1 (or a directory), or pass --profile to the scripts, to run
+their entry points under cProfile and tracemalloc. Time and allocations are
+split by stage (load, aggregate, render, save) and written as a pstats file
+plus flamegraph-compatible collapsed stacks (flamegraph.pl, speedscope)
+"""
+
+import argparse
+import contextlib
+import cProfile
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from pathlib import Path
+
+ENV_VAR = 'STH_PROFILE'
+DEFAULT_DIR = Path('profiles')
+TRACE_FRAMES = 12  # Frames kept per allocation (deeper stacks are cut at the root and marked …)
+MAX_STACK_DEPTH = 60  # CPU stacks are cut here; deeper time is charged to the last frame kept
+
+# Stacks smaller than these are folded into their caller, which keeps the
+# collapsed files to a few thousand lines
+MIN_STACK_US = 1000
+MIN_STACK_BYTES = 4096
+
+# Diffing the traced heap costs a fraction of a second on a matplotlib-sized
+# heap, so a stage switch only diffs once this much memory has been retained
+# since the last diff; smaller growth is charged to the next stage that diffs
+MIN_DIFF_BYTES = 256 * 1024
+
+HIDDEN_FILES = {contextlib.__file__}  # Frames left out of memory stacks (the stage() wrappers)
+
+_local = threading.local()
+_tracing_lock = threading.Lock()
+_tracing_sessions = 0
+_browser_sessions = {}  # (entry point, Streamlit session id) -> ProfileSession of per_session profiles
+
+
+def enabled():
+    return os.environ.get(ENV_VAR, '').lower() not in ('', '0', 'false', 'no')
+
+
+def output_dir():
+    value = os.environ.get(ENV_VAR, '')
+    return DEFAULT_DIR if value.lower() in ('1', 'true', 'yes') else Path(value)
+
+
+def enable_profiling(directory=DEFAULT_DIR):
+    """Turn profiling on for this process and the worker processes it starts"""
+    os.environ[ENV_VAR] = str(directory)
+
+
+def add_profile_argument(parser):
+    """Add the --profile [DIR] switch to a script's argument parser"""
+    parser.add_argument('--profile', nargs='?', const=str(DEFAULT_DIR), metavar='DIR',
+                        help=f"Profile with cProfile and tracemalloc, writing to DIR (default: {DEFAULT_DIR}/); "
+                             f"same as {ENV_VAR}=DIR")
+
+
+def _raw_traces():
+    """Counter of (domain, size, traceback, total frames) over the traced blocks, innermost frame first
+
+    Uses tracemalloc's raw trace list where this CPython has it: building a
+    Snapshot and grouping it with compare_to takes seconds per call on a
+    large heap. Elsewhere the same tuples are read from a public Snapshot.
+    """
+    if hasattr(tracemalloc, '_get_traces'):
+        return Counter(tracemalloc._get_traces())
+    return Counter((trace.domain, trace.size,
+                    tuple((frame.filename, frame.lineno) for frame in reversed(trace.traceback)),
+                    trace.traceback.total_nframe)
+                   for trace in tracemalloc.take_snapshot().traces)
+
+
+def _frame_label(func):
+    filename, lineno, name = func
+    if filename == '~':  # Built-ins, e.g. <method 'write' of '_io.BufferedWriter' objects>
+        return name.replace(';', ',')
+    return f"{name} ({Path(filename).name}:{lineno})".replace(';', ',')
+
+
+def _collapse_cpu(stats, root, lines):
+    """Expand a pstats call graph into collapsed stacks (µs), splitting each callee by its callers' share
+
+    cProfile keeps caller/callee pairs rather than whole stacks, so a
+    function's time below a given caller is apportioned by that caller's
+    share of its cumulative time. Recursion, MAX_STACK_DEPTH and callees
+    under MIN_STACK_US end a stack; their time stays with the last frame.
+    """
+    children = defaultdict(dict)
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, caller_stats in callers.items():
+            children[caller][func] = caller_stats[3]
+
+    def walk(func, stack, seconds):
+        _, _, own, cumulative, _ = stats[func]
+        frame = _frame_label(func)
+        path = stack + (frame,)
+        if cumulative <= 0 or frame in stack or len(path) >= MAX_STACK_DEPTH:
+            lines[';'.join(path)] += seconds * 1e6
+            return
+        scale = min(1.0, seconds / cumulative)
+        rest = own * scale
+        # Callee times of indirectly recursive functions (e.g. matplotlib's
+        # draw wrappers) overlap, so they are scaled to fit under the caller
+        callee_total = sum(children[func].values())
+        if callee_total > cumulative - own:
+            scale *= max(cumulative - own, 0) / callee_total
+        for child, child_seconds in children[func].items():
+            if child_seconds * scale * 1e6 >= MIN_STACK_US:
+                walk(child, path, child_seconds * scale)
+            else:
+                rest += child_seconds * scale
+        lines[';'.join(path)] += rest * 1e6
+
+    # Roots are calls made while the stage's profiler had no caller on its
+    # stack: a stage is resumed part-way down the call stack several times
+    for func, (_, _, _, cumulative, callers) in stats.items():
+        top_level = cumulative - sum(caller_stats[3] for caller_stats in callers.values())
+        if top_level * 1e6 >= MIN_STACK_US or (not callers and cumulative > 0):
+            walk(func, (root,), max(top_level, 0))
+
+
+def _fold_small_stacks(lines, minimum):
+    """Move stacks under minimum into their parent stack, deepest first"""
+    for depth in range(max((stack.count(';') for stack in lines), default=0), 0, -1):
+        for stack in [stack for stack in lines if stack.count(';') == depth]:
+            if lines[stack] < minimum:
+                lines[stack.rsplit(';', 1)[0]] += lines.pop(stack)
+
+
+class ProfileSession:
+    """cProfile and tracemalloc state of one profiled entry point, accounted per stage
+
+    Stages nest; time is charged to the innermost one, which has its own
+    cProfile profiler. Memory is the growth of the traced heap between stage
+    switches, by allocating traceback (tracemalloc is process-wide, so
+    allocations of other threads are included).
+    """
+
+    def __init__(self, name, directory):
+        self.name = name
+        self.directory = Path(directory)
+        self.stem = self.directory / f"{name}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        self.labels = []
+        self.profiles = {}
+        self.wall = defaultdict(float)
+        self.peak = defaultdict(int)
+        self.allocations = defaultdict(int)
+        self._running = None
+        self._traces = None  # Traced blocks and their total size at the last heap diff
+        self._traced = 0
+
+    def push(self, label):
+        if self.labels and self.labels[-1] == label:  # Already charged to this stage
+            self.labels.append(label)
+            return
+        self._suspend()
+        self.labels.append(label)
+        self._resume()
+
+    def pop(self):
+        label = self.labels.pop()
+        if self.labels and self.labels[-1] == label:
+            return
+        self._suspend()
+        if self.labels:
+            self._resume()
+        else:
+            self._traces = None
+
+    def _resume(self):
+        self._running = label = self.labels[-1]
+        if self._traces is None:
+            self._traces, self._traced = _raw_traces(), tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        self._started = time.perf_counter()
+        self.profiles.setdefault(label, cProfile.Profile()).enable()
+
+    def _suspend(self):
+        label = self._running
+        if label is None:
+            return
+        self.profiles[label].disable()
+        self.wall[label] += time.perf_counter() - self._started
+        current, peak = tracemalloc.get_traced_memory()
+        self.peak[label] = max(self.peak[label], peak)
+        self._running = None
+        if current - self._traced < MIN_DIFF_BYTES:
+            return
+
+        # Tracebacks are only formatted in write(), after tracing has stopped:
+        # allocating Python code is many times slower while tracemalloc runs
+        traces = _raw_traces()
+        for trace, count in traces.items():
+            count -= self._traces.get(trace, 0)
+            if count > 0:
+                _, size, traceback, total_frames = trace
+                self.allocations[label, traceback, total_frames > len(traceback)] += size * count
+        self._traces, self._traced = traces, current
+
+    def _memory_stacks(self):
+        lines, frame_labels = defaultdict(int), {}
+        for (label, traceback, truncated), size in self.allocations.items():
+            if any(filename == __file__ for filename, _ in traceback):  # The profiler's own blocks
+                continue
+            frames = [f"[{label}]"] + (['…'] if truncated else [])
+            for frame in reversed(traceback):
+                if frame[0] not in HIDDEN_FILES:
+                    if frame not in frame_labels:
+                        frame_labels[frame] = f"{os.path.basename(frame[0])}:{frame[1]}"
+                    frames.append(frame_labels[frame])
+            lines[';'.join(frames)] += size
+        return lines
+
+    def write(self):
+        """Write (or rewrite) <name>-<start time>-<pid>.prof, .cpu.collapsed and .mem.collapsed; returns the stem"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stem = self.stem
+        stats = {label: pstats.Stats(profile) for label, profile in self.profiles.items()}
+
+        cpu = defaultdict(float)
+        for label, label_stats in stats.items():
+            _collapse_cpu(label_stats.stats, f"[{label}]", cpu)
+        _fold_small_stacks(cpu, MIN_STACK_US)
+        memory = self._memory_stacks()
+        _fold_small_stacks(memory, MIN_STACK_BYTES)
+        for suffix, lines in (('cpu', cpu), ('mem', memory)):
+            with open(f"{stem}.{suffix}.collapsed", 'w', encoding='utf-8') as f:
+                for stack, value in lines.items():
+                    if round(value) > 0:
+                        f.write(f"{stack} {round(value)}\n")
+
+        if stats:
+            pstats.Stats().add(*stats.values()).dump_stats(f"{stem}.prof")
+        return stem
+
+
+def _start_tracing():
+    global _tracing_sessions
+    with _tracing_lock:
+        if _tracing_sessions == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+        _tracing_sessions += 1
+
+
+def _stop_tracing():
+    global _tracing_sessions
+    with _tracing_lock:
+        _tracing_sessions -= 1
+        if _tracing_sessions == 0:
+            tracemalloc.stop()
+
+
+def _streamlit_session_id():
+    """Id of the Streamlit browser session running this thread, or None outside a Streamlit script run"""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return None
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.session_id if ctx is not None else None
+
+
+@contextlib.contextmanager
+def profiled(name, default_stage='main', per_session=False):
+    """Profile the enclosed block (or decorated function) when profiling is enabled
+
+    Inside an already profiled block of the same thread, this only opens
+    default_stage, so nested entry points add to the outer profile.
+
+    With per_session (the dashboards), every rerun of one Streamlit browser
+    session adds to a single profile whose files are rewritten after each
+    rerun, instead of writing a new set of files per interaction.
+    """
+    session = getattr(_local, 'session', None)
+    if not enabled() or session is not None:
+        with stage(default_stage):
+            yield
+        return
+
+    key = (name, _streamlit_session_id()) if per_session else None
+    first_run = key is None or key[1] is None or key not in _browser_sessions
+    if first_run:
+        session = ProfileSession(name, output_dir())
+        if key is not None and key[1] is not None:
+            _browser_sessions[key] = session
+    else:
+        session = _browser_sessions[key]
+
+    _start_tracing()
+    _local.session = session
+    session.push(default_stage)
+    try:
+        yield
+    finally:
+        session.pop()
+        _local.session = None
+        _stop_tracing()
+        stem = session.write()
+        if first_run:
+            print(f"🔬 Profile of {name} written to {stem}.{{prof,cpu.collapsed,mem.collapsed}}")
+        if key is None:
+            for label, wall in sorted(session.wall.items(), key=lambda item: -item[1]):
+                print(f"   {label:<10}{wall:8.2f}s  peak {session.peak[label] / 2**20:7.1f} MB")
+
+
+@contextlib.contextmanager
+def stage(label):
+    """Charge the enclosed block (or decorated function) to a stage of the running profile"""
+    session = getattr(_local, 'session', None)
+    if session is None:
+        yield
+        return
+    session.push(label)
+    try:
+        yield
+    finally:
+        session.pop()
+
+
+def main():
+    """Print the slowest functions of a .prof file written by a profiled run"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('profile', type=Path)
+    parser.add_argument('-n', '--limit', type=int, default=25, help="Functions to show (default: 25)")
+    parser.add_argument('--sort', default='cumulative', help="pstats sort key (default: cumulative)")
+    args = parser.parse_args()
+    pstats.Stats(str(args.profile)).sort_stats(args.sort).print_stats(args.limit)
+
+
+if __name__ == "__main__":
+    main()
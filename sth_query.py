@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Optional DuckDB query backend for the dashboard filters
+Runs the state/parasite filter-and-aggregate queries as SQL over a DuckDB
+copy of the district table instead of scanning the pandas frame per widget change
+"""
+
+import os
+
+try:
+    import duckdb
+except ImportError:  # DuckDB is optional; the dashboards fall back to the aggregate cube
+    duckdb = None
+
+# Columns that may be interpolated into SQL (identifiers cannot be bound as parameters)
+QUERYABLE_COLUMNS = {'Prevalence_Ascaris', 'Prevalence_Trichuris', 'Prevalence_Hookworm',
+                     'Prevalence_Children', 'Sanitation_Index', 'Treatment_Coverage'}
+FILTER_COLUMNS = {'states': 'State', 'risk_categories': 'Risk_Category', 'years': 'Year'}
+
+
+def backend_requested():
+    """True when STH_QUERY_BACKEND=duckdb and DuckDB is importable"""
+    return os.environ.get('STH_QUERY_BACKEND', '').lower() == 'duckdb' and duckdb is not None
+
+
+class DuckDBBackend:
+    """Parameterised SQL over a `districts` view, mirroring PrevalenceCube's query methods"""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self._sql = {}
+
+    @classmethod
+    def from_parquet(cls, parquet_path, database=':memory:'):
+        """Query Parquet file(s) in place; parquet_path may be a glob such as 'surveys/*.parquet'"""
+        connection = duckdb.connect(database)
+        connection.execute(
+            "CREATE OR REPLACE VIEW districts AS SELECT * FROM read_parquet('{}')".format(
+                str(parquet_path).replace("'", "''")))
+        return cls(connection)
+
+    @classmethod
+    def from_frame(cls, districts, database=':memory:'):
+        """Load an in-memory district table into a DuckDB table"""
+        connection = duckdb.connect(database)
+        connection.register('districts_frame', districts)
+        # Categorical columns arrive as ENUMs; VARCHAR keeps the IN filters cheap
+        casts = [f'CAST("{c}" AS VARCHAR) AS "{c}"'
+                 for c in districts.columns if districts[c].dtype == 'category']
+        replace = f" REPLACE ({', '.join(casts)})" if casts else ''
+        connection.execute(
+            f"CREATE OR REPLACE TABLE districts AS SELECT *{replace} FROM districts_frame")
+        connection.unregister('districts_frame')
+        return cls(connection)
+
+    def _query(self, key, build_sql, params):
+        """Run a query whose SQL text is built once per key, on a per-thread cursor"""
+        if key not in self._sql:
+            self._sql[key] = build_sql()
+        # Streamlit sessions run on separate threads; cursors are thread-local connections
+        return self.connection.cursor().execute(self._sql[key], params).df()
+
+    def states(self):
+        rows = self._query('states', lambda: "SELECT DISTINCT State FROM districts ORDER BY State", [])
+        return rows['State'].astype(str).tolist()
+
+    def state_means(self, parasites, weighted=False, **filters):
+        """Mean prevalence per state for the selected parasites, filtered in SQL"""
+        parasites = list(parasites)
+        unknown = set(parasites) - QUERYABLE_COLUMNS
+        if unknown:
+            raise ValueError(f"Unsupported columns: {sorted(unknown)}")
+        active = sorted(name for name, values in filters.items() if values is not None)
+
+        def build_sql():
+            if weighted:
+                # Districts without a prevalence value are left out of the population weights too
+                measures = [f'SUM("{p}" * Total_Population) / '
+                            f'SUM(CASE WHEN "{p}" IS NOT NULL THEN Total_Population END) AS "{p}"'
+                            for p in parasites]
+            else:
+                measures = [f'AVG("{p}") AS "{p}"' for p in parasites]
+            where = [f'{FILTER_COLUMNS[name]} IN (SELECT UNNEST(?))' for name in active]
+            return (f"SELECT State, {', '.join(measures) or 'COUNT(*) AS n'} FROM districts"
+                    f"{' WHERE ' + ' AND '.join(where) if where else ''}"
+                    " GROUP BY State ORDER BY State")
+
+        key = ('state_means', tuple(parasites), weighted, tuple(active))
+        params = [[str(v) if name != 'years' else int(v) for v in filters[name]] for name in active]
+        result = self._query(key, build_sql, params)
+        result['State'] = result['State'].astype(str)
+        return result.set_index('State')[parasites]
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Per-slide cache for incremental PPTX builds
+Stores each generated slide's shape tree keyed on the function that fills it,
+its inputs (markdown text, titles, bullets) and the bytes of any image it
+embeds, so unchanged slides are spliced back in instead of rebuilt
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import threading
+from pathlib import Path
+
+import pptx
+from lxml import etree
+from PIL import Image
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
+
+# Shares the repository's cache directory with sth_data's Parquet cache
+CACHE_DIR = Path(__file__).parent / ".sth_cache" / "slides"
+IMAGE_CACHE_DIR = Path(__file__).parent / ".sth_cache" / "slide_images"
+
+# Pixels per inch of picture frame for embedded images (projectors rarely show more)
+DEFAULT_IMAGE_DPI = 150
+
+# Relationship attributes (r:embed, r:link, r:id) that point at a slide's image parts
+_REL_ATTRIBUTES = {qn('r:embed'), qn('r:link'), qn('r:id')}
+
+
+def _file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def prepare_image(source, width, height, dpi=DEFAULT_IMAGE_DPI, cache_dir=IMAGE_CACHE_DIR):
+    """Resample an image to a picture frame's pixel size and recompress it, cached by source hash
+
+    width and height are the frame's pptx lengths. The image is resized
+    (never enlarged) to width x height at dpi and saved as a 256-colour
+    palette PNG, the same encoding as the chart generator's slides profile.
+    Returns the path of the prepared copy, which keeps the source file name.
+    """
+    source = Path(source)
+    size = (round(width.inches * dpi), round(height.inches * dpi))
+    entry = f"{_file_digest(source)[:16]}-{size[0]}x{size[1]}"
+    prepared = Path(cache_dir) / entry / source.name
+    if prepared.exists():
+        return prepared
+
+    prepared.parent.mkdir(parents=True, exist_ok=True)
+    with Image.open(source) as image:
+        image.load()
+    if image.mode == 'RGBA' and image.getchannel('A').getextrema() == (255, 255):
+        image = image.convert('RGB')  # Matplotlib charts are opaque; three channels resample faster
+    if image.width * image.height > size[0] * size[1]:
+        image = image.resize(size, Image.Resampling.LANCZOS)
+    tmp_path = prepared.with_name(f'{prepared.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    palette = image.quantize(colors=256, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE)
+    palette.save(tmp_path, format='PNG', optimize=True)
+    os.replace(tmp_path, prepared)
+
+    # Drop copies prepared from earlier versions of the same file at this size
+    for stale in Path(cache_dir).glob(f"*-{size[0]}x{size[1]}/{source.name}"):
+        if stale != prepared:
+            stale.unlink()
+            if not any(stale.parent.iterdir()):
+                stale.parent.rmdir()
+    return prepared
+
+
+class SlideCache:
+    """Cache of slide shape trees for one deck, stored as one JSON file per slide
+
+    A slide is cached only if its relationships are its layout and images
+    passed in as Path arguments; anything else is always rebuilt.
+    """
+
+    def __init__(self, deck_name, cache_dir=CACHE_DIR, helpers=()):
+        """helpers are functions every fill depends on (theme setup, footers); editing one invalidates the deck"""
+        self.cache_dir = Path(cache_dir) / deck_name
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.salt = [pptx.__version__, *(inspect.getsource(helper) for helper in helpers)]
+        self.used = set()
+        self.hits = 0
+        self.misses = 0
+        self._sources = {}
+
+    def _source(self, fill):
+        func = getattr(fill, '__func__', fill)
+        if func not in self._sources:
+            self._sources[func] = inspect.getsource(func)
+        return self._sources[func]
+
+    def _key(self, layout, fill, args):
+        # Images are keyed on their content as well as their name (which ends up in the picture's descr)
+        inputs = [[arg.name, _file_digest(arg)] if isinstance(arg, Path) else arg for arg in args]
+        payload = json.dumps([self.salt, layout.name, self._source(fill), inputs],
+                             default=str, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def add_slide(self, presentation, layout, fill, *args):
+        """Append a slide built by fill(slide, *args), reusing the cached shape tree when inputs match"""
+        key = self._key(layout, fill, args)
+        self.used.add(key)
+        slide = presentation.slides.add_slide(layout)
+
+        entry_path = self.cache_dir / f'{key}.json'
+        if entry_path.exists():
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            self._splice(slide, entry, args)
+            self.hits += 1
+            return slide
+
+        fill(slide, *args)
+        self.misses += 1
+        entry = self._entry(slide, args)
+        if entry is not None:
+            tmp_path = entry_path.with_name(f'{entry_path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, entry_path)
+        return slide
+
+    def _entry(self, slide, args):
+        """Serialise the slide's shape tree and map its image rIds to the Path arguments"""
+        digests = {}
+        for index, arg in enumerate(args):
+            if isinstance(arg, Path):
+                with open(arg, 'rb') as f:
+                    digests[hashlib.sha1(f.read()).hexdigest()] = index
+
+        images = {}
+        for rId, rel in slide.part.rels.items():
+            if rel.reltype == RT.SLIDE_LAYOUT:
+                continue
+            if rel.reltype != RT.IMAGE or rel.target_part.sha1 not in digests:
+                return None
+            images[rId] = digests[rel.target_part.sha1]
+
+        return {'images': images,
+                'cSld': etree.tostring(slide._element.cSld, encoding='unicode')}
+
+    def _splice(self, slide, entry, args):
+        """Replace the new slide's placeholder tree with the cached one and re-relate its images"""
+        cSld = parse_xml(entry['cSld'])
+        rIds = {old: slide.part.get_or_add_image_part(str(args[index]))[1]
+                for old, index in entry['images'].items()}
+        if rIds:
+            for element in cSld.iter():
+                for attribute in _REL_ATTRIBUTES.intersection(element.attrib):
+                    if element.get(attribute) in rIds:
+                        element.set(attribute, rIds[element.get(attribute)])
+        slide._element.replace(slide._element.cSld, cSld)
+
+    def prune(self):
+        """Delete cached slides that were not part of this build; returns the number removed"""
+        removed = 0
+        for entry_path in self.cache_dir.glob('*.json'):
+            if entry_path.stem not in self.used:
+                entry_path.unlink()
+                removed += 1
+        return removed
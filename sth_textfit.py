@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Text-fit measurement for slide bullet lists
+Measures bullet text against a placeholder's text area with per-font glyph
+width tables (built with Pillow, one lookup per character and word) and
+splits bullet lists that overflow into pages for continuation slides
+"""
+
+import functools
+import importlib.util
+from pathlib import Path
+
+from PIL import ImageFont
+from pptx.util import Emu
+
+# Glyph tables are measured at this pixel size and stored in em
+REFERENCE_SIZE = 1000
+
+# TrueType files tried for a typeface; Pillow also searches the system font
+# directories for bare file names
+FONT_FILES = {
+    'Calibri': ['calibri.ttf', 'Calibri.ttf', 'Carlito-Regular.ttf'],
+    'Arial': ['arial.ttf', 'Arial.ttf', 'LiberationSans-Regular.ttf'],
+}
+# DejaVu Sans ships with matplotlib, so it is always available; its widths are
+# scaled to the typeface's average text width (Calibri runs about 20% narrower)
+FALLBACK_FONT_FILES = ['DejaVuSans.ttf']
+FALLBACK_SCALE = {'Calibri': 0.8, 'Arial': 0.92}
+AVERAGE_CHAR_EM = 0.55  # Last resort when no TrueType font can be opened
+
+# Default template body text: single spacing, 20% space before each
+# paragraph, the level-1 hanging bullet indent and the bodyPr insets
+LINE_SPACING = 1.2
+SPACE_BEFORE = 0.2
+BULLET_INDENT = Emu(342900)
+INSETS = (Emu(91440), Emu(45720))  # (left/right, top/bottom)
+MASTER_BODY_SIZE = 32  # Level-1 size in points of the master body style (used by empty paragraphs)
+
+
+def _bundled_font(file_name):
+    """Path of a font shipped with matplotlib, found without importing matplotlib"""
+    spec = importlib.util.find_spec('matplotlib')
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    path = Path(spec.submodule_search_locations[0]) / 'mpl-data' / 'fonts' / 'ttf' / file_name
+    return path if path.exists() else None
+
+
+class GlyphWidths:
+    """Advance widths of one font in em, measured once per character and memoised per word"""
+
+    def __init__(self, font, scale=1.0):
+        self.font = font
+        self.scale = scale
+        self._chars = {}
+        self._words = {}
+
+    def char_em(self, char):
+        width = self._chars.get(char)
+        if width is None:
+            width = self.font.getlength(char) * self.scale / REFERENCE_SIZE if self.font else AVERAGE_CHAR_EM
+            self._chars[char] = width
+        return width
+
+    def word_em(self, word):
+        width = self._words.get(word)
+        if width is None:
+            width = self._words[word] = sum(self.char_em(char) for char in word)
+        return width
+
+
+@functools.lru_cache(maxsize=None)
+def glyph_widths(typeface='Calibri'):
+    """The cached glyph width table for a typeface (falls back to scaled DejaVu Sans, then an average width)"""
+    candidates = [(name, 1.0) for name in FONT_FILES.get(typeface, [f'{typeface}.ttf'])]
+    candidates += [(name, FALLBACK_SCALE.get(typeface, 1.0)) for name in FALLBACK_FONT_FILES]
+    for file_name, scale in candidates:
+        for font_file in (file_name, _bundled_font(file_name)):
+            if font_file is None:
+                continue
+            try:
+                return GlyphWidths(ImageFont.truetype(str(font_file), REFERENCE_SIZE), scale)
+            except OSError:
+                continue
+    return GlyphWidths(None)
+
+
+def text_area(placeholder, bullet_indent=BULLET_INDENT):
+    """(width, height) in points available to level-1 bullet text in a placeholder"""
+    width = placeholder.width - 2 * INSETS[0] - bullet_indent
+    height = placeholder.height - 2 * INSETS[1]
+    return Emu(width).pt, Emu(height).pt
+
+
+def count_lines(text, size_pt, width_pt, widths):
+    """Lines a paragraph wraps to at size_pt in a box width_pt wide (greedy word wrap)"""
+    line_em = width_pt / size_pt
+    space_em = widths.char_em(' ')
+    lines, used = 1, 0.0
+    for word in text.split():
+        word_em = widths.word_em(word)
+        needed = word_em if used == 0 else used + space_em + word_em
+        if needed <= line_em:
+            used = needed
+            continue
+        if used > 0:
+            lines += 1
+        # Words wider than the box are broken across lines
+        while word_em > line_em:
+            lines += 1
+            word_em -= line_em
+        used = word_em
+    return lines
+
+
+def paragraph_height(text, size_pt, width_pt, widths):
+    """Height in points of one paragraph including its space before"""
+    return (count_lines(text, size_pt, width_pt, widths) * LINE_SPACING + SPACE_BEFORE) * size_pt
+
+
+def paginate(paragraphs, area, size_pt, typeface='Calibri', leading_pt=0, prefix=''):
+    """Split paragraphs into pages that each fit a text area of (width, height) points
+
+    leading_pt is height already taken on every page (e.g. the empty first
+    paragraph of a placeholder) and prefix is text the slide adds in front of
+    each paragraph. A paragraph taller than a whole page gets a page of its
+    own. Always returns at least one (possibly empty) page.
+    """
+    width_pt, height_pt = area
+    widths = glyph_widths(typeface)
+    pages, page, used = [], [], leading_pt
+    for text in paragraphs:
+        height = paragraph_height(prefix + text, size_pt, width_pt, widths)
+        if page and used + height > height_pt:
+            pages.append(page)
+            page, used = [], leading_pt
+        page.append(text)
+        used += height
+    pages.append(page)
+    return pages
+
+
+def fit_bullets(area, bullets, size, prefix="• ", typeface='Calibri'):
+    """Pages of bullets that fit a body placeholder's text_area() when its first paragraph is left empty
+
+    size is the bullets' pptx font size; prefix is prepended to each bullet
+    when the slide is filled, as the presenters write their own bullet mark.
+    """
+    leading_pt = (LINE_SPACING + SPACE_BEFORE) * MASTER_BODY_SIZE
+    return paginate(bullets, area, size.pt, typeface, leading_pt, prefix)
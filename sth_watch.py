@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+File watching for incremental asset rebuilds
+Reports batches of changed source files once edits go quiet, using OS file
+events (inotify on Linux, through watchdog) or stat polling when watchdog is
+not installed
+"""
+
+import queue
+import time
+from pathlib import Path
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # watchdog is optional; fall back to polling file stats
+    FileSystemEventHandler = object
+    Observer = None
+
+# Seconds without further events before a batch of edits is reported (editors
+# often save through a temporary file and a rename, i.e. several events)
+DEBOUNCE_S = 0.2
+POLL_INTERVAL_S = 0.1
+
+# Event types that can change a file's content (reads raise opened/closed events too)
+CHANGE_EVENTS = {'created', 'modified', 'moved', 'deleted'}
+
+
+class _EventHandler(FileSystemEventHandler):
+    """Queues the watched paths touched by file system events"""
+
+    def __init__(self, paths, events):
+        self.paths = paths
+        self.events = events
+
+    def on_any_event(self, event):
+        if event.is_directory or event.event_type not in CHANGE_EVENTS:
+            return
+        for raw in (event.src_path, getattr(event, 'dest_path', '')):
+            if raw and Path(raw).resolve() in self.paths:
+                self.events.put(Path(raw).resolve())
+
+
+def _stat_snapshot(paths):
+    snapshot = {}
+    for path in paths:
+        try:
+            stat = path.stat()
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            snapshot[path] = None
+    return snapshot
+
+
+def watch_changes(paths, debounce=DEBOUNCE_S, poll_interval=POLL_INTERVAL_S, polling=False):
+    """Yield sets of resolved paths that changed, each once edits have been quiet for debounce seconds
+
+    Uses watchdog's native observer unless polling is set or watchdog is
+    missing, in which case the files' mtime and size are polled.
+    """
+    paths = {Path(path).resolve() for path in paths}
+    events = queue.Queue()
+    observer = None
+    if Observer is not None and not polling:
+        observer = Observer()
+        handler = _EventHandler(paths, events)
+        for directory in {path.parent for path in paths}:
+            if directory.is_dir():
+                observer.schedule(handler, str(directory), recursive=False)
+        observer.start()
+    snapshot = _stat_snapshot(paths) if observer is None else None
+
+    changed, last_event = set(), 0.0
+    try:
+        while True:
+            try:
+                changed.add(events.get(timeout=poll_interval))
+                last_event = time.monotonic()
+                continue
+            except queue.Empty:
+                pass
+            if observer is None:
+                current = _stat_snapshot(paths)
+                modified = {path for path in paths if current[path] != snapshot[path]}
+                snapshot = current
+                if modified:
+                    changed |= modified
+                    last_event = time.monotonic()
+                    continue
+            if changed and time.monotonic() - last_event >= debounce:
+                yield changed
+                changed = set()
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sth_cube import PrevalenceCube
+from sth_data import compact_district_frame, generate_synthetic_districts
+
+PARASITES = ['Prevalence_Ascaris', 'Prevalence_Trichuris', 'Prevalence_Hookworm']
+
+
+@pytest.fixture
+def districts():
+    df = generate_synthetic_districts(n_states=6, districts_per_state=5, n_years=3, seed=7)
+    rng = np.random.default_rng(0)
+    for column in PARASITES + ['Total_Population']:
+        df.loc[rng.random(len(df)) < 0.2, column] = np.nan
+    return compact_district_frame(df)
+
+
+def weighted_means(df):
+    def weigh(group):
+        return pd.Series({p: (group[p] * group['Total_Population']).sum()
+                          / group.loc[group[p].notna() & group['Total_Population'].notna(), 'Total_Population'].sum()
+                          for p in PARASITES})
+    return df.groupby('State', observed=True)[PARASITES + ['Total_Population']].apply(weigh)
+
+
+def test_state_means_match_pandas_with_missing_values(districts):
+    cube = PrevalenceCube.from_frame(districts)
+    expected = districts.groupby('State', observed=True)[PARASITES].mean()
+    expected.index = expected.index.astype(str)
+    pd.testing.assert_frame_equal(cube.state_means(PARASITES), expected.astype('float64'),
+                                  check_names=False, rtol=1e-5)
+
+
+def test_weighted_means_skip_missing_prevalence(districts):
+    cube = PrevalenceCube.from_frame(districts)
+    expected = weighted_means(districts.astype({p: 'float64' for p in PARASITES + ['Total_Population']}))
+    expected.index = expected.index.astype(str)
+    pd.testing.assert_frame_equal(cube.state_means(PARASITES, weighted=True), expected,
+                                  check_names=False, rtol=1e-5)
+
+
+def test_national_and_filtered_means(districts):
+    cube = PrevalenceCube.from_frame(districts)
+    latest = districts[districts['Year'] == districts['Year'].max()]
+    expected = latest[PARASITES].astype('float64').mean()
+    pd.testing.assert_series_equal(cube.national_means(PARASITES, years=[int(latest['Year'].iloc[0])]),
+                                   expected, check_names=False, rtol=1e-5)
+
+
+def test_append_matches_rebuild(districts):
+    first, second = districts.iloc[:len(districts) // 2], districts.iloc[len(districts) // 2:]
+    appended = PrevalenceCube.from_frame(first).append(second)
+    rebuilt = PrevalenceCube.from_frame(pd.concat([first, second]))
+
+    for weighted in (False, True):
+        pd.testing.assert_frame_equal(appended.state_means(PARASITES, weighted=weighted),
+                                      rebuilt.state_means(PARASITES, weighted=weighted), rtol=1e-9)
+    pd.testing.assert_frame_equal(appended.state_totals(), rebuilt.state_totals(), rtol=1e-9)
+    pd.testing.assert_series_equal(appended.risk_counts(), rebuilt.risk_counts())
@@ -0,0 +1,7 @@
+from sth_data import INDIAN_STATES, generate_synthetic_districts
+
+
+def test_district_names_are_unique_across_states():
+    df = generate_synthetic_districts(n_states=len(INDIAN_STATES) + 12, districts_per_state=3)
+    assert df['District'].is_unique
+    assert df.loc[df['State'] == 'Uttar Pradesh', 'District'].iloc[0] == 'Uttar_Pradesh_01'
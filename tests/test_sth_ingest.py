@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sth_data import compact_district_frame, generate_synthetic_districts
+from sth_ingest import _aggregate_chunk, apply_survey_prevalence, summarise_counts
+
+
+def summarise(rows):
+    totals = _aggregate_chunk(pd.DataFrame(rows), children_ages=(1, 14))
+    totals.index.names = ['State', 'District', 'Year'][:totals.index.nlevels]
+    return summarise_counts(totals)
+
+
+def test_blank_egg_counts_are_not_examined():
+    summary = summarise({
+        'State': ['Bihar'] * 4,
+        'District': ['Patna'] * 4,
+        'Ascaris_EPG': [120, 40, 0, None],
+        'Trichuris_EPG': [0, '', 'n/a', 0],
+    })
+    row = summary.iloc[0]
+    assert row['Prevalence_Ascaris'] == pytest.approx(200 / 3)
+    assert row['Prevalence_Trichuris'] == 0
+    assert row['Examined'] == 4
+    assert row['Prevalence_Any'] == 50
+
+
+def test_rows_without_any_readable_count_are_left_out():
+    summary = summarise({
+        'State': ['Bihar'] * 3,
+        'District': ['Patna'] * 3,
+        'Ascaris_EPG': [120, 0, 'x'],
+    })
+    assert summary.iloc[0]['Examined'] == 2
+    assert summary.iloc[0]['Prevalence_Any'] == 50
+
+
+@pytest.fixture
+def districts():
+    return compact_district_frame(generate_synthetic_districts(
+        n_states=3, districts_per_state=2, n_years=3, seed=1))
+
+
+def test_survey_updates_latest_year_of_multi_year_table(districts):
+    state, district = districts.iloc[0][['State', 'District']]
+    summary = summarise({'State': [state] * 2, 'District': [district] * 2, 'Ascaris_EPG': [100, 0]})
+
+    updated = apply_survey_prevalence(districts, summary)
+    assert len(updated) == len(districts)
+    rows = updated[(updated['State'] == state) & (updated['District'] == district)].set_index('Year')
+    before = districts[(districts['State'] == state) & (districts['District'] == district)].set_index('Year')
+    latest = districts['Year'].max()
+    assert rows.loc[latest, 'Prevalence_Ascaris'] == pytest.approx(50)
+    for year in before.index.drop(latest):
+        assert rows.loc[year, 'Prevalence_Ascaris'] == pytest.approx(before.loc[year, 'Prevalence_Ascaris'])
+
+
+def test_survey_year_column_selects_the_round(districts):
+    state, district = districts.iloc[0][['State', 'District']]
+    first = int(districts['Year'].min())
+    summary = summarise({'State': [state, state, 'New State'], 'District': [district, district, 'New District'],
+                         'Year': [first, first, first], 'Ascaris_EPG': [100, 0, 0]})
+
+    updated = apply_survey_prevalence(districts, summary)
+    assert len(updated) == len(districts) + 1
+    row = updated[(updated['District'] == district) & (updated['Year'] == first)]
+    assert row['Prevalence_Ascaris'].iloc[0] == pytest.approx(50)
+    assert pd.isna(updated.loc[updated['District'] == 'New District', 'Total_Population'].iloc[0])
+
+
+def test_districts_without_readable_counts_are_dropped(districts):
+    state, district = districts.iloc[0][['State', 'District']]
+    summary = summarise({'State': [state, state, 'Bihar'], 'District': [district, district, 'Empty'],
+                         'Ascaris_EPG': [100, 0, None], 'Trichuris_EPG': [0, 0, 'n/a']})
+    assert list(summary['District']) == [district]
+
+    updated = apply_survey_prevalence(districts, summary)
+    assert len(updated) == len(districts)
+    assert 'Empty' not in set(updated['District'])
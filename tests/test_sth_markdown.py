@@ -0,0 +1,24 @@
+from sth_markdown import parse_markdown, slides
+
+DOCUMENT = """# Deck
+
+## Module 1
+
+**Slide 1: First**
+- One
+- Two
+
+### Slide Set 1.2
+
+**Slide 2: Last**
+- Three
+
+## Presentation Guidelines
+
+- Instructor note
+"""
+
+
+def test_slide_ends_at_level_two_heading():
+    deck = slides({'nodes': list(parse_markdown(DOCUMENT.split('\n')))})
+    assert [slide['bullets'] for slide in deck] == [['One', 'Two'], ['Three']]